@@ -0,0 +1,245 @@
+"""Local stand-in for the FFB site, for offline load tests and benchmarks.
+
+Serves the endpoints the CLI calls (player search data, UDK projections,
+posts, start/sit and the trade analyzer page). Responses come from a
+directory recorded with FFB_RECORD when --fixtures is given and has a
+match, and from benchmarks/synthetic.py otherwise; --scale multiplies
+the player counts of either. Every response carries an ETag, so the
+CLI's 304 revalidation path is exercised too.
+
+    python benchmarks/fixture_server.py --scale 10 &
+    HOME=$(mktemp -d) python benchmarks/fixture_server.py --write-session "$HOME"
+    FFB_BASE_URL=http://127.0.0.1:8765 ffb rankings QB --json
+
+    FFB_RECORD=fixtures/ ffb rankings --json     # record from the live site once
+    python benchmarks/fixture_server.py --fixtures fixtures/ --scale 100
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import synthetic  # noqa: E402
+from ffb.api import endpoints  # noqa: E402
+from ffb.api.replay import load_fixture  # noqa: E402
+
+API = "/wp-json"
+TRADE_DATA = re.compile(r"(window\.tool\.tradeAnalyzer\.data\s*=\s*)(\{.*?\})(\s*;\s*</script>)", re.S)
+
+
+def _copies(rows: list[dict], scale: int, rename) -> list[dict]:
+    """`rows` followed by scale - 1 renamed copies."""
+    out = list(rows)
+    for k in range(1, scale):
+        out += [rename(dict(row), k) for row in rows]
+    return out
+
+
+def _rename_player(row: dict, k: int) -> dict:
+    row["name"] = f"{row.get('name', '')} {k}"
+    if isinstance(row.get("player_id"), int):
+        row["player_id"] += k * 1_000_000
+    elif row.get("player_id") is not None:
+        row["player_id"] = f"{row['player_id']}-{k}"
+    return row
+
+
+def scale_search(payload: dict | list, scale: int) -> dict | list:
+    if isinstance(payload, dict):
+        return {**payload, "data": _copies(payload.get("data", []), scale, _rename_player)}
+    return _copies(payload, scale, _rename_player)
+
+
+def scale_projections(payload: dict, scale: int) -> dict:
+    raw = payload.get("json", payload)
+    inner = json.loads(raw) if isinstance(raw, str) else raw
+    inner = {**inner, "projections": _copies(inner.get("projections", []), scale, _rename_player)}
+    return {"json": json.dumps(inner)} if "json" in payload else inner
+
+
+def scale_trade_page(html: str, scale: int) -> str:
+    def grow(match):
+        data = json.loads(match.group(2))
+        for key in ("projections", "dynastyProjections"):
+            data[key] = _copies(data.get(key) or [], scale, _rename_player)
+        return match.group(1) + json.dumps(data) + match.group(3)
+
+    return TRADE_DATA.sub(grow, html, count=1)
+
+
+def synthetic_posts(archive: list[dict], params: dict) -> tuple[int, dict, list | dict]:
+    """One page of `archive` filtered like WP_POSTS: (status, extra headers, body)."""
+    arg = {k: v[0] for k, v in params.items()}
+    search = arg.get("search", "").lower()
+    posts = [
+        p for p in archive
+        if (not search or search in p["title"]["rendered"].lower())
+        and ("after" not in arg or p["date"] > arg["after"])
+        and ("before" not in arg or p["date"] < arg["before"])
+        and ("modified_after" not in arg or p["modified"] > arg["modified_after"])
+    ]
+    per_page = min(int(arg.get("per_page", 10)), 100)
+    page = int(arg.get("page", 1))
+    pages = -(-len(posts) // per_page)
+    headers = {"X-WP-Total": str(len(posts)), "X-WP-TotalPages": str(pages)}
+    if page > max(pages, 1):
+        return 400, headers, {"code": "rest_post_invalid_page_number"}
+    return 200, headers, posts[(page - 1) * per_page:page * per_page]
+
+
+def synthetic_startsit(body: dict) -> dict:
+    names = body.get("uri", "").strip("/").split("/")[-1].split("-vs-")
+    players = [
+        {"name": n.replace("-", " ").title(), "position": "WR", "team": "KC",
+         "matchup": "vs DEN", "verdict": "Start" if i == 0 else "Sit"}
+        for i, n in enumerate(names)
+    ]
+    return {"players": players, "analysis": "Synthetic start/sit result."}
+
+
+class Site:
+    """Response bodies by route, built once per distinct request."""
+
+    def __init__(self, scale: int, fixtures: str | None):
+        self.scale = scale
+        self.fixtures = fixtures
+        self._bodies: dict[tuple, tuple[int, dict, bytes]] = {}
+        self._posts: list[dict] | None = None
+        self._lock = threading.Lock()
+
+    def respond(self, method: str, url: str, body: bytes) -> tuple[int, dict, bytes]:
+        key = (method, url, body)
+        with self._lock:
+            if key not in self._bodies:
+                self._bodies[key] = self._build(method, url, body)
+            return self._bodies[key]
+
+    def _recorded(self, method: str, url: str, body: bytes) -> dict | None:
+        if not self.fixtures:
+            return None
+        return load_fixture(self.fixtures, method, url, body or None)
+
+    def _build(self, method: str, url: str, body: bytes) -> tuple[int, dict, bytes]:
+        parts = urlsplit(url)
+        path, params = parts.path, parse_qs(parts.query)
+        fixture = self._recorded(method, url, body)
+        json_type = {"Content-Type": "application/json; charset=UTF-8"}
+
+        if path == API + endpoints.PLAYER_SEARCH:
+            payload = json.loads(fixture["body"]) if fixture else {"error": "", "data": synthetic.search_players(1)}
+            return 200, json_type, json.dumps(scale_search(payload, self.scale)).encode()
+        if path == API + endpoints.UDK_PROJECTIONS:
+            if fixture:
+                payload = scale_projections(json.loads(fixture["body"]), self.scale)
+            else:
+                payload = {"json": json.dumps(synthetic.projections(self.scale))}
+            return 200, json_type, json.dumps(payload).encode()
+        if path == endpoints.TRADE_ANALYZER_PAGE:
+            html = scale_trade_page(fixture["body"], self.scale) if fixture else synthetic.trade_page(self.scale)
+            return 200, {"Content-Type": "text/html; charset=UTF-8"}, html.encode()
+        if fixture:
+            return fixture["status"], {**json_type, **fixture["headers"]}, fixture["body"].encode()
+        if path == API + endpoints.WP_POSTS:
+            if self._posts is None:
+                self._posts = synthetic.posts(self.scale)
+            status, headers, payload = synthetic_posts(self._posts, params)
+            return status, {**json_type, **headers}, json.dumps(payload).encode()
+        if path == API + endpoints.START_SIT and method == "POST":
+            return 200, json_type, json.dumps(synthetic_startsit(json.loads(body or b"{}"))).encode()
+        return 404, json_type, b'{"code": "rest_no_route"}'
+
+
+def make_handler(site: Site, latency: float):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _serve(self, method: str):
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else b""
+            if latency:
+                time.sleep(latency)
+            status, headers, payload = site.respond(method, self.path, body)
+            etag = headers.get("ETag") or '"' + hashlib.sha1(payload).hexdigest()[:16] + '"'
+            if status == 200 and self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(status)
+            for name, value in {**headers, "ETag": etag}.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            self._serve("GET")
+
+        def do_POST(self):
+            self._serve("POST")
+
+    return Handler
+
+
+def write_session(home: str) -> Path:
+    """Placeholder session so login-only commands run against the stand-in."""
+    path = Path(home) / ".config" / "ffb" / "session.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        "cookies": [{"name": "wordpress_logged_in_fixture", "value": "fixture", "domain": "127.0.0.1"}],
+        "nonce": "fixture",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }))
+    path.chmod(0o600)
+    return path
+
+
+def serve(host: str = "127.0.0.1", port: int = 0, scale: int = 1, fixtures: str | None = None,
+          latency_ms: float = 0) -> ThreadingHTTPServer:
+    """Start the server on a background thread; port 0 picks a free one."""
+    server = ThreadingHTTPServer((host, port), make_handler(Site(scale, fixtures), latency_ms / 1000))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--scale", type=int, default=1, help="player count multiplier (1, 10, 100)")
+    parser.add_argument("--fixtures", help="directory recorded with FFB_RECORD")
+    parser.add_argument("--latency-ms", type=float, default=0, help="delay added to every response")
+    parser.add_argument("--write-session", metavar="HOME", help="write a placeholder session under HOME and exit")
+    args = parser.parse_args()
+
+    if args.write_session:
+        print(write_session(args.write_session))
+        return 0
+
+    server = serve(args.host, args.port, args.scale, args.fixtures, args.latency_ms)
+    host, port = server.server_address[:2]
+    print(f"Serving on http://{host}:{port} (scale {args.scale}x); export FFB_BASE_URL=http://{host}:{port}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""Benchmark the columnar projections engine against the per-player loop.
+
+Times raw analyst projections -> ranked, tiered player dicts (no network)
+for 1x/10x/100x synthetic datasets, and checks both produce identical output.
+
+    python benchmarks/projections.py
+    python benchmarks/projections.py --scales 1,10 --repeat 5
+"""
+
+import argparse
+import sys
+import timeit
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import synthetic  # noqa: E402
+from ffb.commands.rankings import _assign_tiers, _fetch_projections_multi  # noqa: E402
+from ffb.commands import rankings  # noqa: E402
+from ffb.engine.projections import POINTS_CONFIG, STAT_FIELDS, _num  # noqa: E402
+
+
+def _calc_points(proj: dict, scoring_key: str) -> float:
+    cfg = POINTS_CONFIG.get(scoring_key, POINTS_CONFIG["HALF"])
+    return (
+        _num(proj.get("passing_yards")) * cfg["pass_yd"]
+        + _num(proj.get("passing_touchdowns")) * cfg["pass_td"]
+        + _num(proj.get("interceptions_thrown")) * cfg["int"]
+        + _num(proj.get("rushing_yards")) * cfg["rush_yd"]
+        + _num(proj.get("rushing_touchdowns")) * cfg["rush_td"]
+        + _num(proj.get("receptions")) * cfg["rec"]
+        + _num(proj.get("receiving_yards")) * cfg["rec_yd"]
+        + _num(proj.get("receiving_touchdowns")) * cfg["rec_td"]
+        + _num(proj.get("fumbles_lost")) * cfg["fum"]
+    )
+
+
+def loop_projections(raw: dict, scoring_key: str) -> list[dict]:
+    """The per-player implementation the engine replaced, kept as a baseline."""
+    by_player: dict[str, list[dict]] = defaultdict(list)
+    player_meta: dict[str, dict] = {}
+    for p in raw["projections"]:
+        pid = p.get("player_id", "")
+        by_player[pid].append(p)
+        if pid not in player_meta:
+            player_meta[pid] = {
+                "player_name": p.get("name", ""),
+                "position": p.get("fantasy_position", ""),
+                "team": p.get("team", ""),
+                "bye_week": p.get("bye_week", ""),
+            }
+
+    players = []
+    for pid, entries in by_player.items():
+        meta = player_meta[pid]
+        avg = {}
+        for field in STAT_FIELDS:
+            vals = [_num(e.get(field)) for e in entries]
+            avg[field] = sum(vals) / len(vals) if vals else 0.0
+        points = _calc_points(avg, scoring_key)
+        players.append({
+            "player_id": pid,
+            "player_name": meta["player_name"],
+            "position": meta["position"],
+            "team": meta["team"],
+            "bye_week": meta["bye_week"],
+            "points": round(points, 1),
+            "pass_yds": round(avg["passing_yards"], 1),
+            "pass_tds": round(avg["passing_touchdowns"], 1),
+            "ints": round(avg["interceptions_thrown"], 1),
+            "rush_yds": round(avg["rushing_yards"], 1),
+            "rush_tds": round(avg["rushing_touchdowns"], 1),
+            "receptions": round(avg["receptions"], 1),
+            "rec_yds": round(avg["receiving_yards"], 1),
+            "rec_tds": round(avg["receiving_touchdowns"], 1),
+        })
+
+    players.sort(key=lambda p: -p["points"])
+    for i, p in enumerate(players, 1):
+        p["rank"] = i
+    _assign_tiers(players, raw["tiers"], scoring_key)
+    return players
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", default="1,10,100")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'scale':>5} {'lines':>8} {'loop ms':>10} {'engine ms':>10} {'speedup':>8}")
+    for scale in (int(s) for s in args.scales.split(",")):
+        raw = synthetic.projections(scale)
+        rankings._fetch_raw_projections = lambda force=False: raw
+
+        engine = _fetch_projections_multi(["half"])["half"]
+        if engine != loop_projections(raw, "HALF"):
+            print(f"FAIL: engine output differs from the loop at scale {scale}", file=sys.stderr)
+            return 1
+
+        loop_s = min(timeit.repeat(lambda: loop_projections(raw, "HALF"), number=1, repeat=args.repeat))
+        engine_s = min(timeit.repeat(lambda: _fetch_projections_multi(["half"]), number=1, repeat=args.repeat))
+        print(
+            f"{scale:>5} {len(raw['projections']):>8} {loop_s * 1000:>10.1f}"
+            f" {engine_s * 1000:>10.1f} {loop_s / engine_s:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
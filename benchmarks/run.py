@@ -0,0 +1,374 @@
+"""Microbenchmark suite for the data-processing hot paths, with history.
+
+Times each case on 1x/10x/100x synthetic datasets (no network; the cache
+lives in a throwaway HOME) and saves the results to
+benchmarks/results/<commit>.json. Each run is compared with the newest
+saved result of an earlier commit, and the script exits non-zero when a
+case got slower than --threshold, so it can gate CI.
+
+Results of clean commits are checked in alongside the code, so history
+and comparisons carry across clones; runs with uncommitted changes save
+<commit>-dirty.json, which git ignores. Timings are only comparable on
+the same kind of machine, so a comparison says when they differ.
+
+    python benchmarks/run.py                       # all cases, compare with the last commit benchmarked
+    python benchmarks/run.py --scales 1,10 -k rankings,trade
+    python benchmarks/run.py --compare a1b2c3d     # against a specific commit
+    python benchmarks/run.py --history             # every saved result, oldest first
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+
+# ffb.config reads HOME at import; keep the suite's cache out of the real one
+os.environ["HOME"] = tempfile.mkdtemp(prefix="ffb-bench-")
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+import synthetic  # noqa: E402
+from rich.console import Console  # noqa: E402
+from ffb.cache import store  # noqa: E402
+from ffb.commands import rankings, trade  # noqa: E402
+from ffb.display import tables  # noqa: E402
+from ffb.engine.draft import Draft  # noqa: E402
+from ffb.engine.lineup import best_lineups, parse_slots  # noqa: E402
+from ffb.engine.projections import ProjectionFrame  # noqa: E402
+from ffb.engine.search import IncrementalSearch, NameIndex, PlayerIndex  # noqa: E402
+from ffb.tui.board import Board  # noqa: E402
+
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+
+SEARCH_QUERIES = [
+    ("mahomes", None, None), ("jefferson", "WR", None), ("smith", None, "KC"),
+    ("st brown", None, None), ("ja marr chase", None, None), ("kelse", "TE", None),
+]
+FIND_TYPED = ["patrick mahomes", "ja'marr chase", "amon-ra st. brown", "travis kelce"]
+TRADE_QUERIES = ["Kelce", "ja'marr chase", "St. Brown", "jefferson", "Hurts", "Nobody Atall"]
+
+
+def players_search(scale: int):
+    """Index load plus one query, as each `players search` invocation does."""
+    blob = PlayerIndex.build(synthetic.search_players(scale)).to_bytes()
+    return lambda: [PlayerIndex.from_bytes(blob).search(q, p, t, 10) for q, p, t in SEARCH_QUERIES]
+
+
+def players_find(scale: int):
+    """Names typed a keystroke at a time into `players find`, then erased."""
+    index = PlayerIndex.build(synthetic.search_players(scale))
+
+    def run():
+        search = IncrementalSearch(index)
+        for name in FIND_TYPED:
+            for n in [*range(1, len(name) + 1), *range(len(name) - 1, -1, -1)]:
+                search.update(name[:n], 16)
+
+    return run
+
+
+def projections_frame(scale: int):
+    """Analyst lines -> columnar frame (the aggregation input)."""
+    raw = synthetic.projections(scale)
+    return lambda: ProjectionFrame.from_raw(raw["projections"], raw["tiers"])
+
+
+def projections_rank(scale: int):
+    """Consensus, points for every format, ranks and tiers from a loaded frame."""
+    raw = synthetic.projections(scale)
+    frame = ProjectionFrame.from_raw(raw["projections"], raw["tiers"])
+    rankings._load_frame = lambda: frame
+    return lambda: rankings._fetch_projections_multi(["half", "ppr", "std"])
+
+
+def rankings_tiers(scale: int):
+    """Tier assignment over ranked players (the loop _build_players ends with)."""
+    raw = synthetic.projections(scale)
+    frame = ProjectionFrame.from_raw(raw["projections"], raw["tiers"])
+    rankings._load_frame = lambda: frame
+    players = rankings._fetch_projections_multi(["half"])["half"]
+    return lambda: rankings._assign_tiers(players, raw["tiers"], "HALF")
+
+
+def rankings_board(scale: int):
+    """`rankings --tui` setup (every sort order) and one 40-row viewport per sort and filter."""
+    raw = synthetic.projections(scale)
+    frame = ProjectionFrame.from_raw(raw["projections"], raw["tiers"])
+    rankings._load_frame = lambda: frame
+    players = rankings._fetch_projections_multi(["half"])["half"]
+
+    def run():
+        board = Board(players)
+        for _, key, _, _, descending in board.columns:
+            for position in (None, "WR"):
+                view = board.view(key, descending, position, None)
+                [board.cells(i) for i in view[:40].tolist()]
+        return board
+
+    return run
+
+
+def draft_picks(scale: int):
+    """A 12-team, 16-round `ffb draft`: the board before every pick, an undo every 10th."""
+    raw = synthetic.projections(scale)
+    frame = ProjectionFrame.from_raw(raw["projections"], raw["tiers"])
+    rankings._load_frame = lambda: frame
+    players = rankings._fetch_projections_multi(["half"])["half"]
+
+    def run():
+        draft = Draft(players, 12, 16)
+        while not draft.done:
+            for pos in draft.positions:
+                draft.best(pos, 3)
+                draft.current_tier(pos)
+            draft.pick(draft.best()[0])
+            if len(draft.picks) % 10 == 0:
+                draft.undo()
+                draft.pick(draft.best()[0])
+        return draft
+
+    return run
+
+
+def lineup_solve(scale: int):
+    """Best lineups (with a superflex) for 12 rosters of 16 per 1x, in one call."""
+    raw = synthetic.projections(scale)
+    frame = ProjectionFrame.from_raw(raw["projections"], raw["tiers"])
+    rankings._load_frame = lambda: frame
+    players = rankings._fetch_projections_multi(["half"])["half"]
+    rosters = [players[k::12 * scale][:16] for k in range(12 * scale)]
+    slots = parse_slots("QB=1,RB=2,WR=2,TE=1,FLEX=1,SUPERFLEX=1,K=1,DST=1")
+    return lambda: best_lineups(rosters, slots)
+
+
+def trade_parse(scale: int):
+    """Value lists extracted from the trade analyzer page HTML."""
+    html = synthetic.trade_page(scale)
+    return lambda: trade._parse_trade_page(html)
+
+
+def trade_find_player(scale: int):
+    """Name resolution against the value list, index built per invocation."""
+    values = trade._parse_trade_page(synthetic.trade_page(scale))["projections"]
+
+    def run():
+        names = NameIndex([v["player_name"] for v in values])
+        return [trade._find_player(q, values, names) for q in TRADE_QUERIES]
+
+    return run
+
+
+def cache_roundtrip(scale: int):
+    """set_cached + get_cached of the player search dataset."""
+    players = synthetic.search_players(scale)
+
+    def run():
+        store.set_cached("bench_players", players)
+        return store.get_cached("bench_players", 3600)
+
+    return run
+
+
+def display_rankings(scale: int):
+    """Rankings table, 10 rows per 1x (colour terminal, output discarded)."""
+    raw = synthetic.projections(scale)
+    frame = ProjectionFrame.from_raw(raw["projections"], raw["tiers"])
+    rankings._load_frame = lambda: frame
+    players = rankings._fetch_projections_multi(["half"])["half"][:10 * scale]
+    return lambda: tables.rankings_table(players, "half")
+
+
+def display_search(scale: int):
+    """Search results table, 10 rows per 1x."""
+    results = [
+        {"name": p["name"], "position": p["pos"], "team": p["team"], "score": 90}
+        for p in synthetic.search_players(scale)[:10 * scale]
+    ]
+    return lambda: tables.player_search_table(results)
+
+
+CASES = {
+    "players.search": players_search,
+    "players.find": players_find,
+    "projections.frame": projections_frame,
+    "projections.rank": projections_rank,
+    "rankings.tiers": rankings_tiers,
+    "rankings.board": rankings_board,
+    "draft.picks": draft_picks,
+    "lineup.solve": lineup_solve,
+    "trade.parse": trade_parse,
+    "trade.find_player": trade_find_player,
+    "cache.roundtrip": cache_roundtrip,
+    "display.rankings": display_rankings,
+    "display.search": display_search,
+}
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=ROOT, capture_output=True, text=True, check=False
+    ).stdout.strip()
+
+
+def _commit() -> str:
+    """Short hash of HEAD, with -dirty when tracked files have changed."""
+    sha = _git("rev-parse", "--short", "HEAD") or "unknown"
+    return f"{sha}-dirty" if _git("status", "--porcelain", "--untracked-files=no") else sha
+
+
+def _saved() -> dict[str, dict]:
+    results = {}
+    for path in RESULTS_DIR.glob("*.json"):
+        with open(path) as f:
+            results[path.stem] = json.load(f)
+    return results
+
+
+def _ancestors() -> list[str]:
+    """Short hashes from HEAD back, newest first."""
+    return _git("rev-list", "--abbrev-commit", "--max-count=500", "HEAD").split()
+
+
+def _baseline(saved: dict[str, dict], current: str) -> dict | None:
+    """Newest saved result of a clean commit before this run (HEAD itself
+    counts when this run has uncommitted changes)."""
+    for sha in _ancestors():
+        if sha != current and sha in saved:
+            return saved[sha]
+    return None
+
+
+def run_cases(names: list[str], scales: list[int], repeat: int) -> dict[str, dict]:
+    results = {}
+    for name in names:
+        for scale in scales:
+            fn = CASES[name](scale)
+            fn()  # warm-up (imports, caches, first-call allocation)
+            times = timeit.repeat(fn, number=1, repeat=repeat)
+            results[f"{name}@{scale}x"] = {
+                "min_ms": round(min(times) * 1000, 3),
+                "median_ms": round(statistics.median(times) * 1000, 3),
+                "repeat": repeat,
+            }
+            print(f"{name:<20} {scale:>4}x {min(times) * 1000:>10.2f} ms", file=sys.stderr)
+    return results
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """Print current vs baseline minimums; return the cases that regressed."""
+    where = [(r.get("machine"), r.get("python")) for r in (baseline, current)]
+    if where[0] != where[1]:
+        print(
+            f"\nNote: {baseline['commit']} was timed on {where[0][0]} (Python {where[0][1]}),"
+            f" this run on {where[1][0]} (Python {where[1][1]}).",
+            file=sys.stderr,
+        )
+    print(f"\n{'case':<26} {baseline['commit']:>12} {current['commit']:>12} {'change':>8}")
+    regressed = []
+    for case, result in current["results"].items():
+        before = baseline["results"].get(case)
+        if before is None:
+            print(f"{case:<26} {'-':>12} {result['min_ms']:>12.2f}")
+            continue
+        change = result["min_ms"] / before["min_ms"] - 1 if before["min_ms"] else 0.0
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressed.append(case)
+        print(f"{case:<26} {before['min_ms']:>12.2f} {result['min_ms']:>12.2f} {change:>+7.0%}{flag}")
+    return regressed
+
+
+def history(saved: dict[str, dict]) -> None:
+    """Minimum ms of every case across saved results, oldest commit first."""
+    order = {sha: i for i, sha in enumerate(reversed(_ancestors()))}
+
+    def position(name: str) -> tuple:
+        sha = name.removesuffix("-dirty")
+        return (order.get(sha, len(order)), name.endswith("-dirty"), saved[name]["date"])
+
+    runs = sorted(saved, key=position)
+    cases = sorted({case for name in runs for case in saved[name]["results"]})
+    print(f"{'case':<26}" + "".join(f" {name:>14}" for name in runs))
+    for case in cases:
+        cells = [saved[name]["results"].get(case, {}).get("min_ms") for name in runs]
+        print(f"{case:<26}" + "".join(f" {c:>14.2f}" if c is not None else f" {'-':>14}" for c in cells))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", default="1,10,100")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("-k", "--cases", help=f"comma-separated prefixes of: {', '.join(CASES)}")
+    parser.add_argument("--compare", metavar="COMMIT", help="saved result to compare with (default: newest earlier one)")
+    parser.add_argument("--threshold", type=float, default=0.25, help="slowdown that counts as a regression (0.25 = 25%%)")
+    parser.add_argument("--no-save", action="store_true", help="don't write benchmarks/results/<commit>.json")
+    parser.add_argument("--history", action="store_true", help="print saved results across commits and exit")
+    args = parser.parse_args()
+
+    saved = _saved()
+    if args.history:
+        if not saved:
+            print(f"No saved results in {RESULTS_DIR}", file=sys.stderr)
+            return 1
+        history(saved)
+        return 0
+
+    names = list(CASES)
+    if args.cases:
+        prefixes = [p.strip() for p in args.cases.split(",")]
+        names = [n for n in CASES if any(n.startswith(p) for p in prefixes)]
+        if not names:
+            print(f"No cases match {args.cases!r}", file=sys.stderr)
+            return 1
+
+    # Tables render as to a colour terminal, without the cost of displaying it
+    tables.console = Console(file=open(os.devnull, "w"), width=120, force_terminal=True)
+
+    commit = _commit()
+    current = {
+        "commit": commit,
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": run_cases(names, [int(s) for s in args.scales.split(",")], args.repeat),
+    }
+
+    if not args.no_save:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        previous = saved.get(commit, {}).get("results", {})
+        # Keep cases and scales this run skipped
+        to_save = {**current, "results": {**previous, **current["results"]}}
+        with open(RESULTS_DIR / f"{commit}.json", "w") as f:
+            json.dump(to_save, f, indent=2)
+
+    if args.compare:
+        matches = [name for name in saved if name.startswith(args.compare)]
+        if not matches:
+            print(f"No saved result for {args.compare}", file=sys.stderr)
+            return 1
+        baseline = saved[sorted(matches)[0]]
+    else:
+        baseline = _baseline(saved, commit)
+
+    if baseline is None:
+        print("\nNo earlier result to compare with.")
+        return 0
+    regressed = compare(current, baseline, args.threshold)
+    if regressed:
+        print(f"\n{len(regressed)} case(s) slower than {args.threshold:.0%}: {', '.join(regressed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""Benchmark the player search index against the linear fuzzy scan.
+
+Times `players search` queries (no network) on 1x/10x/100x synthetic
+datasets: the scan JSON-decodes the cached list and scores every player,
+the index loads its serialized blob and scores only trigram candidates.
+Reports how many top-10 result lists differ from the scan's.
+
+    python benchmarks/search.py
+    python benchmarks/search.py --scales 1,10 --repeat 5
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+from thefuzz import fuzz
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import synthetic  # noqa: E402
+from ffb.engine.search import PlayerIndex  # noqa: E402
+
+QUERIES = [
+    ("mahomes", None, None), ("jefferson", "WR", None), ("smith", None, "KC"),
+    ("st brown", None, None), ("ja marr chase", None, None), ("kelse", "TE", None),
+]
+
+
+def scan_search(query: str, players: list[dict], position: str | None, team: str | None, limit: int) -> list[dict]:
+    """The linear scan the index replaced, kept as a baseline."""
+    results = []
+    for p in players:
+        name = p.get("name", "")
+        if not name:
+            continue
+
+        pos = p.get("pos", "") or p.get("position", "")
+        tm = p.get("team", "")
+
+        if position and pos.upper() != position.upper():
+            continue
+        if team and tm.upper() != team.upper():
+            continue
+
+        score = max(
+            fuzz.token_sort_ratio(query.lower(), name.lower()),
+            fuzz.partial_ratio(query.lower(), name.lower()),
+        )
+        if score >= 55:
+            results.append({
+                "id": p.get("player_id"),
+                "name": name,
+                "position": pos,
+                "team": tm,
+                "status": p.get("status"),
+                "score": score,
+            })
+
+    results.sort(key=lambda x: x["score"], reverse=True)
+    return results[:limit]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", default="1,10,100")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'scale':>5} {'players':>8} {'scan ms':>10} {'index ms':>10} {'speedup':>8} {'differ':>7}")
+    for scale in (int(s) for s in args.scales.split(",")):
+        players = synthetic.search_players(scale)
+        cached = json.dumps(players).encode()
+        blob = PlayerIndex.build(players).to_bytes()
+
+        def scan():
+            data = json.loads(cached)
+            return [scan_search(q, data, p, t, 10) for q, p, t in QUERIES]
+
+        def index():
+            # One load per query, as each CLI invocation does
+            return [PlayerIndex.from_bytes(blob).search(q, p, t, 10) for q, p, t in QUERIES]
+
+        differ = sum(a != b for a, b in zip(index(), scan()))
+        scan_s = min(timeit.repeat(scan, number=1, repeat=args.repeat)) / len(QUERIES)
+        index_s = min(timeit.repeat(index, number=1, repeat=args.repeat)) / len(QUERIES)
+        print(
+            f"{scale:>5} {len(players):>8} {scan_s * 1000:>10.1f} {index_s * 1000:>10.2f}"
+            f" {scan_s / index_s:>7.0f}x {differ:>4}/{len(QUERIES)}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
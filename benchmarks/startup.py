@@ -0,0 +1,92 @@
+"""Cold-start benchmark for `ffb news --json` on a warm cache.
+
+Seeds a throwaway HOME with a freshly synced news store, then runs the CLI in a
+subprocess several times and reports the median wall time together with the
+slowest imports reported by `python -X importtime`. Exits non-zero when the
+median exceeds the budget, so it can gate CI.
+
+    python benchmarks/startup.py                 # default 300ms budget
+    python benchmarks/startup.py --budget-ms 200 --runs 20
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+COMMAND = ["-m", "ffb.main", "news", "--json"]
+
+
+def _env(home: str) -> dict:
+    env = dict(os.environ)
+    env["HOME"] = home
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC), env.get("PYTHONPATH")]))
+    return env
+
+
+def _seed_cache(env: dict) -> None:
+    seed = (
+        "from ffb.cache.store import put_articles, set_cached\n"
+        "put_articles([{'id': i, 'date': '2026-01-01T00:00:00', 'modified': '2026-01-01T00:00:00',"
+        " 'title': 'Benchmark', 'link': 'https://example.com', 'excerpt': ''} for i in range(10)])\n"
+        "set_cached('news_sync', {'complete': True}, 3600)\n"
+    )
+    subprocess.run([sys.executable, "-c", seed], env=env, check=True)
+
+
+def _slowest_imports(env: dict, top: int) -> list[tuple[int, str]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *COMMAND],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Only report top-level packages; nested imports are already included
+        if name.startswith("  "):
+            continue
+        rows.append((int(cumulative), name.strip()))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=300.0)
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to show")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        env = _env(home)
+        _seed_cache(env)
+
+        timings = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, *COMMAND], env=env, stdout=subprocess.DEVNULL, check=True)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        print(f"ffb {' '.join(COMMAND[2:])}: {args.runs} runs")
+        print(f"  median {statistics.median(timings):.1f}ms  min {min(timings):.1f}ms  max {max(timings):.1f}ms")
+        print("  slowest top-level imports (cumulative):")
+        for micros, name in _slowest_imports(env, args.top):
+            print(f"    {micros / 1000:8.1f}ms  {name}")
+
+    median = statistics.median(timings)
+    if median > args.budget_ms:
+        print(f"FAIL: median {median:.1f}ms exceeds budget {args.budget_ms:.0f}ms", file=sys.stderr)
+        return 1
+    print(f"OK: within {args.budget_ms:.0f}ms budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""Deterministic synthetic datasets shaped like the FFB API responses.
+
+`scale=1` approximates today's dataset sizes; benchmarks use 1x/10x/100x.
+"""
+
+import json
+import random
+from datetime import datetime, timedelta
+
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DST"]
+TEAMS = [
+    "ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE", "DAL", "DEN", "DET",
+    "GB", "HOU", "IND", "JAX", "KC", "LAC", "LAR", "LV", "MIA", "MIN", "NE",
+    "NO", "NYG", "NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN", "WAS",
+]
+FIRST = ["Josh", "Justin", "Patrick", "Travis", "CeeDee", "Ja'Marr", "Derrick", "Saquon",
+         "Jalen", "Lamar", "Tyreek", "Davante", "Mike", "Chris", "Amon-Ra", "Breece"]
+LAST = ["Allen", "Jefferson", "Mahomes", "Kelce", "Lamb", "Chase", "Henry", "Barkley",
+        "Hurts", "Jackson", "Hill", "Adams", "Evans", "Olave", "St. Brown", "Hall",
+        "Smith", "Johnson", "Williams", "Brown", "Jones", "Davis", "Moore", "Taylor"]
+
+PROJECTION_PLAYERS = 600
+SEARCH_PLAYERS = 3_000
+ANALYSTS = 4
+POSTS = 1_500
+
+
+def _name(r: random.Random, i: int) -> str:
+    name = f"{r.choice(FIRST)} {r.choice(LAST)}"
+    # Keep names unique without making them look synthetic for the fuzzy scorer
+    return name if i < len(FIRST) * len(LAST) else f"{name} {i}"
+
+
+def projections(scale: int = 1, seed: int = 0) -> dict:
+    """Raw UDK projections ({"projections": [...], "tiers": {...}})."""
+    r = random.Random(seed)
+    rows = []
+    for i in range(PROJECTION_PLAYERS * scale):
+        pos = POSITIONS[i % len(POSITIONS)]
+        meta = {
+            "player_id": str(10_000 + i),
+            "name": _name(r, i),
+            "fantasy_position": pos,
+            "team": r.choice(TEAMS),
+            "bye_week": str(r.randint(5, 14)),
+        }
+        for a in range(ANALYSTS):
+            if r.random() < 0.1:
+                continue
+            qb = pos == "QB"
+            rows.append({
+                **meta,
+                "analyst": f"analyst{a}",
+                "passing_yards": f"{r.uniform(3000, 5000):.1f}" if qb else None,
+                "passing_touchdowns": r.uniform(18, 40) if qb else "",
+                "interceptions_thrown": r.uniform(5, 15) if qb else 0,
+                "rushing_yards": r.uniform(0, 1600),
+                "rushing_touchdowns": r.uniform(0, 14),
+                "receptions": 0 if qb else r.uniform(0, 120),
+                "receiving_yards": 0 if qb else r.uniform(0, 1700),
+                "receiving_touchdowns": 0 if qb else r.uniform(0, 13),
+                "fumbles_lost": r.uniform(0, 3),
+            })
+    tiers = {
+        f"{pos}.{fmt}": [1.0, 0.92, 0.85, 0.75, 0.6, 0.45, 0.3]
+        for pos in POSITIONS for fmt in ("HALF", "PPR", "STD")
+    }
+    return {"projections": rows, "tiers": tiers}
+
+
+def search_players(scale: int = 1, seed: int = 0) -> list[dict]:
+    """Player search dataset, as returned under PLAYER_SEARCH's "data"."""
+    r = random.Random(seed)
+    return [
+        {
+            "player_id": 1 + i,
+            "name": _name(r, i),
+            "pos": r.choice(POSITIONS),
+            "team": r.choice(TEAMS + [""]),
+            "status": r.choice([None, "Active", "Injured Reserve", "Practice Squad", "Retired"]),
+        }
+        for i in range(SEARCH_PLAYERS * scale)
+    ]
+
+
+def trade_page(scale: int = 1, seed: int = 0) -> str:
+    """Trade analyzer page HTML with its embedded value lists."""
+    players = search_players(scale, seed)[:400 * scale]
+    values = [
+        {"name": p["name"], "fantasy_position": p["pos"], "team": p["team"], "rank": i,
+         "fantasy_points": round(300 - i * 0.75 / scale, 1)}
+        for i, p in enumerate(players, 1)
+    ]
+    data = {"projections": values, "dynastyProjections": values[::-1]}
+    return (
+        "<html><head><title>Trade Analyzer</title></head><body><div id=\"trade-analyzer\"></div>"
+        f"<script>window.tool.tradeAnalyzer.data = {json.dumps(data)};</script></body></html>"
+    )
+
+
+HEADLINES = ["Week {w} Waiver Wire Targets", "Start or Sit: {name}", "{name} Injury Update",
+             "Dynasty Stock Watch: {name}", "Week {w} Rankings Risers", "Film Room: {name}"]
+
+
+def posts(scale: int = 1, seed: int = 0) -> list[dict]:
+    """WP_POSTS archive, newest first, with the fields `ffb news` asks for."""
+    r = random.Random(seed)
+    newest = datetime(2026, 10, 17, 9, 0)
+    total = POSTS * scale
+    out = []
+    for i in range(total):
+        date = newest - timedelta(hours=3 * i)
+        # Roughly one in ten posts was edited a day after it went up
+        modified = date + timedelta(days=1) if r.random() < 0.1 else date
+        name = _name(r, i % (len(FIRST) * len(LAST)))
+        title = r.choice(HEADLINES).format(w=1 + i % 18, name=name)
+        out.append({
+            "id": total - i,
+            "date": date.isoformat(),
+            "modified": min(modified, newest).isoformat(),
+            "link": f"https://www.thefantasyfootballers.com/articles/{total - i}/",
+            "title": {"rendered": title},
+            "excerpt": {"rendered": f"<p>{name} and more in {title.lower()}.</p>\n"},
+        })
+    return out
@@ -0,0 +1,71 @@
+"""Benchmark the trade finder against naive N-for-M enumeration.
+
+Searches a 2-player offer against synthetic counterparty rosters for
+growing package sizes (no network) and checks both searches find equally
+balanced packages.
+
+    python benchmarks/trades.py
+    python benchmarks/trades.py --roster 20 --max-get 2,3,4,5,6 --repeat 5
+"""
+
+import argparse
+import random
+import sys
+import timeit
+from itertools import combinations
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from ffb.engine.trades import find_packages  # noqa: E402
+
+GIVE = [212.4, 148.9]
+TOLERANCE = 5.0
+LIMIT = 10
+
+
+def naive_packages(give: list[float], roster: list[float], max_give: int, max_get: int) -> list[tuple]:
+    """Score every give/get combination, kept as a baseline."""
+    found = []
+    for n_give in range(1, min(max_give, len(give)) + 1):
+        for g in combinations(range(len(give)), n_give):
+            give_total = sum(give[i] for i in g)
+            for n_get in range(1, max_get + 1):
+                for c in combinations(range(len(roster)), n_get):
+                    diff = sum(roster[i] for i in c) - give_total
+                    if abs(diff) <= TOLERANCE:
+                        found.append((g, c, diff))
+    found.sort(key=lambda f: (abs(f[2]), len(f[0]) + len(f[1])))
+    return found[:LIMIT]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--roster", type=int, default=20, help="Counterparty roster size")
+    parser.add_argument("--max-get", default="2,3,4,5,6")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    r = random.Random(0)
+    roster = [round(r.uniform(5, 320), 1) for _ in range(args.roster)]
+
+    print(f"{'max-get':>7} {'naive ms':>10} {'finder ms':>10} {'speedup':>8}")
+    for max_get in (int(m) for m in args.max_get.split(",")):
+        def finder():
+            return find_packages(GIVE, roster, 2, max_get, TOLERANCE, LIMIT)
+
+        def naive():
+            return naive_packages(GIVE, roster, 2, max_get)
+
+        if [round(abs(f[2]), 6) for f in finder()] != [round(abs(f[2]), 6) for f in naive()]:
+            print(f"FAIL: finder and naive search disagree at max-get {max_get}", file=sys.stderr)
+            return 1
+
+        naive_s = min(timeit.repeat(naive, number=1, repeat=args.repeat))
+        finder_s = min(timeit.repeat(finder, number=1, repeat=args.repeat))
+        print(f"{max_get:>7} {naive_s * 1000:>10.1f} {finder_s * 1000:>10.1f} {naive_s / finder_s:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,23 @@
+"""Console entry point.
+
+Forwards to a running `ffb serve` when it can, before paying for the
+Typer/Rich imports; otherwise runs the CLI in this process.
+"""
+
+import sys
+
+from .daemon import forward
+
+
+def main() -> None:
+    code = forward(sys.argv[1:])
+    if code is not None:
+        sys.exit(code)
+
+    from .main import app
+
+    app(prog_name="ffb")
+
+
+if __name__ == "__main__":
+    main()
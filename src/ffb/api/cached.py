@@ -0,0 +1,189 @@
+"""Cache-aware GETs: conditional revalidation and stale-while-revalidate."""
+
+import subprocess
+import sys
+import threading
+from typing import Callable
+
+from .. import metrics
+from ..cache.store import (
+    CacheEntry,
+    claim_refresh,
+    entry_ts,
+    get_entry,
+    mark_refresh_failed,
+    namespace,
+    refresh_failed,
+    set_cached,
+    touch,
+)
+from ..config import CACHE_MAX_STALE, CACHE_SWR_MODE
+from ..tracing import span
+
+_fetch_locks: dict[str, threading.Lock] = {}
+_fetch_locks_guard = threading.Lock()
+
+
+def fetch_lock(key: str) -> threading.Lock:
+    """The process-wide lock for filling cache entry `key`.
+
+    Held while fetching, so threads that miss the same entry at once
+    (`ffb batch` workers, `ffb serve` clients) make one download and the
+    rest read what it stored.
+    """
+    with _fetch_locks_guard:
+        return _fetch_locks.setdefault(key, threading.Lock())
+
+
+def cached_get(
+    key: str,
+    ttl: int,
+    endpoint: str,
+    *,
+    params: dict | None = None,
+    transform: Callable[[dict | list], dict | list] | None = None,
+    require_auth: bool = False,
+    stale_while_revalidate: bool = False,
+    max_stale: int = CACHE_MAX_STALE,
+    force: bool = False,
+    changed_only: bool = False,
+) -> dict | list | None:
+    """GET `endpoint` through the cache entry `key`.
+
+    A fresh entry is returned as-is. An expired one is revalidated with
+    If-None-Match/If-Modified-Since, so an unchanged resource costs a 304
+    and a timestamp bump instead of a full download. With
+    `stale_while_revalidate`, an expired entry at most `max_stale` seconds
+    past its TTL is returned immediately and revalidated in the background,
+    unless the last background refresh was refused for an expired login:
+    then it's revalidated here, so AuthExpiredError reaches the command.
+
+    `transform` maps the decoded response body to what gets cached; it only
+    runs on a 200. `force` skips the freshness check but still revalidates.
+    With `changed_only`, None stands in for a payload that wasn't just
+    downloaded (fresh, stale or 304), so a caller keeping something built
+    from it doesn't pay to decode the entry.
+
+    Within a process, one thread at a time fetches a given key; a thread
+    that waited on another's fetch returns the entry it wrote.
+    """
+    with span("cached_get", key=key) as s:
+        entry = get_entry(key)
+        if entry is not None and not force:
+            if entry.age <= ttl:
+                s.set(outcome="fresh")
+                metrics.inc("ffb_cache_hits_total", ns=namespace(key))
+                return None if changed_only else entry.payload
+            if (
+                stale_while_revalidate
+                and CACHE_SWR_MODE != "off"
+                and entry.age <= ttl + max_stale
+                and not refresh_failed(key)
+            ):
+                if claim_refresh(key):
+                    _refresh_in_background(
+                        key, ttl, endpoint, params, transform, require_auth
+                    )
+                s.set(outcome="stale")
+                metrics.inc("ffb_cache_stale_total", ns=namespace(key))
+                return None if changed_only else entry.payload
+
+        with fetch_lock(key):
+            if entry_ts(key) != (entry.ts if entry is not None else None):
+                # Another thread fetched it while this one waited
+                latest = get_entry(key)
+                if latest is not None:
+                    s.set(outcome="fresh")
+                    metrics.inc("ffb_cache_hits_total", ns=namespace(key))
+                    return None if changed_only else latest.payload
+
+            s.set(outcome="revalidated" if entry is not None else "fetched")
+            if entry is None:
+                metrics.inc("ffb_cache_misses_total", ns=namespace(key))
+            return _revalidate(key, ttl, endpoint, params, transform, require_auth, entry, changed_only)
+
+
+def _revalidate(
+    key: str,
+    ttl: int,
+    endpoint: str,
+    params: dict | None,
+    transform: Callable | None,
+    require_auth: bool,
+    entry: CacheEntry | None,
+    changed_only: bool = False,
+) -> dict | list | None:
+    from .client import get_client
+
+    headers = {}
+    if entry is not None:
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+
+    client = get_client(require_auth=require_auth)
+    resp = client.get(endpoint, params=params, headers=headers)
+    if entry is not None:
+        result = "not_modified" if resp.status_code == 304 else "modified"
+        metrics.inc("ffb_cache_revalidations_total", ns=namespace(key), result=result)
+    if resp.status_code == 304 and entry is not None:
+        touch(key)
+        return None if changed_only else entry.payload
+
+    with span("http.decode", key=key):
+        payload = resp.json()
+        if transform:
+            payload = transform(payload)
+    set_cached(
+        key, payload, ttl,
+        etag=resp.headers.get("ETag"),
+        last_modified=resp.headers.get("Last-Modified"),
+    )
+    return payload
+
+
+def _refresh_in_background(
+    key: str,
+    ttl: int,
+    endpoint: str,
+    params: dict | None,
+    transform: Callable | None,
+    require_auth: bool,
+) -> None:
+    if CACHE_SWR_MODE == "thread":
+        # Non-daemon, so a short-lived CLI process still finishes the refresh
+        # before exiting; a long-running one simply carries on.
+        threading.Thread(
+            target=_revalidate_quietly,
+            args=(key, ttl, endpoint, params, transform, require_auth),
+            name=f"ffb-refresh-{key}",
+        ).start()
+        return
+
+    # Detached process: the current command returns without waiting for it
+    subprocess.Popen(
+        [sys.executable, "-m", "ffb.main", "cache", "refresh", key],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def _revalidate_quietly(*args) -> None:
+    import typer
+
+    from .client import AuthExpiredError
+
+    key, require_auth = args[0], args[5]
+    try:
+        _revalidate(*args, get_entry(key), changed_only=True)
+    except (AuthExpiredError, typer.Exit) as e:
+        # An expired session, or (Exit from get_client) none at all: stop
+        # serving the entry stale so the next call fails loudly instead
+        if isinstance(e, AuthExpiredError) or require_auth:
+            mark_refresh_failed(key)
+    except Exception:
+        # Best effort: the stale entry stays and the next call retries
+        pass
@@ -1,9 +1,25 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 import typer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from ..config import API_BASE, BASE_URL
+from ..config import (
+    API_BASE,
+    BASE_URL,
+    HTTP_MAX_WORKERS,
+    HTTP_POOL_SIZE,
+    HTTP_RECORD_DIR,
+    HTTP_REPLAY_DIR,
+    HTTP_TIMEOUT,
+)
 from ..auth.session import load_session
 from ..models.session import SessionData
+from .. import metrics
+from ..tracing import span
 
 
 class AuthExpiredError(Exception):
@@ -15,6 +31,24 @@ class FFBClient:
 
     def __init__(self, session_data: SessionData | None = None):
         self._http = requests.Session()
+        # One pool sized for get_many(); idempotent GETs retry on gateway errors
+        pool = dict(
+            pool_connections=4,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+        )
+        if HTTP_REPLAY_DIR:
+            from .replay import ReplayAdapter
+
+            adapter = ReplayAdapter(HTTP_REPLAY_DIR)
+        elif HTTP_RECORD_DIR:
+            from .replay import RecordingAdapter
+
+            adapter = RecordingAdapter(HTTP_RECORD_DIR, **pool)
+        else:
+            adapter = HTTPAdapter(**pool)
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
         self._session_data = session_data
         if session_data:
             self._inject_auth(session_data)
@@ -36,30 +70,63 @@ class FFBClient:
             )
         resp.raise_for_status()
 
-    def get(self, endpoint: str, params: dict | None = None) -> requests.Response:
-        url = f"{API_BASE}{endpoint}"
-        resp = self._http.get(url, params=params)
+    def _request(self, method: str, endpoint: str, url: str, **kwargs) -> requests.Response:
+        """Send one request, recording its trace span and metrics."""
+        start = time.perf_counter()
+        status = "error"
+        try:
+            with span(f"http.{method.lower()}", endpoint=endpoint) as s:
+                resp = self._http.request(method, url, timeout=HTTP_TIMEOUT, **kwargs)
+                status = str(resp.status_code)
+                s.set(status=resp.status_code, bytes=len(resp.content))
+        finally:
+            metrics.inc("ffb_http_requests_total", endpoint=endpoint, method=method, status=status)
+            metrics.observe("ffb_http_request_duration_seconds", time.perf_counter() - start, endpoint=endpoint)
         self._check_response(resp)
         return resp
 
+    def get(
+        self, endpoint: str, params: dict | None = None, headers: dict | None = None
+    ) -> requests.Response:
+        return self._request("GET", endpoint, f"{API_BASE}{endpoint}", params=params, headers=headers)
+
+    def get_many(
+        self, calls: list[tuple[str, dict | None]], max_workers: int = HTTP_MAX_WORKERS
+    ) -> list[requests.Response]:
+        """GET several (endpoint, params) pairs concurrently, in order.
+
+        Requests share this client's connection pool and auth. The first
+        failure (e.g. AuthExpiredError) is raised once the others finish.
+        """
+        if len(calls) <= 1:
+            return [self.get(endpoint, params) for endpoint, params in calls]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as pool:
+            futures = [pool.submit(self.get, endpoint, params) for endpoint, params in calls]
+            return [f.result() for f in futures]
+
     def post(self, endpoint: str, json: dict | None = None) -> requests.Response:
-        url = f"{API_BASE}{endpoint}"
-        resp = self._http.post(url, json=json)
-        self._check_response(resp)
-        return resp
+        return self._request("POST", endpoint, f"{API_BASE}{endpoint}", json=json)
 
     def get_page(self, path: str) -> str:
         """Fetch raw HTML page (for trade analyzer scrape)."""
-        url = f"{BASE_URL}{path}"
-        resp = self._http.get(url)
-        self._check_response(resp)
-        return resp.text
+        return self._request("GET", path, f"{BASE_URL}{path}").text
+
+
+# (session, client) handed out by get_client(). Reused while load_session()
+# returns the same session, so every request in a process (a whole `ffb
+# batch`, or `ffb serve`) shares one connection pool.
+_shared: tuple[SessionData | None, FFBClient] | None = None
+_shared_lock = threading.Lock()
 
 
 def get_client(require_auth: bool = False) -> FFBClient:
-    """Create client, optionally requiring auth."""
+    """Return the process's client, optionally requiring auth."""
+    global _shared
     session = load_session()
     if require_auth and not session:
         typer.echo("Not logged in. Run `ffb login` first.", err=True)
         raise typer.Exit(1)
-    return FFBClient(session)
+    with _shared_lock:
+        if _shared is None or _shared[0] is not session:
+            _shared = (session, FFBClient(session))
+        return _shared[1]
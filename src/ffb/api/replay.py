@@ -0,0 +1,136 @@
+"""Record and replay FFBClient traffic.
+
+FFB_RECORD=DIR saves every response the client receives (bar 304s) as a JSON fixture
+in DIR; FFB_REPLAY=DIR answers requests from those fixtures without
+touching the network. Fixtures are keyed by method, path, query and body
+(never the host), so a recording made against the live site replays
+against any FFB_BASE_URL, and benchmarks/fixture_server.py can serve the
+same directory. The session's cookie values and nonce are scrubbed from
+recorded bodies, and only caching headers are kept.
+"""
+
+import hashlib
+import json
+import os
+import re
+from http import HTTPStatus
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# Response headers worth keeping (caching, WordPress pagination); everything
+# else, Set-Cookie included, is dropped
+KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified", "X-WP-Total", "X-WP-TotalPages")
+REDACTED = "REDACTED"
+
+
+def fixture_key(method: str, url: str, body: bytes | str | None = None) -> str:
+    """File stem for a request: readable prefix plus a hash of what identifies it."""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    if isinstance(body, str):
+        body = body.encode()
+    digest = hashlib.sha1(
+        b"\n".join([method.upper().encode(), parts.path.encode(), query.encode(), body or b""])
+    ).hexdigest()[:12]
+    slug = re.sub(r"[^a-z0-9]+", "-", parts.path.lower()).strip("-") or "root"
+    return f"{method.lower()}-{slug}-{digest}"
+
+
+def _secrets(request: requests.PreparedRequest) -> list[str]:
+    """Credential values the request carried: the nonce and each cookie value."""
+    values = [request.headers.get("X-WP-Nonce", "")]
+    for pair in request.headers.get("Cookie", "").split(";"):
+        values.append(pair.partition("=")[2].strip())
+    # Very short values would redact unrelated text
+    return sorted({v for v in values if len(v) >= 6}, key=len, reverse=True)
+
+
+def scrub(text: str, secrets: list[str]) -> str:
+    for secret in secrets:
+        text = text.replace(secret, REDACTED)
+    return text
+
+
+def save_fixture(directory: str, request: requests.PreparedRequest, resp: requests.Response) -> str:
+    os.makedirs(directory, exist_ok=True)
+    parts = urlsplit(request.url)
+    fixture = {
+        "method": request.method,
+        "path": parts.path,
+        "query": parts.query,
+        "status": resp.status_code,
+        "headers": {h: resp.headers[h] for h in KEPT_HEADERS if h in resp.headers},
+        "body": scrub(resp.text, _secrets(request)),
+    }
+    path = os.path.join(directory, fixture_key(request.method, request.url, request.body) + ".json")
+    with open(path, "w") as f:
+        json.dump(fixture, f)
+    return path
+
+
+def load_fixture(directory: str, method: str, url: str, body: bytes | str | None = None) -> dict | None:
+    try:
+        with open(os.path.join(directory, fixture_key(method, url, body) + ".json")) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+class RecordingAdapter(HTTPAdapter):
+    """HTTPAdapter that also writes each response to a fixture directory.
+
+    304s aren't written: fixture keys ignore headers, so one would replace
+    the full response recorded for the same request with an empty body.
+    ReplayAdapter derives 304s from the recorded ETag instead.
+    """
+
+    def __init__(self, directory: str, **kwargs):
+        super().__init__(**kwargs)
+        self.directory = directory
+
+    def send(self, request, **kwargs):
+        resp = super().send(request, **kwargs)
+        if resp.status_code != 304:
+            save_fixture(self.directory, request, resp)
+        return resp
+
+
+class ReplayAdapter(BaseAdapter):
+    """Transport that serves recorded fixtures and never opens a connection.
+
+    A conditional request whose If-None-Match matches the fixture's ETag
+    gets a 304, so cache revalidation replays too.
+    """
+
+    def __init__(self, directory: str):
+        super().__init__()
+        self.directory = directory
+
+    def send(self, request, **kwargs):
+        fixture = load_fixture(self.directory, request.method, request.url, request.body)
+        if fixture is None:
+            raise requests.ConnectionError(
+                f"No recorded response for {request.method} {urlsplit(request.url).path}"
+                f" in {self.directory}",
+                request=request,
+            )
+
+        resp = requests.Response()
+        resp.status_code = fixture["status"]
+        resp.headers = CaseInsensitiveDict(fixture["headers"])
+        resp._content = fixture["body"].encode()
+        etag = fixture["headers"].get("ETag")
+        if etag and request.headers.get("If-None-Match") == etag:
+            resp.status_code = 304
+            resp._content = b""
+        resp.reason = HTTPStatus(resp.status_code).phrase
+        resp.encoding = "utf-8"
+        resp.url = request.url
+        resp.request = request
+        return resp
+
+    def close(self) -> None:
+        pass
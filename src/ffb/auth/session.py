@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 
 from ..config import CONFIG_DIR, SESSION_FILE
 from ..models.session import SessionData
+from ..tracing import span
 
 
 def save_session(data: SessionData) -> None:
@@ -12,14 +13,27 @@ def save_session(data: SessionData) -> None:
     os.chmod(SESSION_FILE, 0o600)
 
 
+# (mtime, parsed session) of the last load, so a long-running `ffb serve`
+# only re-validates session.json after `ffb login` rewrites it
+_loaded: tuple[float, SessionData | None] | None = None
+
+
 def load_session() -> SessionData | None:
-    if not SESSION_FILE.exists():
-        return None
+    global _loaded
     try:
-        raw = json.loads(SESSION_FILE.read_text())
-        return SessionData.model_validate(raw)
-    except (json.JSONDecodeError, Exception):
+        mtime = SESSION_FILE.stat().st_mtime
+    except FileNotFoundError:
         return None
+    if _loaded is not None and _loaded[0] == mtime:
+        return _loaded[1]
+    with span("session.load"):
+        try:
+            raw = json.loads(SESSION_FILE.read_text())
+            session = SessionData.model_validate(raw)
+        except (json.JSONDecodeError, Exception):
+            session = None
+    _loaded = (mtime, session)
+    return session
 
 
 def clear_session() -> None:
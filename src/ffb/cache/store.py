@@ -1,37 +1,496 @@
 import json
+import re
+import sqlite3
+import threading
 import time
-from pathlib import Path
+from dataclasses import dataclass
+from functools import cached_property
 
-from ..config import CACHE_DIR
+from .. import metrics
+from ..config import CACHE_DIR, CACHE_DB, CACHE_MAX_BYTES
+from ..tracing import span
 
+# Bump when the table layout changes; older databases are dropped and rebuilt.
+_SCHEMA_VERSION = 2
+
+_local = threading.local()
+
+# Full-text index over article titles and excerpts, kept in step with the
+# articles table by triggers. Created on first connect; SQLite builds without
+# FTS5 fall back to LIKE scans in search_articles().
+_ARTICLES_FTS = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+        title, excerpt, content='articles', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    );
+    CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+        INSERT INTO articles_fts (rowid, title, excerpt) VALUES (new.id, new.title, new.excerpt);
+    END;
+    CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+        INSERT INTO articles_fts (articles_fts, rowid, title, excerpt)
+        VALUES ('delete', old.id, old.title, old.excerpt);
+    END;
+    CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE ON articles BEGIN
+        INSERT INTO articles_fts (articles_fts, rowid, title, excerpt)
+        VALUES ('delete', old.id, old.title, old.excerpt);
+        INSERT INTO articles_fts (rowid, title, excerpt) VALUES (new.id, new.title, new.excerpt);
+    END;
+"""
+_fts = True
+
+# Decoded payloads by key as (ts, payload), reused while the row's ts is
+# unchanged. Off by default: a one-shot CLI process decodes each entry once
+# anyway, and only `ffb serve` lives long enough to benefit. Callers must
+# treat memoised payloads as read-only.
+_memo: dict[str, tuple[float, dict | list]] | None = None
+
+
+def enable_memo() -> None:
+    global _memo
+    if _memo is None:
+        _memo = {}
+
+
+def _connect() -> sqlite3.Connection:
+    """Return this thread's connection to the cache database."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        return conn
 
-def _cache_path(key: str) -> Path:
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    safe_key = key.replace("/", "_").replace("?", "_").replace("&", "_")
-    return CACHE_DIR / f"{safe_key}.json"
+    conn = sqlite3.connect(CACHE_DB, timeout=10, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+        conn.execute("DROP TABLE IF EXISTS entries")
+        conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS entries (
+            key           TEXT PRIMARY KEY,
+            ns            TEXT NOT NULL,
+            ts            REAL NOT NULL,
+            ttl           INTEGER,
+            size          INTEGER NOT NULL,
+            accessed      REAL NOT NULL,
+            etag          TEXT,
+            last_modified TEXT,
+            refreshing    REAL,
+            payload       BLOB NOT NULL
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS entries_ns ON entries (ns)")
+    conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+    # Counters from ffb.metrics; survives `cache clear` and schema bumps
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS metrics (
+            name   TEXT NOT NULL,
+            labels TEXT NOT NULL,
+            value  REAL NOT NULL,
+            PRIMARY KEY (name, labels)
+        )
+    """)
+    # News articles by WordPress post id, fed by incremental sync (commands/news.py);
+    # dates are the site's local time, as WP_POSTS filters on them
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS articles (
+            id       INTEGER PRIMARY KEY,
+            date     TEXT NOT NULL,
+            modified TEXT NOT NULL,
+            title    TEXT NOT NULL,
+            link     TEXT NOT NULL,
+            excerpt  TEXT NOT NULL,
+            synced   REAL NOT NULL
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS articles_date ON articles (date)")
+    _create_fts(conn)
+    _local.conn = conn
+    return conn
+
+
+def _create_fts(conn: sqlite3.Connection) -> None:
+    global _fts
+    if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'articles_fts'").fetchone():
+        return
+    try:
+        # The rebuild indexes articles stored before the index existed
+        conn.executescript(
+            f"BEGIN IMMEDIATE; {_ARTICLES_FTS}"
+            " INSERT INTO articles_fts (articles_fts) VALUES ('rebuild'); COMMIT;"
+        )
+    except sqlite3.OperationalError:
+        # No FTS5 in this SQLite build
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        _fts = False
+
+
+@dataclass
+class CacheEntry:
+    """A cache row with its HTTP validators; the payload is decoded on first access."""
+
+    key: str
+    ts: float
+    ttl: int | None
+    etag: str | None
+    last_modified: str | None
+    blob: bytes
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.ts
+
+    @cached_property
+    def payload(self) -> dict | list:
+        with span("cache.decode", key=self.key, bytes=len(self.blob)):
+            return json.loads(self.blob)
+
+
+def namespace(key: str) -> str:
+    """Namespace of a cache key: the prefix before the first underscore.
+
+    `projections_HALF` -> `projections`, `news_10` -> `news`,
+    `player_search_data` -> `player`.
+    """
+    return key.split("_", 1)[0]
+
+
+def is_fresh(key: str, ttl: int) -> bool:
+    """Check freshness from the index alone, without reading the payload."""
+    row = _connect().execute(
+        "SELECT 1 FROM entries WHERE key = ? AND ts >= ?", (key, time.time() - ttl)
+    ).fetchone()
+    return row is not None
 
 
 def get_cached(key: str, ttl: int) -> dict | list | None:
     """Return cached data if fresh, else None."""
-    path = _cache_path(key)
-    if not path.exists():
+    with span("cache.get", key=key) as s:
+        data = _get_cached(key, ttl)
+        s.set(hit=data is not None)
+    metrics.inc("ffb_cache_hits_total" if data is not None else "ffb_cache_misses_total", ns=namespace(key))
+    return data
+
+
+def _get_cached(key: str, ttl: int) -> dict | list | None:
+    if _memo is not None:
+        entry = _get_entry(key)
+        if entry is None or entry.age > ttl:
+            return None
+        try:
+            return entry.payload
+        except json.JSONDecodeError:
+            return None
+
+    conn = _connect()
+    now = time.time()
+    row = conn.execute(
+        "SELECT payload FROM entries WHERE key = ? AND ts >= ?", (key, now - ttl)
+    ).fetchone()
+    if row is None:
         return None
+    conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+    metrics.inc("ffb_cache_read_bytes_total", len(row[0]), ns=namespace(key))
     try:
-        data = json.loads(path.read_text())
-        if time.time() - data.get("_ts", 0) > ttl:
-            return None
-        return data.get("payload")
-    except (json.JSONDecodeError, KeyError):
+        return json.loads(row[0])
+    except json.JSONDecodeError:
+        return None
+
+
+def get_entry(key: str) -> CacheEntry | None:
+    """Return the entry for `key` regardless of age, or None if absent."""
+    with span("cache.entry", key=key) as s:
+        entry = _get_entry(key)
+        s.set(hit=entry is not None, bytes=len(entry.blob) if entry else 0)
+    return entry
+
+
+def _get_entry(key: str) -> CacheEntry | None:
+    conn = _connect()
+    if _memo is not None:
+        return _get_memoised(conn, key)
+    row = conn.execute(
+        "SELECT ts, ttl, etag, last_modified, payload FROM entries WHERE key = ?", (key,)
+    ).fetchone()
+    if row is None:
+        return None
+    conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+    metrics.inc("ffb_cache_read_bytes_total", len(row[-1]), ns=namespace(key))
+    return CacheEntry(key, *row)
+
+
+def _get_memoised(conn: sqlite3.Connection, key: str) -> CacheEntry | None:
+    row = conn.execute(
+        "SELECT ts, ttl, etag, last_modified FROM entries WHERE key = ?", (key,)
+    ).fetchone()
+    if row is None:
+        return None
+    conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+    hit = _memo.get(key)
+    if hit is not None and hit[0] == row[0]:
+        entry = CacheEntry(key, *row, b"")
+        entry.payload = hit[1]  # fills the cached_property
+        return entry
+
+    blob = conn.execute("SELECT payload FROM entries WHERE key = ?", (key,)).fetchone()[0]
+    metrics.inc("ffb_cache_read_bytes_total", len(blob), ns=namespace(key))
+    entry = CacheEntry(key, *row, blob)
+    _memo[key] = (row[0], entry.payload)
+    return entry
+
+
+def entry_ts(key: str) -> float | None:
+    """Write time of `key`, or None if absent. Doesn't read the payload."""
+    row = _connect().execute("SELECT ts FROM entries WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def entry_size(key: str) -> int | None:
+    """Stored payload size of `key` in bytes, or None if absent."""
+    row = _connect().execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def set_cached(
+    key: str,
+    payload: dict | list,
+    ttl: int | None = None,
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> None:
+    with span("cache.encode", key=key):
+        blob = json.dumps(payload, separators=(",", ":")).encode()
+    _put(key, blob, ttl, etag, last_modified)
+
+
+def get_cached_blob(key: str) -> bytes | None:
+    """Raw bytes stored with set_cached_blob, regardless of age."""
+    with span("cache.blob", key=key) as s:
+        conn = _connect()
+        row = conn.execute("SELECT payload FROM entries WHERE key = ?", (key,)).fetchone()
+        s.set(hit=row is not None, bytes=len(row[0]) if row else 0)
+    if row is None:
+        metrics.inc("ffb_cache_misses_total", ns=namespace(key))
         return None
+    conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+    metrics.inc("ffb_cache_hits_total", ns=namespace(key))
+    metrics.inc("ffb_cache_read_bytes_total", len(row[0]), ns=namespace(key))
+    return row[0]
+
+
+def set_cached_blob(key: str, data: bytes, ttl: int | None = None) -> None:
+    """Store opaque bytes (e.g. a NumPy archive) instead of JSON."""
+    _put(key, data, ttl, None, None)
+
+
+def _put(
+    key: str, blob: bytes, ttl: int | None, etag: str | None, last_modified: str | None
+) -> None:
+    now = time.time()
+    conn = _connect()
+    with span("cache.put", key=key, bytes=len(blob)):
+        conn.execute(
+            "INSERT OR REPLACE INTO entries"
+            " (key, ns, ts, ttl, size, accessed, etag, last_modified, payload)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, namespace(key), now, ttl, len(blob), now, etag, last_modified, blob),
+        )
+        _evict(conn, keep=key)
+    metrics.inc("ffb_cache_written_bytes_total", len(blob), ns=namespace(key))
+
+
+def touch(key: str) -> None:
+    """Mark an entry fresh again without rewriting it (e.g. after a 304)."""
+    now = time.time()
+    _connect().execute(
+        "UPDATE entries SET ts = ?, accessed = ?, refreshing = NULL WHERE key = ?",
+        (now, now, key),
+    )
+
+
+def claim_refresh(key: str, window: float = 60.0) -> bool:
+    """Atomically claim the right to refresh `key` in the background.
+
+    Returns False if another process claimed it within the last `window`
+    seconds, so concurrent invocations don't all revalidate the same entry.
+    """
+    now = time.time()
+    cur = _connect().execute(
+        "UPDATE entries SET refreshing = ? WHERE key = ?"
+        " AND (refreshing IS NULL OR refreshing < ?)",
+        (now, key, now - window),
+    )
+    return cur.rowcount == 1
+
+
+def mark_refresh_failed(key: str) -> None:
+    """Record that a background refresh of `key` was refused for lack of
+    a valid login; stays set until the entry is next written or touched."""
+    _connect().execute("UPDATE entries SET refreshing = -1 WHERE key = ?", (key,))
+
+
+def refresh_failed(key: str) -> bool:
+    """Whether the last background refresh of `key` was refused (see mark_refresh_failed)."""
+    row = _connect().execute("SELECT refreshing FROM entries WHERE key = ?", (key,)).fetchone()
+    return bool(row and row[0] is not None and row[0] < 0)
+
+
+def _evict(conn: sqlite3.Connection, keep: str) -> None:
+    """Drop least-recently-used entries until the store fits CACHE_MAX_BYTES."""
+    total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+    if total <= CACHE_MAX_BYTES:
+        return
+    victims = []
+    for key, size in conn.execute(
+        "SELECT key, size FROM entries WHERE key != ? ORDER BY accessed", (keep,)
+    ):
+        if total <= CACHE_MAX_BYTES:
+            break
+        victims.append((key,))
+        total -= size
+    conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+
+
+def clear_cache(ns: str | None = None) -> int:
+    """Delete every entry, or only those in namespace `ns`. Returns the count removed."""
+    conn = _connect()
+    if ns in (None, "news", "articles"):
+        articles = conn.execute("DELETE FROM articles").rowcount
+        if ns == "articles":
+            return articles
+    if ns:
+        return conn.execute("DELETE FROM entries WHERE ns = ?", (ns,)).rowcount
+    removed = conn.execute("DELETE FROM entries").rowcount
+    # Files left behind by the old one-JSON-file-per-key store
+    for f in CACHE_DIR.glob("*.json"):
+        f.unlink()
+    conn.execute("VACUUM")
+    return removed
+
+
+def add_metrics(rows: list[tuple[str, str, float]]) -> None:
+    """Add (name, labels, value) increments to the stored counters in one transaction."""
+    conn = _connect()
+    with conn:
+        conn.execute("BEGIN")
+        conn.executemany(
+            "INSERT INTO metrics (name, labels, value) VALUES (?, ?, ?)"
+            " ON CONFLICT (name, labels) DO UPDATE SET value = value + excluded.value",
+            rows,
+        )
+
+
+def read_metrics() -> list[tuple[str, str, float]]:
+    return _connect().execute("SELECT name, labels, value FROM metrics").fetchall()
+
+
+def clear_metrics() -> None:
+    _connect().execute("DELETE FROM metrics")
+
+
+def put_articles(articles: list[dict]) -> int:
+    """Insert or update articles by id in one transaction. Returns how many were new."""
+    if not articles:
+        return 0
+    conn = _connect()
+    now = time.time()
+    with span("cache.articles.put", rows=len(articles)) as s, conn:
+        # IMMEDIATE: a read transaction upgraded to a write fails at once if
+        # another connection wrote in between, instead of waiting its turn
+        conn.execute("BEGIN IMMEDIATE")
+        known = conn.execute(
+            "SELECT COUNT(*) FROM articles WHERE id IN (SELECT value FROM json_each(?))",
+            (json.dumps(list({a["id"] for a in articles})),),
+        ).fetchone()[0]
+        # An upsert rather than INSERT OR REPLACE, whose deletes skip the index triggers
+        conn.executemany(
+            "INSERT INTO articles (id, date, modified, title, link, excerpt, synced)"
+            " VALUES (:id, :date, :modified, :title, :link, :excerpt, :synced)"
+            " ON CONFLICT (id) DO UPDATE SET date = excluded.date, modified = excluded.modified,"
+            " title = excluded.title, link = excluded.link, excerpt = excluded.excerpt,"
+            " synced = excluded.synced",
+            [{**a, "synced": now} for a in articles],
+        )
+        new = len({a["id"] for a in articles}) - known
+        s.set(new=new)
+    return new
+
+
+def prune_articles(keep: int) -> int:
+    """Delete all but the `keep` newest articles. Returns how many went."""
+    conn = _connect()
+    with span("cache.articles.prune", keep=keep) as s, conn:
+        # Row-by-row deletes, so the index triggers drop them from the FTS table too
+        removed = conn.execute(
+            "DELETE FROM articles WHERE id NOT IN"
+            " (SELECT id FROM articles ORDER BY date DESC, id DESC LIMIT ?)",
+            (keep,),
+        ).rowcount
+        s.set(removed=removed)
+    return removed
+
+
+def recent_articles(limit: int) -> list[dict]:
+    """The `limit` newest articles, newest first."""
+    with span("cache.articles.query", limit=limit):
+        rows = _connect().execute(
+            "SELECT id, date, modified, title, link, excerpt FROM articles"
+            " ORDER BY date DESC, id DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+    keys = ("id", "date", "modified", "title", "link", "excerpt")
+    return [dict(zip(keys, row)) for row in rows]
+
+
+def search_articles(text: str, limit: int, phrase: bool = False, newest_first: bool = False) -> list[dict]:
+    """Articles whose title or excerpt contains every word of `text` (or, with
+    `phrase`, the words in order), best match first or newest first."""
+    words = re.findall(r"\w+", text.lower())
+    if not words:
+        return []
+    conn = _connect()
+    columns = "a.id, a.date, a.modified, a.title, a.link, a.excerpt"
+    if _fts:
+        # Quoted, so user input can't be read as FTS5 query syntax
+        match = '"' + " ".join(words) + '"' if phrase else " ".join(f'"{w}"' for w in words)
+        # Title matches count five times as much as excerpt matches
+        order = "a.date DESC, a.id DESC" if newest_first else "bm25(articles_fts, 5.0, 1.0)"
+        sql = (
+            f"SELECT {columns} FROM articles_fts JOIN articles a ON a.id = articles_fts.rowid"
+            f" WHERE articles_fts MATCH ? ORDER BY {order} LIMIT ?"
+        )
+        params = (match, limit)
+    else:
+        patterns = ["% ".join(words)] if phrase else words
+        where = " AND ".join("(a.title || ' ' || a.excerpt) LIKE ?" for _ in patterns)
+        sql = f"SELECT {columns} FROM articles a WHERE {where} ORDER BY a.date DESC, a.id DESC LIMIT ?"
+        params = (*(f"%{p}%" for p in patterns), limit)
+
+    with span("cache.articles.search", words=len(words)) as s:
+        rows = conn.execute(sql, params).fetchall()
+        s.set(rows=len(rows))
+    keys = ("id", "date", "modified", "title", "link", "excerpt")
+    return [dict(zip(keys, row)) for row in rows]
 
 
-def set_cached(key: str, payload: dict | list) -> None:
-    path = _cache_path(key)
-    data = {"_ts": time.time(), "payload": payload}
-    path.write_text(json.dumps(data))
+def article_bounds() -> tuple[int, str | None, str | None]:
+    """(count, oldest publish date, newest modified date) of the stored articles."""
+    return _connect().execute("SELECT COUNT(*), MIN(date), MAX(modified) FROM articles").fetchone()
 
 
-def clear_cache() -> None:
-    if CACHE_DIR.exists():
-        for f in CACHE_DIR.glob("*.json"):
-            f.unlink()
+def cache_info() -> list[dict]:
+    """Per-namespace entry counts, sizes and newest write time."""
+    conn = _connect()
+    rows = conn.execute(
+        "SELECT ns, COUNT(*), SUM(size), MAX(ts) FROM entries GROUP BY ns ORDER BY ns"
+    ).fetchall()
+    articles = conn.execute(
+        "SELECT 'articles', COUNT(*), SUM(length(title) + length(link) + length(excerpt)), MAX(synced)"
+        " FROM articles"
+    ).fetchone()
+    if articles[1]:
+        rows.insert(0, articles)
+    return [
+        {"namespace": ns, "entries": count, "bytes": size, "updated": ts}
+        for ns, count, size, ts in rows
+    ]
@@ -0,0 +1,257 @@
+"""`ffb batch`: run many --json commands from one process.
+
+Each input line is a JSON request such as
+{"cmd": "rankings", "position": "QB", "limit": 10}; it is turned into the
+equivalent command line and run through the normal CLI, so options,
+validation and errors are exactly those of the single command. Requests run
+on a thread pool and share the process's client, parsed session and cache
+memo. Each worker's stdout/stderr is routed to its own buffer, and one
+result line is written per request.
+"""
+
+import io
+import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import typer
+
+from ..config import HTTP_MAX_WORKERS
+from ..daemon import FORWARDED
+
+ORDERS = ("input", "completion")
+
+
+class _ThreadStream(io.TextIOBase):
+    """sys.stdout/sys.stderr stand-in that gives each worker thread its own buffer.
+
+    Threads without a buffer (the main thread) write to `default`.
+    """
+
+    def __init__(self, default):
+        self.default = default
+        self._local = threading.local()
+
+    @property
+    def encoding(self) -> str:
+        return "utf-8"
+
+    @property
+    def errors(self) -> str:
+        return "strict"
+
+    def capture(self) -> io.StringIO:
+        self._local.buf = io.StringIO()
+        return self._local.buf
+
+    def release(self) -> None:
+        self._local.buf = None
+
+    def _target(self):
+        return getattr(self._local, "buf", None) or self.default
+
+    def write(self, s: str) -> int:
+        return self._target().write(s)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def isatty(self) -> bool:
+        # Keeps Rich from colouring captured JSON
+        return False
+
+    def writable(self) -> bool:
+        return True
+
+
+def _resolve(cmd: str) -> list[tuple[str, object]]:
+    """(name, Click command) for each word of `cmd`, e.g. "trade find"."""
+    from ..main import app
+
+    words = cmd.split()
+    if not words or words[0] not in FORWARDED:
+        raise ValueError(f"Unsupported command: {cmd!r}. Choose from {', '.join(sorted(FORWARDED))}.")
+    command = typer.main.get_command(app)
+    path = []
+    for word in words:
+        sub = command.get_command(None, word) if hasattr(command, "get_command") else None
+        if sub is None:
+            raise ValueError(f"Unknown command: {cmd!r}")
+        path.append((word, sub))
+        command = sub
+    return path
+
+
+def _argv(request: dict) -> list[str]:
+    """Command line for one request: its options by name, positionals last, --json added."""
+    cmd = request.get("cmd")
+    if not isinstance(cmd, str):
+        raise ValueError('Missing "cmd"')
+    path = _resolve(cmd)
+    command = path[-1][1]
+
+    params = {}
+    for param in command.params:
+        params[param.name] = param
+        for opt in getattr(param, "opts", []):
+            if opt.startswith("--"):
+                params[opt[2:].replace("-", "_")] = param
+
+    options, positionals = [], []
+    for key, value in request.items():
+        if key in ("cmd", "id") or value is None:
+            continue
+        param = params.get(key.replace("-", "_"))
+        if param is None:
+            raise ValueError(f"Unknown option for {cmd}: {key}")
+        if param.param_type_name == "argument":
+            positionals += [str(v) for v in value] if isinstance(value, list) else [str(value)]
+        elif param.is_flag:
+            if value:
+                options.append(param.opts[-1])
+        else:
+            if isinstance(value, list):
+                value = ",".join(str(v) for v in value)
+            options += [param.opts[-1], str(value)]
+
+    if "output_json" in params:
+        options.append("--json")
+    argv = [word for word, _ in path] + options
+    return argv + ["--", *positionals] if positionals else argv
+
+
+def _invoke(argv: list[str], out: _ThreadStream, err: _ThreadStream) -> tuple[int, str, str]:
+    """Run one command line on this thread, capturing its output."""
+    from ..main import app
+
+    stdout, stderr = out.capture(), err.capture()
+    try:
+        app(args=argv, prog_name="ffb")
+        code = 0
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception as e:
+        stderr.write(f"{type(e).__name__}: {e}\n")
+        code = 1
+    finally:
+        out.release()
+        err.release()
+    return code, stdout.getvalue(), stderr.getvalue()
+
+
+def _run(request: dict, out: _ThreadStream, err: _ThreadStream) -> dict:
+    result = {"id": request["id"]} if "id" in request else {}
+    try:
+        argv = _argv(request)
+    except ValueError as e:
+        return {**result, "code": 2, "error": str(e)}
+
+    code, stdout, stderr = _invoke(argv, out, err)
+    result.update(cmd=request["cmd"], code=code)
+    if code:
+        result["error"] = stderr.strip() or stdout.strip()
+        return result
+    try:
+        result["result"] = json.loads(stdout)
+    except json.JSONDecodeError:
+        # e.g. "No rankings found for the given filters."
+        result["message"] = stdout.strip()
+    return result
+
+
+def batch_command(
+    file: str = typer.Argument("-", help="JSONL file of commands (default: stdin)"),
+    jobs: int = typer.Option(HTTP_MAX_WORKERS, "-j", "--jobs", help="Commands run at once"),
+    order: str = typer.Option(
+        "input", "--order", help="Write results in input order, or as each completes (completion)"
+    ),
+):
+    """Run many commands from one process, one JSON request per line.
+
+    \b
+    Each line names a command and its options, as on the command line:
+      {"id": 1, "cmd": "rankings", "position": "QB", "limit": 10}
+      {"id": 2, "cmd": "players search", "query": "mahomes"}
+      {"id": 3, "cmd": "trade", "give": ["Kelce"], "get": "Chase"}
+    Options use their long names (or parameter names); flags take true.
+    --json is implied. Supported: players, rankings, projections, trade,
+    start-sit and news.
+
+    \b
+    One result line is written per request, carrying any "id":
+      {"id": 1, "cmd": "rankings", "code": 0, "result": [...]}
+      {"id": 2, "cmd": "players search", "code": 1, "error": "..."}
+    The batch shares one HTTP connection pool, login session and cache, and
+    runs up to --jobs commands concurrently.
+
+    \b
+    EXAMPLES:
+      ffb batch requests.jsonl
+      cat requests.jsonl | ffb batch --order completion -j 16
+    """
+    if order not in ORDERS:
+        typer.echo(f"Unknown order: {order}. Choose from {', '.join(ORDERS)}.", err=True)
+        raise typer.Exit(1)
+
+    try:
+        source = sys.stdin if file == "-" else open(file)
+    except OSError as e:
+        typer.echo(f"Could not read {file}: {e.strerror}", err=True)
+        raise typer.Exit(1)
+
+    from ..cache import store
+
+    # Decode each cache entry once for the whole batch
+    store.enable_memo()
+
+    real_stdout, real_stdin = sys.stdout, sys.stdin
+    out, err = _ThreadStream(sys.stdout), _ThreadStream(sys.stderr)
+    lock = threading.Lock()
+    pending: dict[int, dict] = {}
+    next_line = 0
+
+    def emit(n: int, result: dict) -> None:
+        nonlocal next_line
+        with lock:
+            if order == "completion":
+                real_stdout.write(json.dumps(result) + "\n")
+            else:
+                pending[n] = result
+                while next_line in pending:
+                    real_stdout.write(json.dumps(pending.pop(next_line)) + "\n")
+                    next_line += 1
+            real_stdout.flush()
+
+    def work(n: int, request: dict) -> None:
+        try:
+            emit(n, _run(request, out, err))
+        finally:
+            slots.release()
+
+    # Bounds requests read ahead of the workers
+    slots = threading.BoundedSemaphore(max(jobs, 1) * 4)
+    sys.stdout, sys.stderr = out, err
+    # Commands must never prompt on (or read) the batch's own input
+    sys.stdin = io.StringIO()
+    try:
+        with ThreadPoolExecutor(max_workers=max(jobs, 1)) as pool:
+            n = 0
+            for lineno, line in enumerate(source, 1):
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError
+                except ValueError:
+                    emit(n, {"code": 2, "error": f'Line {lineno}: expected a JSON object with "cmd"'})
+                    n += 1
+                    continue
+                slots.acquire()
+                pool.submit(work, n, request)
+                n += 1
+    finally:
+        sys.stdout, sys.stderr, sys.stdin = out.default, err.default, real_stdin
+        if source is not real_stdin:
+            source.close()
@@ -0,0 +1,188 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import typer
+
+from ..cache.store import cache_info, clear_cache, entry_size, entry_ts, mark_refresh_failed, namespace
+from ..config import CACHE_TTL_NEWS, CACHE_TTL_PLAYERS, CACHE_TTL_PROJECTIONS, CACHE_TTL_TRADE
+from ..display.tables import cache_table, cache_warm_table, print_json
+
+app = typer.Typer(help="""Inspect and clear the local response cache. No login required.
+
+\b
+Cached API responses live in a single SQLite database under
+~/.config/ffb/cache/. Entries are grouped into namespaces by key prefix:
+player, projections, news, trade. The store is capped at FFB_CACHE_MAX_BYTES
+(default 64 MB) and evicts least-recently-used entries past that.
+
+\b
+EXAMPLES:
+  ffb cache info                      # entries and bytes per namespace
+  ffb cache clear                     # wipe everything
+  ffb cache clear --ns projections    # drop only cached projections
+  ffb cache warm                      # refresh whatever is about to expire
+""")
+
+
+def _refresh_players() -> None:
+    from .players import _fetch_player_data, _load_index
+
+    _fetch_player_data(force=True)
+    # Rebuild the search index now rather than on the next search
+    _load_index()
+
+
+def _refresh_projections() -> None:
+    from .rankings import _fetch_raw_projections, _load_frame
+
+    _fetch_raw_projections(force=True)
+    _load_frame()
+
+
+def _refresh_trade() -> None:
+    from .trade import _fetch_trade_values
+
+    _fetch_trade_values(refresh=True)
+
+
+def _refresh_news() -> None:
+    from .news import _sync_news
+
+    _sync_news(force=True)
+
+
+# Datasets `cache warm` keeps fresh: name -> (cache key, TTL, needs login, refresh)
+DATASETS = {
+    "player": ("player_search_data", CACHE_TTL_PLAYERS, False, _refresh_players),
+    "projections": ("projections_raw", CACHE_TTL_PROJECTIONS, True, _refresh_projections),
+    "trade": ("trade_values", CACHE_TTL_TRADE, True, _refresh_trade),
+    "news": ("news_sync", CACHE_TTL_NEWS, False, _refresh_news),
+}
+
+
+@app.command()
+def info(
+    output_json: bool = typer.Option(False, "--json", help="Output as JSON"),
+):
+    """Show cache entries and size per namespace."""
+    rows = cache_info()
+    if output_json:
+        print_json(rows)
+    elif not rows:
+        typer.echo("Cache is empty.")
+    else:
+        cache_table(rows)
+
+
+@app.command()
+def clear(
+    ns: str = typer.Option(None, "--ns", help="Only clear this namespace: player, projections, trade, news or articles"),
+):
+    """Clear cached responses, optionally for one namespace only."""
+    if ns is not None:
+        # The datasets' namespaces, plus the article store and anything else stored
+        known = dict.fromkeys([*DATASETS, "articles", *(row["namespace"] for row in cache_info())])
+        if ns not in known:
+            typer.echo(f"Unknown namespace '{ns}'. Choose from {', '.join(known)}.", err=True)
+            raise typer.Exit(1)
+    removed = clear_cache(ns)
+    scope = f" from '{ns}'" if ns else ""
+    typer.echo(f"Removed {removed} cache entries{scope}.")
+
+
+def _expires_in(key: str, ttl: int) -> float | None:
+    ts = entry_ts(key)
+    return None if ts is None else round(ts + ttl - time.time())
+
+
+def _warm_one(name: str) -> dict:
+    key, ttl, _, refresh_dataset = DATASETS[name]
+    row = {"dataset": name, "key": key, "status": "refreshed"}
+    start = time.perf_counter()
+    try:
+        refresh_dataset()
+    except typer.Exit:
+        # The fetch already explained itself on stderr
+        row.update(status="error", error="fetch failed")
+    except Exception as e:
+        row.update(status="error", error=str(e) or type(e).__name__)
+    row.update(
+        seconds=round(time.perf_counter() - start, 3),
+        bytes=entry_size(key),
+        expires_in=_expires_in(key, ttl),
+    )
+    return row
+
+
+@app.command()
+def warm(
+    within: int = typer.Option(
+        15, "--within", help="Refresh datasets expiring within this many minutes"
+    ),
+    force: bool = typer.Option(False, "--force", help="Refresh every dataset, fresh or not"),
+    output_json: bool = typer.Option(False, "--json", help="Output as JSON"),
+):
+    """Prefetch player data, projections, trade values and news in parallel.
+
+    \b
+    Datasets that are missing or expire within --within minutes are
+    fetched concurrently (expired ones are revalidated, so unchanged data
+    costs a 304); the rest are left alone. Projections and trade values
+    need a login and are skipped without one. Run it before a draft so
+    later commands are pure cache hits.
+
+    \b
+    EXAMPLES:
+      ffb cache warm                   # refresh what expires in 15 minutes
+      ffb cache warm --within 120      # good for the next two hours
+      ffb sync --force --json          # refresh everything, JSON report
+    """
+    from ..auth.session import load_session
+
+    logged_in = load_session() is not None
+    rows, due = [], []
+    for name, (key, ttl, needs_login, _) in DATASETS.items():
+        expires_in = _expires_in(key, ttl)
+        row = {"dataset": name, "key": key, "bytes": entry_size(key), "expires_in": expires_in}
+        if needs_login and not logged_in:
+            rows.append({**row, "status": "skipped", "error": "login required"})
+        elif not force and expires_in is not None and expires_in > within * 60:
+            rows.append({**row, "status": "fresh"})
+        else:
+            due.append(name)
+
+    if due:
+        with ThreadPoolExecutor(max_workers=len(due)) as pool:
+            rows += pool.map(_warm_one, due)
+    rows.sort(key=lambda r: list(DATASETS).index(r["dataset"]))
+
+    if output_json:
+        print_json(rows)
+    else:
+        cache_warm_table(rows)
+    if any(r["status"] == "error" for r in rows):
+        raise typer.Exit(1)
+
+
+@app.command(hidden=True)
+def refresh(key: str = typer.Argument(help="Cache key to revalidate")):
+    """Revalidate one cache entry. Spawned by stale-while-revalidate."""
+    from ..api.client import AuthExpiredError
+    from ..auth.session import load_session
+
+    ns = namespace(key)
+    if ns not in DATASETS:
+        typer.echo(f"Don't know how to refresh '{key}'.", err=True)
+        raise typer.Exit(1)
+    try:
+        DATASETS[ns][3]()
+    except AuthExpiredError:
+        # The caller served the entry stale; make its next lookup say why it can't refresh
+        mark_refresh_failed(key)
+        typer.echo("Session expired. Run `ffb login` to re-authenticate.", err=True)
+        raise typer.Exit(1)
+    except typer.Exit:
+        if DATASETS[ns][2] and load_session() is None:
+            # Logged out since the entry was cached
+            mark_refresh_failed(key)
+        raise
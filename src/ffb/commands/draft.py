@@ -0,0 +1,251 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+import typer
+
+from ..api.client import AuthExpiredError
+from ..config import DEFAULT_SCORING, DRAFT_FILE, VALID_POSITIONS
+from ..display.tables import console, draft_board_table, draft_picks_table, rankings_table
+from ..engine.draft import Draft
+from ..tracing import span
+from .rankings import _consensus_options, _fetch_projections
+
+COMMANDS_HELP = """\
+  <player name>      draft a player for the team on the clock (fuzzy match)
+  #<rank>            draft by overall rank, e.g. #12
+  undo [N]           take back the last N picks (default 1)
+  board              best available at each position, tiers left, last round's picks
+  best [POS] [N]     the N best available, overall or at POS (default 10)
+  tiers POS          players left in each of a position's tiers
+  team [N]           team N's picks (default: yours, with --slot)
+  picks [N]          the last N picks (default one round)
+  quit               stop; the draft is saved and `ffb draft --resume` continues it"""
+
+
+def _save(path: Path, settings: dict, draft: Draft) -> None:
+    """Write the settings and picks, replacing the file atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "w") as f:
+        json.dump({**settings, "picks": draft.snapshot()}, f)
+    os.replace(tmp, path)
+
+
+def _label(draft: Draft, k: int) -> str:
+    rnd, n, _ = draft.slot(k)
+    return f"{rnd}.{n:02d}"
+
+
+def _pick_rows(draft: Draft, picks: list[tuple[int, int]]) -> list[dict]:
+    """(overall pick, player) pairs as draft_picks_table rows."""
+    return [
+        {**draft.players[i], "pick": _label(draft, k), "drafted_by": draft.slot(k)[2]}
+        for k, i in picks
+    ]
+
+
+def _show_board(draft: Draft) -> None:
+    recent = draft.recent()
+    draft_board_table([
+        {
+            "position": pos,
+            "tier": draft.current_tier(pos),
+            "players": [draft.players[i] for i in draft.best(pos, 3)],
+            "recent": recent[pos],
+        }
+        for pos in VALID_POSITIONS
+        if pos in draft.positions
+    ])
+
+
+def _announce(draft: Draft, slot: int | None) -> None:
+    """One line for the pick just made, plus tier and run alerts."""
+    k = len(draft.picks) - 1
+    p = draft.players[draft.picks[-1]]
+    team = draft.slot(k)[2]
+    who = "you" if team == slot else f"Team {team}"
+    console.print(
+        f"[dim]{_label(draft, k)}[/dim] {who}: [bold]{p['player_name']}[/bold]"
+        f" [cyan]{p['position']}[/cyan] [green]{p.get('team', '')}[/green]"
+        f" [dim](rank {p['rank']}, tier {p.get('tier')})[/dim]"
+    )
+    left = draft.tiers_left[(p["position"], p.get("tier"))]
+    if left == 0:
+        console.print(f"  [yellow]Tier {p.get('tier')} {p['position']}s are gone.[/yellow]")
+    elif left <= 2:
+        console.print(f"  [yellow]{left} tier-{p.get('tier')} {p['position']} left.[/yellow]")
+    position, length = draft.run()
+    if length >= 3:
+        console.print(f"  [magenta]{position} run: {length} in a row.[/magenta]")
+
+
+def _command(draft: Draft, cmd: str, arg: str, slot: int | None) -> bool:
+    """Run a board command; False when `cmd` isn't one (so it's a player name)."""
+    words = arg.split()
+    if cmd in ("help", "?"):
+        console.print(COMMANDS_HELP)
+    elif cmd == "board":
+        _show_board(draft)
+    elif cmd == "best":
+        position = next((w.upper() for w in words if w.upper() in VALID_POSITIONS), None)
+        n = next((int(w) for w in words if w.isdigit()), 10)
+        players = [draft.players[i] for i in draft.best(position, n)]
+        if players:
+            rankings_table(players, f"{position or 'all'} available")
+        else:
+            console.print("[dim]Nobody left.[/dim]")
+    elif cmd == "tiers":
+        position = words[0].upper() if words else ""
+        if position not in draft.positions:
+            console.print(f"Usage: tiers POS ({', '.join(draft.positions)})")
+            return True
+        for tier, left, total in draft.tiers(position):
+            console.print(f"  {position} tier {tier}: [yellow]{left}[/yellow] of {total} left")
+    elif cmd in ("team", "roster"):
+        team = int(words[0]) if words and words[0].isdigit() else slot
+        if not team:
+            console.print("Usage: team N (or start the draft with --slot)")
+            return True
+        if not draft.roster(team):
+            console.print(f"[dim]Team {team} hasn't picked yet.[/dim]")
+            return True
+        draft_picks_table(_pick_rows(draft, draft.roster(team)), f"Team {team}")
+    elif cmd in ("picks", "log"):
+        n = int(words[0]) if words and words[0].isdigit() else draft.teams
+        if not draft.picks:
+            console.print("[dim]No picks yet.[/dim]")
+            return True
+        start = max(len(draft.picks) - n, 0)
+        draft_picks_table(_pick_rows(draft, list(enumerate(draft.picks))[start:]), "Recent picks")
+    else:
+        return False
+    return True
+
+
+def draft_command(
+    teams: int = typer.Option(12, "--teams", help="Teams in the league"),
+    rounds: int = typer.Option(16, "--rounds", help="Rounds in the draft"),
+    slot: int = typer.Option(None, "--slot", help="Your draft position (1 to --teams)"),
+    scoring: str = typer.Option(DEFAULT_SCORING, "-s", "--scoring", help="Scoring format (half/ppr/standard)"),
+    consensus: str = typer.Option(
+        "mean", "--consensus", help="Combine analysts by mean, median, trimmed or weighted"
+    ),
+    weights: str = typer.Option(
+        None, "--weights", help='Analyst weights for --consensus weighted (e.g. "andy=2,mike=1")'
+    ),
+    resume: bool = typer.Option(False, "--resume", help="Continue the draft saved in --file"),
+    file: Path = typer.Option(DRAFT_FILE, "--file", help="Where the picks are saved after every change"),
+):
+    """Run a live snake draft board from the rankings. Requires login.
+
+    \b
+    Type each pick's player name as it happens (fuzzy matched against the
+    players still available) and the board keeps the best available at
+    every position, how many players are left in each tier and which
+    positions are going in runs. Picks are saved after every change;
+    `undo` takes them back and --resume picks the draft up again.
+    Type `help` at the prompt for the board commands.
+
+    \b
+    EXAMPLES:
+      ffb draft --slot 5                      # 12 teams, 16 rounds, you pick 5th
+      ffb draft --teams 10 --rounds 20 -s ppr
+      ffb draft --resume                      # continue after a restart
+      ffb draft < picks.txt                   # replay picks, one name per line
+    """
+    settings = {
+        "teams": teams, "rounds": rounds, "slot": slot,
+        "scoring": scoring, "consensus": consensus, "weights": weights,
+    }
+    saved_picks = []
+    if resume:
+        try:
+            with open(file) as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            typer.echo(f"No saved draft in {file}.", err=True)
+            raise typer.Exit(1)
+        saved_picks = saved.pop("picks", [])
+        settings.update({k: v for k, v in saved.items() if k in settings})
+    if settings["slot"] is not None and not 1 <= settings["slot"] <= settings["teams"]:
+        typer.echo(f"--slot must be between 1 and {settings['teams']}.", err=True)
+        raise typer.Exit(1)
+    analyst_weights = _consensus_options(settings["consensus"], settings["weights"])
+
+    try:
+        players = _fetch_projections(settings["scoring"], settings["consensus"], analyst_weights)
+    except AuthExpiredError:
+        typer.echo("Session expired. Run `ffb login` to re-authenticate.", err=True)
+        raise typer.Exit(1)
+
+    draft = Draft(players, settings["teams"], settings["rounds"])
+    slot = settings["slot"]
+    missing = draft.restore(saved_picks)
+    if missing:
+        typer.echo(f"Skipped {len(missing)} saved pick(s) no longer in the rankings.", err=True)
+
+    interactive = sys.stdin.isatty()
+    console.print(
+        f"[bold]Draft:[/bold] {draft.teams} teams x {draft.rounds} rounds, {settings['scoring']}"
+        f"{f', you pick {slot}' if slot else ''}. Type a player's name to draft them, `help` for commands."
+    )
+    if draft.picks:
+        console.print(f"[dim]Resumed after {len(draft.picks)} picks.[/dim]")
+    _show_board(draft)
+
+    while not draft.done:
+        rnd, n, team = draft.slot()
+        prompt = f"{rnd}.{n:02d} {'you' if team == slot else f'Team {team}'}> "
+        try:
+            line = input(prompt if interactive else "").strip()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if not line:
+            continue
+        cmd, _, arg = line.partition(" ")
+        cmd = cmd.lower()
+
+        if cmd in ("quit", "exit", "q"):
+            break
+        if cmd == "undo":
+            for _ in range(int(arg) if arg.strip().isdigit() else 1):
+                k = len(draft.picks) - 1
+                i = draft.undo()
+                if i is None:
+                    console.print("[dim]No picks to undo.[/dim]")
+                    break
+                console.print(f"[dim]Undid {_label(draft, k)}: {draft.players[i]['player_name']}[/dim]")
+            _save(file, settings, draft)
+            continue
+        if _command(draft, cmd, arg, slot):
+            continue
+
+        with span("draft.pick", pick=len(draft.picks) + 1) as s:
+            found = draft.match(line)
+            s.set(matches=len(found))
+            if len(found) == 1:
+                draft.pick(found[0])
+        if not found:
+            console.print(f"No available player matches {line!r}.")
+            continue
+        if len(found) > 1:
+            options = ", ".join(
+                f"{draft.players[i]['player_name']} ({draft.players[i]['position']} #{draft.players[i]['rank']})"
+                for i in found[:5]
+            )
+            console.print(f"Ambiguous: {options}. Type more of the name or #rank.")
+            continue
+        _announce(draft, slot)
+        _save(file, settings, draft)
+        if not draft.done and (draft.slot()[2] == slot or (slot is None and draft.slot()[1] == 1)):
+            # Your turn next (or, without --slot, a new round)
+            _show_board(draft)
+
+    if draft.done:
+        console.print("[bold]Draft complete.[/bold]")
+        if slot:
+            draft_picks_table(_pick_rows(draft, draft.roster(slot)), "Your team")
+    elif draft.picks:
+        console.print(f"[dim]Saved {len(draft.picks)} picks to {file}; `ffb draft --resume` continues.[/dim]")
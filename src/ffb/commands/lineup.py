@@ -0,0 +1,170 @@
+import json
+import sys
+from pathlib import Path
+
+import typer
+
+from ..api.client import AuthExpiredError
+from ..config import DEFAULT_SCORING, DRAFT_FILE, LINEUP_SLOTS
+from ..display.tables import lineup_table, print_json, print_jsonl
+from ..engine.draft import Draft
+from ..engine.lineup import SlotError, best_lineups, parse_slots
+from ..engine.search import NameIndex
+from ..tracing import span
+from .rankings import _consensus_options, _fetch_projections
+
+
+def _names(team: str, names) -> list[str]:
+    """A JSON roster as a list of names; a lone string is a one-name roster."""
+    if isinstance(names, str):
+        return [names]
+    if not isinstance(names, list) or not all(isinstance(n, str) for n in names):
+        raise ValueError(f"{team}: a roster must be a list of player names")
+    return names
+
+
+def _read_rosters(path: Path) -> list[tuple[str, list[str]]]:
+    """(team, player names) for each roster in a file ("-" for stdin).
+
+    JSON is either {"team": [names]} or a list of name lists. Otherwise
+    it's text: one name per line, a blank line between rosters, and an
+    optional "Team name:" line heading each; "#" starts a comment.
+    """
+    text = sys.stdin.read() if str(path) == "-" else path.read_text()
+    if text.lstrip().startswith(("{", "[")):
+        data = json.loads(text)
+        if isinstance(data, dict):
+            return [(str(team), _names(str(team), names)) for team, names in data.items()]
+        return [(f"Team {k}", _names(f"Team {k}", names)) for k, names in enumerate(data, 1)]
+
+    rosters: list[tuple[str, list[str]]] = []
+    team, names = None, []
+    for line in [*text.splitlines(), ""]:
+        if line.lstrip().startswith("#"):
+            continue
+        line = line.split("#", 1)[0].strip()
+        if line.endswith(":") and not names:
+            team = line[:-1].strip()
+        elif line:
+            names.append(line)
+        elif names or team:
+            rosters.append((team or f"Team {len(rosters) + 1}", names))
+            team, names = None, []
+    return rosters
+
+
+def _draft_rosters(path: Path, players: list[dict]) -> list[tuple[str, list[int]]]:
+    """Each team's picks, as positions in `players`, from a saved `ffb draft`."""
+    saved = json.loads(path.read_text())
+    draft = Draft(players, saved.get("teams", 12), saved.get("rounds", 16))
+    draft.restore(saved.get("picks", []))
+    return [
+        (f"Team {team}" + (" (you)" if team == saved.get("slot") else ""), [i for _, i in draft.roster(team)])
+        for team in range(1, draft.teams + 1)
+    ]
+
+
+def lineup_command(
+    rosters_file: Path = typer.Argument(
+        None, help='Rosters to set lineups for: one name per line, a blank line between teams ("-" for stdin)'
+    ),
+    draft: bool = typer.Option(False, "--draft", help="Use every team's picks from the saved `ffb draft`"),
+    slots: str = typer.Option(LINEUP_SLOTS, "--slots", help="Starting slots, e.g. QB=1,RB=2,WR=3,TE=1,SUPERFLEX=1"),
+    scoring: str = typer.Option(DEFAULT_SCORING, "-s", "--scoring", help="Scoring format (half/ppr/standard)"),
+    consensus: str = typer.Option(
+        "mean", "--consensus", help="Combine analysts by mean, median, trimmed or weighted"
+    ),
+    weights: str = typer.Option(
+        None, "--weights", help='Analyst weights for --consensus weighted (e.g. "andy=2,mike=1")'
+    ),
+    output_json: bool = typer.Option(False, "--json", help="Output as JSON"),
+    output_jsonl: bool = typer.Option(False, "--jsonl", help="Output one JSON object per line"),
+):
+    """Pick the highest-scoring starting lineup for each roster. Requires login.
+
+    \b
+    Starters are chosen by projected points. The solver is exact: it
+    weighs every way of filling the FLEX (RB/WR/TE) and SUPERFLEX
+    (QB/RB/WR/TE) slots, and every roster given is solved in one pass.
+    Names are fuzzy matched as in `ffb trade`.
+
+    \b
+    EXAMPLES:
+      ffb lineup league.txt                       # every roster in the file
+      ffb lineup league.json -s ppr --json
+      ffb lineup --draft                          # all teams from `ffb draft`
+      ffb lineup - --slots "QB=1,RB=2,WR=3,TE=1,FLEX=1,SUPERFLEX=1" < team.txt
+    """
+    if draft == (rosters_file is not None):
+        typer.echo("Give a rosters file or --draft (one of them).", err=True)
+        raise typer.Exit(1)
+    try:
+        slot_rules = parse_slots(slots)
+    except SlotError as e:
+        typer.echo(str(e), err=True)
+        raise typer.Exit(1)
+    analyst_weights = _consensus_options(consensus, weights)
+
+    source = DRAFT_FILE if draft else rosters_file
+    if str(source) != "-" and not source.exists():
+        typer.echo(f"No such file: {source}" + (" (run `ffb draft` first)" if draft else ""), err=True)
+        raise typer.Exit(1)
+
+    try:
+        players = _fetch_projections(scoring, consensus, analyst_weights)
+    except AuthExpiredError:
+        typer.echo("Session expired. Run `ffb login` to re-authenticate.", err=True)
+        raise typer.Exit(1)
+
+    try:
+        if draft:
+            teams = _draft_rosters(source, players)
+        else:
+            names = NameIndex([p["player_name"] for p in players])
+            teams = []
+            for team, roster in _read_rosters(source):
+                found = []
+                for name in roster:
+                    i = names.best(name, min_score=60)
+                    if i is None:
+                        typer.echo(f"{team}: no player found matching {name!r}, skipped.", err=True)
+                    elif i in found:
+                        # One player can only start once
+                        typer.echo(
+                            f"{team}: {name!r} is {players[i]['player_name']} again, skipped.", err=True
+                        )
+                    else:
+                        found.append(i)
+                teams.append((team, found))
+    except (OSError, ValueError) as e:
+        typer.echo(f"Couldn't read rosters from {source}: {e}", err=True)
+        raise typer.Exit(1)
+
+    if not teams:
+        typer.echo("No rosters found.")
+        raise typer.Exit(0)
+
+    with span("lineup.solve", rosters=len(teams)):
+        rosters = [[players[i] for i in found] for _, found in teams]
+        solved = best_lineups(rosters, slot_rules)
+
+    results = []
+    for (team, _), roster, (lineup, total) in zip(teams, rosters, solved):
+        starting = {j for _, j in lineup if j is not None}
+        results.append({
+            "team": team,
+            "points": round(total, 1),
+            "lineup": [
+                {"slot": slot, **roster[j]} if j is not None else {"slot": slot, "player_name": None}
+                for slot, j in lineup
+            ],
+            "bench": [p for j, p in enumerate(roster) if j not in starting],
+        })
+
+    if output_jsonl:
+        print_jsonl(results)
+    elif output_json:
+        print_json(results)
+    else:
+        for result in results:
+            lineup_table(result, scoring)
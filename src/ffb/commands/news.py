@@ -1,61 +1,233 @@
-import json
 from html import unescape
+import math
 import re
 
 import typer
 
-from ..api.client import get_client
+from .. import metrics
+from ..api.cached import fetch_lock
 from ..api.endpoints import WP_POSTS
-from ..cache.store import get_cached, set_cached
-from ..config import CACHE_TTL_NEWS
-from ..display.tables import news_table, console
+from ..cache.store import (
+    article_bounds,
+    get_entry,
+    prune_articles,
+    put_articles,
+    recent_articles,
+    search_articles,
+    set_cached,
+)
+from ..config import CACHE_TTL_NEWS, NEWS_INDEX_DEPTH, NEWS_PAGE_SIZE
+from ..display.tables import news_table, print_json, print_jsonl
+from ..tracing import span
+
+app = typer.Typer()
+
+# Cache entry recording the last sync (its age decides staleness) and
+# whether older posts have been fetched back to the first one
+SYNC_KEY = "news_sync"
+_FIELDS = "id,date,modified,link,title,excerpt"
 
 
 def _strip_html(text: str) -> str:
     return unescape(re.sub(r"<[^>]+>", "", text))
 
 
-def news_command(
+def _parse_post(post: dict) -> dict:
+    """A WP_POSTS post as an article-store row."""
+    return {
+        "id": post["id"],
+        "date": post.get("date", ""),
+        "modified": post.get("modified") or post.get("date", ""),
+        "title": _strip_html(post.get("title", {}).get("rendered", "")),
+        "link": post.get("link", ""),
+        "excerpt": _strip_html(post.get("excerpt", {}).get("rendered", "")),
+    }
+
+
+def _article(row: dict) -> dict:
+    """A stored article as `ffb news` prints it."""
+    return {
+        "title": row["title"],
+        "date": row["date"][:10],
+        "link": row["link"],
+        "excerpt": row["excerpt"][:200],
+    }
+
+
+def _fetch_pages(params: dict, max_pages: int | None = None) -> tuple[list[dict], bool]:
+    """Every post matching `params` (up to `max_pages` pages), newest first,
+    and whether `max_pages` left some out.
+
+    The first page says how many there are; the rest are fetched
+    concurrently.
+    """
+    from ..api.client import get_client
+
+    client = get_client(require_auth=False)
+    params = {**params, "per_page": NEWS_PAGE_SIZE, "_fields": _FIELDS}
+    first = client.get(WP_POSTS, params)
+    total = int(first.headers.get("X-WP-TotalPages") or 1)
+    pages = total if max_pages is None else min(total, max_pages)
+    rest = client.get_many([(WP_POSTS, {**params, "page": n}) for n in range(2, pages + 1)])
+    posts = []
+    for resp in [first, *rest]:
+        posts += resp.json()
+    return posts, pages < total
+
+
+def _sync_news(limit: int = 10, force: bool = False) -> int:
+    """Bring the article store up to date for a query of the `limit` newest.
+
+    Nothing is fetched while the last sync is younger than CACHE_TTL_NEWS
+    and the store already holds `limit` articles. Otherwise only what's
+    missing is: posts modified since the last sync saw a change (at most
+    a store's worth), and, when fewer than `limit` are stored, the posts
+    before the oldest one. The store then keeps only the newest
+    NEWS_INDEX_DEPTH (or `limit`, if more) articles. Returns how many
+    articles were new.
+    """
+    with fetch_lock(SYNC_KEY):
+        return _sync_news_locked(limit, force)
+
+
+def _sync_news_locked(limit: int, force: bool) -> int:
+    count, oldest, newest = article_bounds()
+    # An emptied store (`cache clear --ns articles`) starts over
+    state = get_entry(SYNC_KEY) if count else None
+    fresh = state is not None and state.age <= CACHE_TTL_NEWS
+    complete = bool(state and state.payload.get("complete"))
+    if fresh and not force and (count >= limit or complete):
+        metrics.inc("ffb_cache_hits_total", ns="news")
+        return 0
+    keep = max(limit, NEWS_INDEX_DEPTH)
+    # The newest change a sync has seen. Not MAX(modified) of the store:
+    # edits to posts older than it are pruned again and would never count
+    since = (state.payload.get("modified") if state else None) or newest
+
+    with span("news.sync", stored=count) as s:
+        posts = []
+        if since and (force or not fresh):
+            changed, more = _fetch_pages(
+                {"modified_after": since}, max_pages=math.ceil(keep / NEWS_PAGE_SIZE)
+            )
+            if more:
+                # Only the newest `keep` of them: the store won't reach back to the first post
+                complete = False
+            since = max([since, *(p["modified"] for p in map(_parse_post, changed))])
+            posts += changed
+        if count < limit and not complete:
+            missing = limit - count
+            older, _ = _fetch_pages(
+                {"before": oldest} if oldest else {}, max_pages=math.ceil(missing / NEWS_PAGE_SIZE)
+            )
+            # A short answer means there's nothing older left
+            complete = len(older) < missing
+            posts += older
+        new = put_articles([_parse_post(p) for p in posts])
+        pruned = prune_articles(keep)
+        if pruned:
+            # The oldest posts are gone again, so the store no longer reaches the first one
+            complete = False
+        s.set(fetched=len(posts), new=new, pruned=pruned)
+
+    if state is None:
+        metrics.inc("ffb_cache_misses_total", ns="news")
+    else:
+        metrics.inc("ffb_cache_revalidations_total", ns="news", result="modified" if new else "not_modified")
+    set_cached(SYNC_KEY, {"complete": complete, "modified": since or article_bounds()[2]}, CACHE_TTL_NEWS)
+    return new
+
+
+def _fetch_news(limit: int = 10, force: bool = False) -> list[dict]:
+    _sync_news(limit, force)
+    return [_article(row) for row in recent_articles(limit)]
+
+
+def _player_news(player_names: list[str], limit: int = 3) -> list[list[dict]]:
+    """Recent articles naming each player, from the local full-text index.
+
+    One sync (usually none: the store is fresh) covers every player; each
+    lookup is then an index query for the full name as a phrase.
+    """
+    _sync_news(NEWS_INDEX_DEPTH)
+    return [
+        [
+            {"title": row["title"], "date": row["date"][:10], "link": row["link"]}
+            for row in search_articles(name, limit, phrase=True, newest_first=True)
+        ]
+        for name in player_names
+    ]
+
+
+def _output(articles: list[dict], output_json: bool, output_jsonl: bool) -> None:
+    if output_jsonl:
+        print_jsonl(articles)
+    elif output_json:
+        print_json(articles)
+    else:
+        news_table(articles)
+
+
+@app.callback(invoke_without_command=True)
+def news(
+    ctx: typer.Context,
     limit: int = typer.Option(10, "-n", "--limit", help="Number of articles"),
     output_json: bool = typer.Option(False, "--json", help="Output as JSON"),
+    output_jsonl: bool = typer.Option(False, "--jsonl", help="Output one JSON object per line"),
 ):
     """Show recent Fantasy Footballers articles. No login required.
 
     \b
-    Fetches the latest posts with title, date, and link.
-    Results are cached for 30 minutes.
+    Articles are kept in a local store and read from it; the store is
+    synced at most every 30 minutes, fetching only posts that are new or
+    changed since the last sync (and older ones when -n asks for more).
 
     \b
     EXAMPLES:
       ffb news                  # latest 10 articles
       ffb news -n 5             # latest 5 articles
       ffb news --json           # JSON output
+      ffb news -n 50 --jsonl    # one article per line
+      ffb news search "waiver wire"   # full-text search of recent articles
     """
-    cache_key = f"news_{limit}"
-    cached = get_cached(cache_key, CACHE_TTL_NEWS)
+    if ctx.invoked_subcommand is not None:
+        return
 
-    if cached:
-        articles = cached
-    else:
-        client = get_client(require_auth=False)
-        resp = client.get(WP_POSTS, params={"per_page": limit, "_fields": "title,date,link,excerpt"})
-        raw = resp.json()
-
-        articles = []
-        for post in raw:
-            articles.append({
-                "title": _strip_html(post.get("title", {}).get("rendered", "")),
-                "date": post.get("date", "")[:10],
-                "link": post.get("link", ""),
-                "excerpt": _strip_html(post.get("excerpt", {}).get("rendered", ""))[:200],
-            })
-        set_cached(cache_key, articles)
+    articles = _fetch_news(limit)
 
     if not articles:
         typer.echo("No news articles found.")
         raise typer.Exit(0)
 
-    if output_json:
-        console.print_json(json.dumps(articles))
-    else:
-        news_table(articles)
+    _output(articles, output_json, output_jsonl)
+
+
+@app.command()
+def search(
+    query: str = typer.Argument(help="Words to look for in article titles and excerpts"),
+    limit: int = typer.Option(10, "-n", "--limit", help="Max results"),
+    newest: bool = typer.Option(False, "--newest", help="Newest first instead of best match first"),
+    output_json: bool = typer.Option(False, "--json", help="Output as JSON"),
+    output_jsonl: bool = typer.Option(False, "--jsonl", help="Output one JSON object per line"),
+):
+    """Search recent articles offline. No login required.
+
+    \b
+    Looks through the newest articles in the local store (synced first
+    if it is stale) with a full-text index. Every word must appear in the
+    title or excerpt; title matches rank higher.
+
+    \b
+    EXAMPLES:
+      ffb news search "waiver wire"
+      ffb news search "mahomes injury" --newest
+      ffb news search kelce -n 20 --json
+    """
+    _sync_news(NEWS_INDEX_DEPTH)
+    articles = [_article(row) for row in search_articles(query, limit, newest_first=newest)]
+
+    if not articles:
+        typer.echo("No matching articles found.")
+        raise typer.Exit(0)
+
+    _output(articles, output_json, output_jsonl)
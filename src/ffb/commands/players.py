@@ -1,16 +1,17 @@
-import json
-import re
-from html import unescape
+import sys
+import time
 
 import typer
-from thefuzz import fuzz
 from simple_term_menu import TerminalMenu
 
-from ..api.client import get_client
-from ..api.endpoints import PLAYER_SEARCH, WP_POSTS
-from ..cache.store import get_cached, set_cached
+from ..api.cached import cached_get, fetch_lock
+from ..api.endpoints import PLAYER_SEARCH
+from ..cache.store import entry_ts, get_cached_blob, set_cached_blob
 from ..config import CACHE_TTL_PLAYERS, VALID_POSITIONS
-from ..display.tables import player_search_table, player_info_card, console
+from ..display.tables import player_search_table, player_info_card, print_json, print_jsonl, console
+from ..engine.search import PlayerIndex
+from ..tracing import span
+from .news import _player_news
 
 app = typer.Typer(help="""Search for NFL players by name. No login required.
 
@@ -25,79 +26,91 @@ EXAMPLES:
   ffb players search "jefferson" -p WR      # filter by position
   ffb players search "smith" -t KC -n 5     # filter by team, limit results
   ffb players search "kelce" --json         # JSON output (no interactive menu)
+  ffb players search "smith" -n 50 --jsonl  # one player per line
   ffb players search "mahomes" -I           # table only, skip interactive menu
+  ffb players search "brown" -n 5 --news    # info card with news for every result
+  ffb players find                          # search as you type
+  ffb players find -p WR                    # ... among wide receivers
 """)
 
 
-def _strip_html(text: str) -> str:
-    return unescape(re.sub(r"<[^>]+>", "", text))
+def _unwrap_search_data(raw: dict | list) -> list[dict]:
+    # API returns {"error": "", "data": [...]}
+    return raw.get("data", raw) if isinstance(raw, dict) else raw
+
+
+def _fetch_player_data(force: bool = False) -> list[dict]:
+    # The 24h dataset rarely changes, so serve it stale and revalidate behind
+    return cached_get(
+        "player_search_data",
+        CACHE_TTL_PLAYERS,
+        PLAYER_SEARCH,
+        transform=_unwrap_search_data,
+        stale_while_revalidate=True,
+        force=force,
+    )
 
 
-def _fetch_player_data() -> list[dict]:
-    cache_key = "player_search_data"
-    cached = get_cached(cache_key, CACHE_TTL_PLAYERS)
-    if cached:
-        return cached
+def _load_index() -> PlayerIndex:
+    """Search index over player_search_data.
 
-    client = get_client(require_auth=False)
-    resp = client.get(PLAYER_SEARCH)
-    raw = resp.json()
-    # API returns {"error": "", "data": [...]}
-    data = raw.get("data", raw) if isinstance(raw, dict) else raw
-    set_cached(cache_key, data)
-    return data
-
-
-def _search_players(
-    query: str, players: list[dict], position: str | None, team: str | None, limit: int
-) -> list[dict]:
-    results = []
-    for p in players:
-        name = p.get("name", "")
-        if not name:
-            continue
-
-        pos = p.get("pos", "") or p.get("position", "")
-        tm = p.get("team", "")
-
-        if position and pos.upper() != position.upper():
-            continue
-        if team and tm.upper() != team.upper():
-            continue
-
-        score = max(
-            fuzz.token_sort_ratio(query.lower(), name.lower()),
-            fuzz.partial_ratio(query.lower(), name.lower()),
-        )
-        if score >= 55:
-            results.append({
-                "id": p.get("player_id"),
-                "name": name,
-                "position": pos,
-                "team": tm,
-                "status": p.get("status"),
-                "score": score,
-            })
-
-    results.sort(key=lambda x: x["score"], reverse=True)
-    return results[:limit]
+    Stored as an .npz blob next to the dataset and rebuilt only when the
+    dataset entry is newer, so a warm search never decodes the player list.
+    """
+    # Concurrent requests build the index once; the rest then read it
+    with fetch_lock("player_index"):
+        return _load_index_locked()
+
+
+def _load_index_locked() -> PlayerIndex:
+    data_ts = entry_ts("player_search_data")
+    index_ts = entry_ts("player_index")
+    if (
+        data_ts is not None
+        and index_ts is not None
+        and index_ts >= data_ts
+        and time.time() - data_ts <= CACHE_TTL_PLAYERS
+    ):
+        index = _read_index(index_ts)
+        if index is not None:
+            return index
+
+    players = _fetch_player_data()
+    index_ts = entry_ts("player_index")
+    if index_ts is not None and index_ts >= (entry_ts("player_search_data") or 0):
+        # Served stale while a background refresh runs: the index still matches
+        index = _read_index(index_ts)
+        if index is not None:
+            return index
+    with span("players.index", rows=len(players)):
+        index = PlayerIndex.build(players)
+    set_cached_blob("player_index", index.to_bytes(), CACHE_TTL_PLAYERS)
+    return index
+
+
+# Last index read, as (cache ts, index); reused by a long-running `ffb serve`
+_index_memo: tuple[float, PlayerIndex] | None = None
+
+
+def _read_index(index_ts: float) -> PlayerIndex | None:
+    global _index_memo
+    if _index_memo is not None and _index_memo[0] == index_ts:
+        return _index_memo[1]
+    blob = get_cached_blob("player_index")
+    if blob is None:
+        return None
+    with span("players.load", bytes=len(blob)):
+        _index_memo = (index_ts, PlayerIndex.from_bytes(blob))
+    return _index_memo[1]
 
 
 def _fetch_player_news(player_name: str, limit: int = 3) -> list[dict]:
-    client = get_client(require_auth=False)
-    resp = client.get(WP_POSTS, params={
-        "search": player_name,
-        "per_page": limit,
-        "_fields": "title,date,link",
-    })
-    articles = []
-    for post in resp.json():
-        articles.append({
-            "title": _strip_html(post.get("title", {}).get("rendered", "")),
-            "date": post.get("date", "")[:10],
-            "link": post.get("link", ""),
-        })
-    return articles
+    return _fetch_players_news([player_name], limit)[0]
+
+
+def _fetch_players_news(player_names: list[str], limit: int = 3) -> list[list[dict]]:
+    """Recent articles for each player, looked up in the local news index."""
+    return _player_news(player_names, limit)
 
 
 @app.command()
@@ -107,21 +120,39 @@ def search(
     team: str = typer.Option(None, "-t", "--team", help="Filter by team abbreviation"),
     limit: int = typer.Option(10, "-n", "--limit", help="Max results"),
     no_interactive: bool = typer.Option(False, "-I", "--no-interactive", help="Skip interactive selection menu"),
+    news: bool = typer.Option(
+        False, "--news", help="Include recent news for every result (no menu)"
+    ),
     output_json: bool = typer.Option(False, "--json", help="Output as JSON"),
+    output_jsonl: bool = typer.Option(False, "--jsonl", help="Output one JSON object per line"),
 ):
     """Search for players by name using fuzzy matching. No login required.
 
     Shows results in a table, then lets you select a player with arrow keys
     to view their info card with recent news articles."""
-    players = _fetch_player_data()
-    results = _search_players(query, players, position, team, limit)
+    index = _load_index()
+    with span("players.search", rows=len(index)) as s:
+        results = index.search(query, position, team, limit)
+        s.set(results=len(results))
 
     if not results:
         typer.echo("No matching players found.")
         raise typer.Exit(0)
 
+    if news:
+        for result, articles in zip(results, _fetch_players_news([r["name"] for r in results])):
+            result["news"] = articles
+
+    if output_jsonl:
+        print_jsonl(results)
+        return
     if output_json:
-        console.print_json(json.dumps(results))
+        print_json(results)
+        return
+
+    if news:
+        for result in results:
+            player_info_card(result, result["news"])
         return
 
     player_search_table(results)
@@ -147,3 +178,30 @@ def search(
     articles = _fetch_player_news(selected["name"])
     console.print()
     player_info_card(selected, articles)
+
+
+@app.command()
+def find(
+    position: str = typer.Option(None, "-p", "--position", help=f"Filter by position ({', '.join(VALID_POSITIONS)})"),
+    team: str = typer.Option(None, "-t", "--team", help="Filter by team abbreviation"),
+):
+    """Search as you type, then pick a player for their info card. No login required.
+
+    Results update on every keystroke, matching `ffb players search` for
+    the same query; deleting characters returns to results already
+    computed, and only the rows that changed are redrawn. Arrow keys move the selection, Enter shows the
+    player's info card with recent news, Esc quits."""
+    if not (sys.stdin.isatty() and sys.stdout.isatty()):
+        typer.echo("Error: 'ffb players find' needs an interactive terminal. Use 'ffb players search'.", err=True)
+        raise typer.Exit(1)
+
+    from ..tui.finder import find_player
+
+    index = _load_index()
+    with span("players.find", rows=len(index)) as s:
+        selected, stats = find_player(index, position, team)
+        s.set(**stats)
+
+    if selected is None:
+        return
+    player_info_card(selected, _fetch_player_news(selected["name"]))
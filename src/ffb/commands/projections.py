@@ -1,11 +1,10 @@
-import json
 
 import typer
 
 from ..api.client import AuthExpiredError
 from ..config import DEFAULT_SCORING, VALID_POSITIONS
-from ..display.tables import projections_table, console
-from .rankings import _fetch_projections
+from ..display.tables import projections_table, print_json, print_jsonl
+from .rankings import _consensus_options, _fetch_projections
 
 
 def projections_command(
@@ -13,7 +12,15 @@ def projections_command(
     scoring: str = typer.Option(DEFAULT_SCORING, "-s", "--scoring", help="Scoring format (half/ppr/standard)"),
     week: int = typer.Option(None, "-w", "--week", help="Week number"),
     limit: int = typer.Option(25, "-n", "--limit", help="Max results"),
+    consensus: str = typer.Option(
+        "mean", "--consensus", help="Combine analysts by mean, median, trimmed or weighted"
+    ),
+    weights: str = typer.Option(
+        None, "--weights", help='Analyst weights for --consensus weighted (e.g. "andy=2,mike=1")'
+    ),
+    spread: bool = typer.Option(False, "--spread", help="Show analyst spread (stddev, min-max)"),
     output_json: bool = typer.Option(False, "--json", help="Output as JSON"),
+    output_jsonl: bool = typer.Option(False, "--jsonl", help="Output one JSON object per line"),
 ):
     """View detailed stat projections by position. Requires login.
 
@@ -24,15 +31,19 @@ def projections_command(
     \b
     SCORING FORMATS: half (default), ppr, standard
     POSITIONS:       QB, RB, WR, TE, K, DST
+    CONSENSUS:       mean (default), median, trimmed, weighted
 
     \b
     EXAMPLES:
       ffb projections QB               # QB stat projections
       ffb projections RB -s ppr -n 15  # top 15 RB projections, PPR
       ffb projections --json           # all positions, JSON output
+      ffb projections -n 1000 --jsonl  # one player per line
+      ffb projections TE --consensus trimmed --spread
     """
+    analyst_weights = _consensus_options(consensus, weights)
     try:
-        players = _fetch_projections(scoring)
+        players = _fetch_projections(scoring, consensus, analyst_weights, spread)
     except AuthExpiredError:
         typer.echo("Session expired. Run `ffb login` to re-authenticate.", err=True)
         raise typer.Exit(1)
@@ -47,7 +58,9 @@ def projections_command(
         typer.echo("No projections found for the given filters.")
         raise typer.Exit(0)
 
-    if output_json:
-        console.print_json(json.dumps(players))
+    if output_jsonl:
+        print_jsonl(players)
+    elif output_json:
+        print_json(players)
     else:
         projections_table(players, scoring)
@@ -1,128 +1,237 @@
 import json
+import sys
+import time
 from collections import defaultdict
 
+import numpy as np
 import typer
 
-from ..api.client import get_client, AuthExpiredError
+from ..api.cached import cached_get, fetch_lock
+from ..api.client import AuthExpiredError
 from ..api.endpoints import UDK_PROJECTIONS
-from ..cache.store import get_cached, set_cached
-from ..config import CACHE_TTL_PROJECTIONS, SCORING_FORMATS, DEFAULT_SCORING, VALID_POSITIONS
-from ..display.tables import rankings_table, console
-
-# Points per stat by scoring format
-POINTS_CONFIG = {
-    "HALF": {"pass_yd": 0.04, "pass_td": 4, "int": -2, "rush_yd": 0.1, "rush_td": 6, "rec": 0.5, "rec_yd": 0.1, "rec_td": 6, "fum": -2},
-    "PPR":  {"pass_yd": 0.04, "pass_td": 4, "int": -2, "rush_yd": 0.1, "rush_td": 6, "rec": 1.0, "rec_yd": 0.1, "rec_td": 6, "fum": -2},
-    "STD":  {"pass_yd": 0.04, "pass_td": 4, "int": -2, "rush_yd": 0.1, "rush_td": 6, "rec": 0.0, "rec_yd": 0.1, "rec_td": 6, "fum": -2},
-}
-
-
-def _calc_points(proj: dict, scoring_key: str) -> float:
-    cfg = POINTS_CONFIG.get(scoring_key, POINTS_CONFIG["HALF"])
-    return (
-        _num(proj.get("passing_yards")) * cfg["pass_yd"]
-        + _num(proj.get("passing_touchdowns")) * cfg["pass_td"]
-        + _num(proj.get("interceptions_thrown")) * cfg["int"]
-        + _num(proj.get("rushing_yards")) * cfg["rush_yd"]
-        + _num(proj.get("rushing_touchdowns")) * cfg["rush_td"]
-        + _num(proj.get("receptions")) * cfg["rec"]
-        + _num(proj.get("receiving_yards")) * cfg["rec_yd"]
-        + _num(proj.get("receiving_touchdowns")) * cfg["rec_td"]
-        + _num(proj.get("fumbles_lost")) * cfg["fum"]
+from ..cache.store import entry_ts, get_cached_blob, set_cached_blob
+from ..config import CACHE_MAX_STALE_PROJECTIONS, CACHE_TTL_PROJECTIONS, SCORING_FORMATS, DEFAULT_SCORING, VALID_POSITIONS
+from ..display.tables import rankings_table, rankings_compare_table, print_json, print_jsonl
+from ..engine.projections import (
+    CONSENSUS_METHODS,
+    AnalystWeightError,
+    ProjectionFrame,
+    round1,
+    score,
+    weight_vector,
+)
+from ..tracing import span, traced
+
+
+def _scoring_key(scoring: str) -> str:
+    return SCORING_FORMATS.get(scoring, scoring.upper())
+
+
+def _fetch_raw_projections(force: bool = False, changed_only: bool = False) -> dict | None:
+    """Per-analyst projections and tier breakpoints, cached once for all formats.
+
+    The analyst stat lines don't depend on the scoring format (points are
+    computed locally from POINTS_CONFIG), so one response serves half, PPR
+    and standard alike. `changed_only` is cached_get's: None unless a new
+    response was downloaded.
+    """
+    return cached_get(
+        "projections_raw",
+        CACHE_TTL_PROJECTIONS,
+        UDK_PROJECTIONS,
+        params={"scoring": SCORING_FORMATS[DEFAULT_SCORING]},
+        transform=_unwrap_projections,
+        require_auth=True,
+        stale_while_revalidate=True,
+        max_stale=CACHE_MAX_STALE_PROJECTIONS,
+        force=force,
+        changed_only=changed_only,
     )
 
 
-def _num(val) -> float:
-    if val is None:
-        return 0.0
-    try:
-        return float(val)
-    except (ValueError, TypeError):
-        return 0.0
-
-
-def _fetch_projections(scoring: str) -> list[dict]:
-    scoring_key = SCORING_FORMATS.get(scoring, scoring.upper())
-    cache_key = f"projections_{scoring_key}"
-    cached = get_cached(cache_key, CACHE_TTL_PROJECTIONS)
-    if cached:
-        return cached
-
-    client = get_client(require_auth=True)
-    resp = client.get(UDK_PROJECTIONS, params={"scoring": scoring_key})
-    outer = resp.json()
-
+def _unwrap_projections(outer: dict) -> dict:
     # API returns {"json": "<double-encoded JSON string>"}
     raw_json = outer.get("json", outer)
     if isinstance(raw_json, str):
-        import json as json_mod
-        inner = json_mod.loads(raw_json)
+        with span("projections.unwrap", bytes=len(raw_json)):
+            inner = json.loads(raw_json)
     else:
         inner = raw_json
+    return {
+        "projections": inner.get("projections", []),
+        "tiers": inner.get("tiers", {}),
+    }
 
-    raw_projs = inner.get("projections", [])
-    tiers_data = inner.get("tiers", {})
-
-    # Average projections across analysts for each player
-    by_player: dict[str, list[dict]] = defaultdict(list)
-    player_meta: dict[str, dict] = {}
-    for p in raw_projs:
-        pid = p.get("player_id", "")
-        by_player[pid].append(p)
-        if pid not in player_meta:
-            player_meta[pid] = {
-                "player_name": p.get("name", ""),
-                "position": p.get("fantasy_position", ""),
-                "team": p.get("team", ""),
-                "bye_week": p.get("bye_week", ""),
-            }
 
-    stat_fields = [
-        "passing_yards", "passing_touchdowns", "interceptions_thrown",
-        "rushing_yards", "rushing_touchdowns",
-        "receptions", "receiving_yards", "receiving_touchdowns",
-        "fumbles_lost",
-    ]
+def _load_frame() -> ProjectionFrame:
+    """Per-analyst projections in columnar form.
+
+    The frame is cached as an .npz blob next to projections_raw and only
+    rebuilt when that entry changes, so repeated consensus variants skip
+    both the network and JSON decoding.
+    """
+    # Concurrent requests build the frame once; the rest then read it
+    with fetch_lock("projections_frame"):
+        return _load_frame_locked()
+
+
+def _load_frame_locked() -> ProjectionFrame:
+    raw_ts = entry_ts("projections_raw")
+    frame_ts = entry_ts("projections_frame")
+    raw = None
+    if raw_ts is not None and frame_ts is not None and frame_ts >= raw_ts:
+        # Past the TTL, freshness is _fetch_raw_projections' call (it may
+        # serve the entry stale while it refreshes); None means nothing new
+        if time.time() - raw_ts > CACHE_TTL_PROJECTIONS:
+            raw = _fetch_raw_projections(changed_only=True)
+        if raw is None:
+            frame = _read_frame(frame_ts)
+            if frame is not None:
+                return frame
+
+    if raw is None:
+        raw = _fetch_raw_projections()
+    with span("projections.frame", rows=len(raw["projections"])):
+        frame = ProjectionFrame.from_raw(raw["projections"], raw["tiers"])
+    set_cached_blob("projections_frame", frame.to_bytes(), CACHE_TTL_PROJECTIONS)
+    return frame
+
+
+# Last frame read, as (cache ts, frame); reused by a long-running `ffb serve`
+_frame_memo: tuple[float, ProjectionFrame] | None = None
+
+
+def _read_frame(frame_ts: float) -> ProjectionFrame | None:
+    global _frame_memo
+    if _frame_memo is not None and _frame_memo[0] == frame_ts:
+        return _frame_memo[1]
+    blob = get_cached_blob("projections_frame")
+    if blob is None:
+        return None
+    with span("projections.load", bytes=len(blob)):
+        _frame_memo = (frame_ts, ProjectionFrame.from_bytes(blob))
+    return _frame_memo[1]
+
+
+def _fetch_projections(
+    scoring: str,
+    consensus: str = "mean",
+    weights: dict[str, float] | None = None,
+    spread: bool = False,
+) -> list[dict]:
+    return _fetch_projections_multi([scoring], consensus, weights, spread)[scoring]
+
+
+def _fetch_projections_multi(
+    scorings: list[str],
+    consensus: str = "mean",
+    weights: dict[str, float] | None = None,
+    spread: bool = False,
+) -> dict[str, list[dict]]:
+    """Ranked, tiered players for several scoring formats from one pass.
+
+    Analyst lines are reduced once per call: for "mean" the averaged stats
+    are scored; other methods reduce the stat columns and every format's
+    per-analyst points together, so e.g. a median ranking is the median of
+    the analysts' points. With `spread`, each player also gets the stddev
+    and min/max of those per-analyst points.
+    """
+    frame = _load_frame()
+    keys = [_scoring_key(s) for s in scorings]
+    weight_matrix = np.stack([weight_vector(k) for k in keys], axis=1)
+
+    with span("projections.score", rows=len(frame.stats), formats=len(keys), consensus=consensus):
+        line_points = score(frame.stats, weight_matrix) if consensus != "mean" or spread else None
+        if consensus == "mean":
+            avg = frame.mean()
+            points = score(avg, weight_matrix)
+        else:
+            n_fields = frame.stats.shape[1]
+            try:
+                reduced = frame.consensus(consensus, np.hstack([frame.stats, line_points]), weights)
+            except AnalystWeightError as e:
+                typer.echo(str(e), err=True)
+                raise typer.Exit(1)
+            avg, points = reduced[:, :n_fields], reduced[:, n_fields:]
+
+        spreads = frame.spread(line_points) if spread else None
+
+    # Display stats are format-independent, so build them once
+    stat_cols = [dict(zip(_STAT_KEYS, row)) for row in round1(avg[:, :len(_STAT_KEYS)]).tolist()]
+    return {
+        scoring: _build_players(
+            frame.meta, stat_cols, points[:, i], frame.tiers, keys[i],
+            spread=tuple(a[:, i] for a in spreads) if spreads else None,
+        )
+        for i, scoring in enumerate(scorings)
+    }
+
+
+# Output keys for the leading STAT_FIELDS columns (fumbles_lost isn't shown)
+_STAT_KEYS = ["pass_yds", "pass_tds", "ints", "rush_yds", "rush_tds", "receptions", "rec_yds", "rec_tds"]
+
+
+@traced("rankings.build")
+def _build_players(
+    meta: list[dict],
+    stat_cols: list[dict],
+    points: np.ndarray,
+    tiers_data: dict,
+    scoring_key: str,
+    spread: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None,
+) -> list[dict]:
+    rounded = round1(points)
+    rounded_pts = rounded.tolist()
+    # Sort by points descending, assign overall rank (stable, like list.sort)
+    order = np.argsort(-rounded, kind="stable").tolist()
+    if spread:
+        sd, lo, hi = (round1(a).tolist() for a in spread)
 
     players = []
-    for pid, entries in by_player.items():
-        meta = player_meta[pid]
-        # Average stats across analysts
-        avg = {}
-        for field in stat_fields:
-            vals = [_num(e.get(field)) for e in entries]
-            avg[field] = sum(vals) / len(vals) if vals else 0.0
-
-        points = _calc_points(avg, scoring_key)
-        players.append({
-            "player_id": pid,
-            "player_name": meta["player_name"],
-            "position": meta["position"],
-            "team": meta["team"],
-            "bye_week": meta["bye_week"],
-            "points": round(points, 1),
-            "pass_yds": round(avg["passing_yards"], 1),
-            "pass_tds": round(avg["passing_touchdowns"], 1),
-            "ints": round(avg["interceptions_thrown"], 1),
-            "rush_yds": round(avg["rushing_yards"], 1),
-            "rush_tds": round(avg["rushing_touchdowns"], 1),
-            "receptions": round(avg["receptions"], 1),
-            "rec_yds": round(avg["receiving_yards"], 1),
-            "rec_tds": round(avg["receiving_touchdowns"], 1),
-        })
-
-    # Sort by points descending, assign overall rank
-    players.sort(key=lambda p: -p["points"])
-    for i, p in enumerate(players, 1):
-        p["rank"] = i
+    for rank, i in enumerate(order, 1):
+        player = {
+            **meta[i],
+            "points": rounded_pts[i],
+            **stat_cols[i],
+            "rank": rank,
+        }
+        if spread:
+            player.update(points_sd=sd[i], points_min=lo[i], points_max=hi[i])
+        players.append(player)
 
     # Assign tiers per position using tier breakpoints
-    _assign_tiers(players, tiers_data, scoring_key)
-
-    set_cached(cache_key, players)
+    with span("rankings.tiers", rows=len(players)):
+        _assign_tiers(players, tiers_data, scoring_key)
     return players
 
 
+def _consensus_options(consensus: str, weights: str | None) -> dict[str, float] | None:
+    """Validate --consensus and parse --weights ("andy=2,mike=1")."""
+    if consensus not in CONSENSUS_METHODS:
+        typer.echo(
+            f"Unknown consensus method: {consensus}. Choose from {', '.join(CONSENSUS_METHODS)}.",
+            err=True,
+        )
+        raise typer.Exit(1)
+    if not weights:
+        if consensus == "weighted":
+            typer.echo('--consensus weighted needs --weights (e.g. "andy=2,mike=1").', err=True)
+            raise typer.Exit(1)
+        return None
+    parsed = {}
+    for item in weights.split(","):
+        name, _, value = item.partition("=")
+        try:
+            parsed[name.strip()] = float(value)
+        except ValueError:
+            typer.echo(f"Invalid analyst weight: {item.strip()!r} (expected name=number)", err=True)
+            raise typer.Exit(1)
+        if not parsed[name.strip()] >= 0:
+            typer.echo(f"Invalid analyst weight: {item.strip()!r} (weights can't be negative)", err=True)
+            raise typer.Exit(1)
+    return parsed
+
+
 def _assign_tiers(players: list[dict], tiers_data: dict, scoring_key: str) -> None:
     """Assign tier numbers based on tier breakpoint data."""
     # Group by position
@@ -164,16 +273,35 @@ def rankings_command(
     scoring: str = typer.Option(DEFAULT_SCORING, "-s", "--scoring", help="Scoring format (half/ppr/standard)"),
     limit: int = typer.Option(25, "-n", "--limit", help="Max results"),
     tier: int = typer.Option(None, "--tier", help="Filter by tier"),
+    compare: str = typer.Option(
+        None, "--compare",
+        help="Compare scoring formats side by side (comma-separated, e.g. half,ppr,standard)",
+    ),
+    consensus: str = typer.Option(
+        "mean", "--consensus", help="Combine analysts by mean, median, trimmed or weighted"
+    ),
+    weights: str = typer.Option(
+        None, "--weights", help='Analyst weights for --consensus weighted (e.g. "andy=2,mike=1")'
+    ),
+    spread: bool = typer.Option(False, "--spread", help="Show analyst spread (stddev, min-max)"),
+    tui: bool = typer.Option(
+        False, "--tui", help="Browse the whole board interactively: scroll, sort, filter, find"
+    ),
     output_json: bool = typer.Option(False, "--json", help="Output as JSON"),
+    output_jsonl: bool = typer.Option(False, "--jsonl", help="Output one JSON object per line"),
 ):
     """View player rankings by position and scoring format. Requires login.
 
     \b
     Shows ranked players with tier, projected points, and bye week.
+    All scoring formats are derived from one cached projections download,
+    so switching formats or comparing them costs no extra requests.
 
     \b
     SCORING FORMATS: half (default), ppr, standard
     POSITIONS:       QB, RB, WR, TE, K, DST
+    CONSENSUS:       mean (default), median, trimmed (drops each player's
+                     high and low analyst), weighted (see --weights)
 
     \b
     EXAMPLES:
@@ -181,9 +309,26 @@ def rankings_command(
       ffb rankings QB -s ppr -n 10     # top 10 QBs, PPR scoring
       ffb rankings RB --tier 1         # tier 1 RBs only
       ffb rankings WR --json           # JSON output
+      ffb rankings -n 500 --jsonl      # one player per line
+      ffb rankings RB --compare half,ppr,standard   # rank/tier/points per format
+      ffb rankings WR --consensus median --spread   # median of analysts, with spread
+      ffb rankings --tui               # browse the whole board interactively
     """
+    analyst_weights = _consensus_options(consensus, weights)
+    if tui:
+        _tui_command(scoring, position, tier, consensus, analyst_weights, spread, compare)
+        return
+    if compare:
+        if spread:
+            typer.echo("Error: --spread can't be combined with --compare.", err=True)
+            raise typer.Exit(1)
+        _compare_command(
+            compare, position, limit, tier, output_json, output_jsonl, consensus, analyst_weights
+        )
+        return
+
     try:
-        players = _fetch_projections(scoring)
+        players = _fetch_projections(scoring, consensus, analyst_weights, spread)
     except AuthExpiredError:
         typer.echo("Session expired. Run `ffb login` to re-authenticate.", err=True)
         raise typer.Exit(1)
@@ -203,7 +348,105 @@ def rankings_command(
         typer.echo("No rankings found for the given filters.")
         raise typer.Exit(0)
 
-    if output_json:
-        console.print_json(json.dumps(players))
+    if output_jsonl:
+        print_jsonl(players)
+    elif output_json:
+        print_json(players)
     else:
         rankings_table(players, scoring)
+
+
+def _tui_command(
+    scoring: str,
+    position: str | None,
+    tier: int | None,
+    consensus: str,
+    analyst_weights: dict[str, float] | None,
+    spread: bool,
+    compare: str | None,
+) -> None:
+    if compare:
+        typer.echo("Error: --tui can't be combined with --compare.", err=True)
+        raise typer.Exit(1)
+    if position and position.upper() not in VALID_POSITIONS:
+        typer.echo(f"Unknown position: {position}. Choose from {', '.join(VALID_POSITIONS)}.", err=True)
+        raise typer.Exit(1)
+    if not (sys.stdin.isatty() and sys.stdout.isatty()):
+        typer.echo("Error: --tui needs an interactive terminal.", err=True)
+        raise typer.Exit(1)
+
+    try:
+        players = _fetch_projections(scoring, consensus, analyst_weights, spread)
+    except AuthExpiredError:
+        typer.echo("Session expired. Run `ffb login` to re-authenticate.", err=True)
+        raise typer.Exit(1)
+
+    from ..tui.board import browse_rankings
+
+    # The whole board is loaded once; --limit doesn't apply, and -p/--tier
+    # are only where browsing starts
+    with span("rankings.tui", rows=len(players)) as s:
+        s.set(**browse_rankings(players, scoring, position and position.upper(), tier, spread))
+
+
+def _compare_command(
+    compare: str,
+    position: str | None,
+    limit: int,
+    tier: int | None,
+    output_json: bool,
+    output_jsonl: bool,
+    consensus: str,
+    analyst_weights: dict[str, float] | None,
+) -> None:
+    formats = [f.strip().lower() for f in compare.split(",") if f.strip()]
+    unknown = [f for f in formats if f not in SCORING_FORMATS]
+    if unknown or not formats:
+        typer.echo(
+            f"Unknown scoring format: {', '.join(unknown) or compare!r}. "
+            f"Choose from {', '.join(SCORING_FORMATS)}.",
+            err=True,
+        )
+        raise typer.Exit(1)
+
+    try:
+        by_format = _fetch_projections_multi(formats, consensus, analyst_weights)
+    except AuthExpiredError:
+        typer.echo("Session expired. Run `ffb login` to re-authenticate.", err=True)
+        raise typer.Exit(1)
+
+    # One row per player, ordered by the first format's ranking
+    rows: dict[str, dict] = {}
+    for fmt in formats:
+        players = by_format[fmt]
+        if position:
+            players = [p for p in players if p.get("position", "").upper() == position.upper()]
+        for i, p in enumerate(players, 1):
+            row = rows.setdefault(p["player_id"], {
+                "player_id": p["player_id"],
+                "player_name": p["player_name"],
+                "position": p["position"],
+                "team": p["team"],
+                "bye_week": p["bye_week"],
+            })
+            row[fmt] = {
+                "rank": i if position else p["rank"],
+                "tier": p.get("tier"),
+                "points": p["points"],
+            }
+
+    compared = list(rows.values())
+    if tier is not None:
+        compared = [r for r in compared if r[formats[0]]["tier"] == tier]
+    compared = compared[:limit]
+
+    if not compared:
+        typer.echo("No rankings found for the given filters.")
+        raise typer.Exit(0)
+
+    if output_jsonl:
+        print_jsonl(compared)
+    elif output_json:
+        print_json(compared)
+    else:
+        rankings_compare_table(compared, formats)
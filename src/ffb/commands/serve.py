@@ -0,0 +1,46 @@
+import typer
+
+from .. import daemon
+from ..config import SOCKET_PATH
+
+
+def serve_command(
+    stop: bool = typer.Option(False, "--stop", help="Stop the running daemon"),
+    status: bool = typer.Option(False, "--status", help="Check whether the daemon is running"),
+):
+    """Keep a warm ffb process running to answer --json commands fast.
+
+    \b
+    Holds imports, the login session and decoded cache entries in memory
+    and listens on a Unix socket (~/.config/ffb/ffb.sock). While it runs,
+    `ffb ... --json` invocations of players, rankings, projections, trade,
+    start-sit and news are forwarded to it automatically; everything else
+    (interactive menus, prompts, stdin input) still runs locally.
+
+    \b
+    EXAMPLES:
+      ffb serve &                      # start in the background
+      ffb serve --status               # is it running?
+      ffb serve --stop                 # shut it down
+    """
+    if stop:
+        if daemon.stop():
+            typer.echo("Stopped ffb serve.")
+        else:
+            typer.echo("ffb serve is not running.")
+        return
+
+    if status:
+        running = daemon.is_running()
+        typer.echo(f"ffb serve is {'running' if running else 'not running'} ({SOCKET_PATH}).")
+        raise typer.Exit(0 if running else 1)
+
+    if daemon.is_running():
+        typer.echo(f"ffb serve is already running ({SOCKET_PATH}).", err=True)
+        raise typer.Exit(1)
+
+    typer.echo(f"Listening on {SOCKET_PATH} (Ctrl-C to stop)", err=True)
+    try:
+        daemon.serve()
+    except KeyboardInterrupt:
+        pass
@@ -1,11 +1,10 @@
-import json
 from typing import Annotated
 
 import typer
 
 from ..api.client import get_client, AuthExpiredError
 from ..api.endpoints import START_SIT
-from ..display.tables import startsit_table, console
+from ..display.tables import startsit_table, print_json
 
 
 def startsit_command(
@@ -49,6 +48,6 @@ def startsit_command(
         raise typer.Exit(0)
 
     if output_json:
-        console.print_json(json.dumps(data))
+        print_json(data)
     else:
         startsit_table(data)
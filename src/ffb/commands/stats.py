@@ -0,0 +1,64 @@
+import sys
+
+import typer
+
+from .. import metrics
+from ..cache.store import clear_metrics
+from ..config import METRICS_ENABLED
+from ..display.tables import stats_tables, print_json
+
+
+def stats_command(
+    prom: str = typer.Option(
+        None, "--prom", help="Write all counters as a Prometheus textfile to this path (- for stdout)"
+    ),
+    reset: bool = typer.Option(False, "--reset", help="Zero every counter"),
+    output_json: bool = typer.Option(False, "--json", help="Output as JSON"),
+):
+    """Show cache and HTTP counters collected across all ffb runs. No login required.
+
+    \b
+    Every invocation adds to persistent counters in the cache database:
+    cache hits, misses, stale serves and 304 revalidations per namespace,
+    bytes read and written, and HTTP requests, latency and 401/403
+    responses per endpoint. A low hit rate with mostly-304 revalidations
+    suggests a TTL in config.py could be longer.
+
+    \b
+    --prom writes the node_exporter textfile format; set
+    FFB_METRICS_TEXTFILE to have every run keep that file current.
+    FFB_METRICS=0 stops recording.
+
+    \b
+    EXAMPLES:
+      ffb stats                                  # summary tables
+      ffb stats --json                           # summary as JSON
+      ffb stats --prom /var/lib/node_exporter/textfile/ffb.prom
+      ffb stats --reset                          # start counting afresh
+    """
+    if reset:
+        clear_metrics()
+        typer.echo("Metrics reset.")
+        return
+
+    if prom:
+        if prom == "-":
+            sys.stdout.write(metrics.exposition(metrics.load()))
+        else:
+            metrics.flush()
+            try:
+                metrics.write_textfile(prom)
+            except OSError as e:
+                typer.echo(f"Could not write {prom}: {e.strerror}", err=True)
+                raise typer.Exit(1)
+            typer.echo(f"Wrote {prom}")
+        return
+
+    summary = metrics.summarize(metrics.load())
+    if output_json:
+        print_json(summary)
+    elif not summary["cache"] and not summary["http"]:
+        note = "" if METRICS_ENABLED else " (recording is off: FFB_METRICS=0)"
+        typer.echo(f"No metrics recorded yet{note}.")
+    else:
+        stats_tables(summary)
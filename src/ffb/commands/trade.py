@@ -1,47 +1,69 @@
 import json
 import re
+import sys
+from collections.abc import Iterable, Iterator
 
 import typer
-from thefuzz import fuzz
 
+from ..api.cached import fetch_lock
 from ..api.client import get_client, AuthExpiredError
 from ..api.endpoints import TRADE_ANALYZER_PAGE
-from ..display.tables import trade_table, console
+from ..cache.store import get_cached, set_cached
+from ..config import CACHE_TTL_TRADE
+from ..display.tables import trade_table, trade_find_table, print_json, print_jsonl
+from ..engine.search import NameIndex
+from ..engine.trades import find_packages
+from ..tracing import span
 
 
-def _fetch_trade_values(client) -> list[dict]:
-    """Scrape trade values from the trade analyzer page HTML."""
-    html = client.get_page(TRADE_ANALYZER_PAGE)
+app = typer.Typer()
 
+
+class UnknownPlayerError(Exception):
+    pass
+
+
+def _fetch_trade_values(refresh: bool = False) -> list[dict]:
+    """Normalized trade values, scraped from the trade analyzer page at most once per TTL."""
+    with fetch_lock("trade_values"):
+        data = None if refresh else get_cached("trade_values", CACHE_TTL_TRADE)
+        if data is None:
+            client = get_client(require_auth=True)
+            data = _parse_trade_page(client.get_page(TRADE_ANALYZER_PAGE))
+            if data["projections"] or data["dynastyProjections"]:
+                set_cached("trade_values", data, CACHE_TTL_TRADE)
+
+    # In-season: "projections" has data. Offseason: "dynastyProjections" has data.
+    players = data["projections"] or data["dynastyProjections"]
+    if not players:
+        typer.echo("No trade value data available.", err=True)
+        raise typer.Exit(1)
+    return players
+
+
+def _parse_trade_page(html: str) -> dict:
+    """Extract both value lists from the trade analyzer page HTML."""
     # Data is at: window.tool.tradeAnalyzer.data = {...};
     match = re.search(r'window\.tool\.tradeAnalyzer\.data\s*=\s*(\{)', html)
     if not match:
         typer.echo("Could not find trade analyzer data on page.", err=True)
         raise typer.Exit(1)
 
-    # Brace-match to extract the full JSON object
-    start = match.start(1)
-    depth = 0
-    for i, c in enumerate(html[start:]):
-        if c == '{':
-            depth += 1
-        elif c == '}':
-            depth -= 1
-        if depth == 0:
-            raw = html[start:start + i + 1]
-            break
-    else:
+    # Decode in place; raw_decode stops at the end of the object
+    try:
+        with span("trade.parse", bytes=len(html)):
+            data, _ = json.JSONDecoder().raw_decode(html, match.start(1))
+    except json.JSONDecodeError:
         typer.echo("Could not parse trade analyzer data.", err=True)
         raise typer.Exit(1)
 
-    data = json.loads(raw)
+    return {
+        "projections": _normalize_values(data.get("projections") or []),
+        "dynastyProjections": _normalize_values(data.get("dynastyProjections") or []),
+    }
 
-    # In-season: "projections" has data. Offseason: "dynastyProjections" has data.
-    players = data.get("projections") or data.get("dynastyProjections") or []
-    if not players:
-        typer.echo("No trade value data available.", err=True)
-        raise typer.Exit(1)
 
+def _normalize_values(players: list[dict]) -> list[dict]:
     # Normalize into a consistent format with "value" based on fantasy_points
     result = []
     for p in players:
@@ -55,26 +77,96 @@ def _fetch_trade_values(client) -> list[dict]:
     return result
 
 
-def _find_player(query: str, values: list[dict]) -> dict | None:
-    best_score = 0
-    best_match = None
-    for v in values:
-        name = v.get("player_name", "")
-        score = max(
-            fuzz.token_sort_ratio(query.lower(), name.lower()),
-            fuzz.partial_ratio(query.lower(), name.lower()),
-        )
-        if score > best_score:
-            best_score = score
-            best_match = v
-    if best_score >= 60:
-        return best_match
-    return None
+def _find_player(query: str, values: list[dict], names: NameIndex) -> dict | None:
+    i = names.best(query, min_score=60)
+    return values[i] if i is not None else None
+
+
+def _resolve(name: str, values: list[dict], names: NameIndex) -> dict:
+    player = _find_player(name, values, names)
+    if not player:
+        raise UnknownPlayerError(name)
+    return player
+
+
+def _analysis(give_players: list[dict], get_players: list[dict]) -> dict:
+    give_total = sum(p["value"] for p in give_players)
+    get_total = sum(p["value"] for p in get_players)
+    return {
+        "give_players": give_players,
+        "get_players": get_players,
+        "give_total": give_total,
+        "get_total": get_total,
+        "difference": get_total - give_total,
+    }
+
+
+def _analyze(give_names: list[str], get_names: list[str], values: list[dict], names: NameIndex) -> dict:
+    """Trade totals for both sides. Raises UnknownPlayerError for an unmatched name."""
+    give_players = [_resolve(n, values, names) for n in give_names]
+    get_players = [_resolve(n, values, names) for n in get_names]
+    return _analysis(give_players, get_players)
+
+
+def _split_names(names: str | list) -> list[str]:
+    if isinstance(names, str):
+        names = names.split(",")
+    return [n.strip() for n in names if n.strip()]
+
+
+def _batch_results(lines: Iterable[str], values: list[dict], names: NameIndex) -> Iterator[dict]:
+    """One result per proposal line, yielded as each is analyzed.
+
+    A proposal is {"give": ..., "get": ...} with comma-separated names or
+    lists; an "id" is echoed back. Bad lines produce {"error": ...} so
+    output line N always answers input line N.
+    """
+    for lineno, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        proposal = None
+        try:
+            proposal = json.loads(line)
+            give = _split_names(proposal.get("give") or [])
+            get = _split_names(proposal.get("get") or [])
+            if give and get:
+                result = _analyze(give, get, values, names)
+            else:
+                result = {"error": f"Line {lineno}: give and get are both required"}
+        except (json.JSONDecodeError, AttributeError, TypeError):
+            result = {"error": f"Line {lineno}: expected a JSON object with give/get"}
+        except UnknownPlayerError as e:
+            result = {"error": f"Could not find player: {e}"}
+        if isinstance(proposal, dict) and "id" in proposal:
+            result = {"id": proposal["id"], **result}
+        yield result
+
+
+def _run_batch(path: str, values: list[dict], names: NameIndex) -> None:
+    """Analyze one proposal per JSON line, writing each result as a JSON
+    line as soon as it's ready."""
+    try:
+        source = sys.stdin if path == "-" else open(path)
+    except OSError as e:
+        typer.echo(f"Could not read {path}: {e.strerror}", err=True)
+        raise typer.Exit(1)
+
+    try:
+        print_jsonl(_batch_results(source, values, names))
+    finally:
+        if source is not sys.stdin:
+            source.close()
 
 
-def trade_command(
+@app.callback(invoke_without_command=True)
+def trade(
+    ctx: typer.Context,
     give: str = typer.Option(None, "--give", help='Players to give (comma-separated, e.g. "Mahomes, Kelce")'),
     get: str = typer.Option(None, "--get", help='Players to get (comma-separated, e.g. "Allen")'),
+    batch: str = typer.Option(
+        None, "--batch", help="Analyze proposals from a JSONL file (- for stdin), one JSON result per line"
+    ),
+    refresh: bool = typer.Option(False, "--refresh", help="Re-download trade values, ignoring the cache"),
     output_json: bool = typer.Option(False, "--json", help="Output as JSON"),
 ):
     """Analyze a trade using FFB trade values. Requires login.
@@ -87,55 +179,137 @@ def trade_command(
     \b
     Use --give and --get with comma-separated player names,
     or run with no flags for interactive prompts.
+    Trade values are cached for 6 hours; --refresh fetches them again.
+
+    \b
+    --batch reads one proposal per line, e.g.
+      {"id": 1, "give": "Mahomes, Kelce", "get": ["Allen"]}
+    and writes one JSON analysis per line, in the same order.
 
     \b
     EXAMPLES:
       ffb trade --give "Travis Kelce, CeeDee Lamb" --get "Ja'Marr Chase"
       ffb trade --give "Mahomes" --get "Allen" --json
       ffb trade                        # interactive: prompts for give/get players
+      ffb trade --give "Mahomes" --get "Allen" --refresh   # re-download values
+      ffb trade --batch proposals.jsonl                    # many trades, one fetch
+      ffb trade find --give "Kelce" --roster other.txt   # search balanced trades
     """
+    if ctx.invoked_subcommand is not None:
+        return
+
     try:
-        client = get_client(require_auth=True)
-        values = _fetch_trade_values(client)
+        values = _fetch_trade_values(refresh)
     except AuthExpiredError:
         typer.echo("Session expired. Run `ffb login` to re-authenticate.", err=True)
         raise typer.Exit(1)
 
+    names = NameIndex([v["player_name"] for v in values])
+    if batch:
+        _run_batch(batch, values, names)
+        return
+
     if not give or not get:
         give = typer.prompt("Players to give (comma-separated)")
         get = typer.prompt("Players to get (comma-separated)")
 
-    give_names = [n.strip() for n in give.split(",") if n.strip()]
-    get_names = [n.strip() for n in get.split(",") if n.strip()]
+    try:
+        analysis = _analyze(_split_names(give), _split_names(get), values, names)
+    except UnknownPlayerError as e:
+        typer.echo(f"Could not find player: {e}", err=True)
+        raise typer.Exit(1)
 
-    give_players = []
-    for name in give_names:
-        player = _find_player(name, values)
-        if not player:
-            typer.echo(f"Could not find player: {name}", err=True)
-            raise typer.Exit(1)
-        give_players.append(player)
+    if output_json:
+        print_json(analysis)
+    else:
+        trade_table(analysis)
 
-    get_players = []
-    for name in get_names:
-        player = _find_player(name, values)
-        if not player:
-            typer.echo(f"Could not find player: {name}", err=True)
-            raise typer.Exit(1)
-        get_players.append(player)
 
-    give_total = sum(p["value"] for p in give_players)
-    get_total = sum(p["value"] for p in get_players)
+@app.command()
+def find(
+    give: str = typer.Option(..., "--give", help='Players you would trade away (comma-separated)'),
+    roster: str = typer.Option(
+        ..., "--roster", help="Counterparty roster file, one player name per line (- for stdin)"
+    ),
+    tolerance: float = typer.Option(
+        None, "--tolerance", help="Only show packages within this many value points"
+    ),
+    max_give: int = typer.Option(2, "--max-give", help="Most of your players in one package"),
+    max_get: int = typer.Option(2, "--max-get", help="Most roster players in one package"),
+    limit: int = typer.Option(10, "-n", "--limit", help="Max results"),
+    refresh: bool = typer.Option(False, "--refresh", help="Re-download trade values, ignoring the cache"),
+    output_json: bool = typer.Option(False, "--json", help="Output as JSON"),
+    output_jsonl: bool = typer.Option(False, "--jsonl", help="Output one JSON object per line"),
+):
+    """Find value-balanced trades with another team. Requires login.
 
-    analysis = {
-        "give_players": give_players,
-        "get_players": get_players,
-        "give_total": give_total,
-        "get_total": get_total,
-        "difference": get_total - give_total,
-    }
+    \b
+    Tries every 1-for-1, 2-for-1, 2-for-2 ... up to --max-give-for---max-get
+    package between your --give players and the counterparty roster, and
+    lists the packages with the smallest net difference first.
 
-    if output_json:
-        console.print_json(json.dumps(analysis))
+    \b
+    EXAMPLES:
+      ffb trade find --give "Kelce" --roster other_team.txt --tolerance 5
+      ffb trade find --give "Kelce, Lamb" --roster other_team.txt --max-get 3 --json
+      ffb trade find --give "Kelce" --roster other_team.txt -n 50 --jsonl
+    """
+    try:
+        values = _fetch_trade_values(refresh)
+    except AuthExpiredError:
+        typer.echo("Session expired. Run `ffb login` to re-authenticate.", err=True)
+        raise typer.Exit(1)
+    names = NameIndex([v["player_name"] for v in values])
+
+    try:
+        give_players = [_resolve(n, values, names) for n in _split_names(give)]
+    except UnknownPlayerError as e:
+        typer.echo(f"Could not find player: {e}", err=True)
+        raise typer.Exit(1)
+
+    roster_players = []
+    seen = {id(p) for p in give_players}
+    for name in _read_roster(roster):
+        player = _find_player(name, values, names)
+        if not player:
+            typer.echo(f"Skipping unknown player: {name}", err=True)
+        elif id(player) not in seen:
+            seen.add(id(player))
+            roster_players.append(player)
+
+    with span("trade.find", rows=len(roster_players)):
+        packages = find_packages(
+            [p["value"] for p in give_players],
+            [p["value"] for p in roster_players],
+            max_give=max_give,
+            max_get=max_get,
+            tolerance=tolerance,
+            limit=limit,
+        )
+    if not packages:
+        typer.echo("No trades found within the tolerance.")
+        raise typer.Exit(0)
+
+    analyses = [
+        _analysis([give_players[i] for i in give_idx], [roster_players[j] for j in get_idx])
+        for give_idx, get_idx, _ in packages
+    ]
+    if output_jsonl:
+        print_jsonl(analyses)
+    elif output_json:
+        print_json(analyses)
     else:
-        trade_table(analysis)
+        trade_find_table(analyses)
+
+
+def _read_roster(path: str) -> list[str]:
+    try:
+        if path == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(path) as f:
+                lines = f.read().splitlines()
+    except OSError as e:
+        typer.echo(f"Could not read {path}: {e.strerror}", err=True)
+        raise typer.Exit(1)
+    return [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
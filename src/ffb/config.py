@@ -1,14 +1,29 @@
+import os
 from pathlib import Path
 
 # Paths
 CONFIG_DIR = Path.home() / ".config" / "ffb"
 SESSION_FILE = CONFIG_DIR / "session.json"
 CACHE_DIR = CONFIG_DIR / "cache"
+CACHE_DB = CACHE_DIR / "cache.db"
+SOCKET_PATH = CONFIG_DIR / "ffb.sock"  # `ffb serve` listens here
+DRAFT_FILE = CONFIG_DIR / "draft.json"  # `ffb draft` saves its picks here
 
-# Site
-BASE_URL = "https://www.thefantasyfootballers.com"
+# Site. FFB_BASE_URL points the CLI at a stand-in such as
+# benchmarks/fixture_server.py.
+BASE_URL = os.environ.get("FFB_BASE_URL", "https://www.thefantasyfootballers.com").rstrip("/")
 API_BASE = f"{BASE_URL}/wp-json"
 
+# HTTP: (connect, read) timeout in seconds, and the connection pool that
+# FFBClient.get_many() fans out over
+HTTP_TIMEOUT = (5, 30)
+HTTP_POOL_SIZE = 16
+HTTP_MAX_WORKERS = 8
+
+# Record responses as fixtures into / replay them from a directory (api/replay.py)
+HTTP_RECORD_DIR = os.environ.get("FFB_RECORD")
+HTTP_REPLAY_DIR = os.environ.get("FFB_REPLAY")
+
 # Auth
 LOGIN_URL = f"{BASE_URL}/login/"
 UDK_URL = f"{BASE_URL}/2026-ultimate-draft-kit/"
@@ -25,7 +40,38 @@ DEFAULT_SCORING = "half"
 # Positions
 VALID_POSITIONS = ["QB", "RB", "WR", "TE", "K", "DST"]
 
+# `ffb lineup`: the default starting slots and the positions each flex slot
+# takes. Flex slot types must nest (or not overlap) for the solver's
+# slot assignment to be complete.
+LINEUP_SLOTS = "QB=1,RB=2,WR=2,TE=1,FLEX=1,K=1,DST=1"
+FLEX_SLOTS = {
+    "FLEX": ("RB", "WR", "TE"),
+    "SUPERFLEX": ("QB", "RB", "WR", "TE"),
+}
+
 # Cache TTLs (seconds)
 CACHE_TTL_PLAYERS = 86_400  # 24 hours
 CACHE_TTL_PROJECTIONS = 3_600  # 1 hour
 CACHE_TTL_NEWS = 1_800  # 30 minutes
+CACHE_TTL_TRADE = 21_600  # 6 hours
+
+# News article store: posts per page when syncing (the WordPress maximum),
+# and how many recent articles `news search` and player news look through
+NEWS_PAGE_SIZE = 100
+NEWS_INDEX_DEPTH = 500
+
+# Stale-while-revalidate: expired player/projection entries younger than
+# CACHE_MAX_STALE are served immediately and refreshed in the background.
+# Projections need a login and change daily, so they go stale for less long.
+# FFB_SWR picks how: "process" (detached `ffb cache refresh`), "thread", or "off".
+CACHE_MAX_STALE = 7 * 86_400  # 7 days
+CACHE_MAX_STALE_PROJECTIONS = 86_400  # 1 day
+CACHE_SWR_MODE = os.environ.get("FFB_SWR", "process")
+
+# Cache size budget (bytes); least-recently-used entries are evicted past it
+CACHE_MAX_BYTES = int(os.environ.get("FFB_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+
+# Persistent cache/HTTP counters (see `ffb stats`). FFB_METRICS=0 turns them
+# off; FFB_METRICS_TEXTFILE also rewrites a Prometheus textfile on every update.
+METRICS_ENABLED = os.environ.get("FFB_METRICS", "1") != "0"
+METRICS_TEXTFILE = os.environ.get("FFB_METRICS_TEXTFILE")
@@ -0,0 +1,174 @@
+"""`ffb serve`: answer CLI invocations from a warm, long-running process.
+
+The daemon listens on a Unix socket (SOCKET_PATH). Each connection carries
+one JSON line, {"argv": [...], "cwd": "..."}; the daemon runs the command
+in-process with stdout/stderr captured and replies with one JSON line,
+{"code": int, "stdout": "...", "stderr": "..."}. Imports, the parsed
+session and decoded cache entries stay in memory between requests.
+
+Only non-interactive `--json` invocations are forwarded (see forward());
+anything that might prompt, open a menu or read stdin runs locally.
+This module is imported by the console entry point, so the client half
+must stay cheap: no Typer, Rich or NumPy at import time.
+"""
+
+import json
+import os
+import socket
+import sys
+
+from .config import SOCKET_PATH
+
+# Commands whose --json output can be produced without a terminal
+FORWARDED = {"players", "rankings", "projections", "trade", "start-sit", "news"}
+
+# Settings read from the environment at start-up; a caller that sets any of
+# them wants them applied, which the daemon (started with its own
+# environment) can't do, so the command runs locally
+LOCAL_ENV = ("FFB_TRACE", "FFB_BASE_URL", "FFB_RECORD", "FFB_REPLAY")
+
+
+def _has_option(argv: list[str], name: str) -> bool:
+    return any(arg == name or arg.startswith(name + "=") for arg in argv)
+
+
+def _may_prompt(argv: list[str]) -> bool:
+    """Whether the invocation could stop to ask for input."""
+    if argv[0] == "trade" and argv[1:2] != ["find"]:
+        # `ffb trade` prompts for whichever of --give/--get is missing
+        return not (
+            _has_option(argv, "--batch") or (_has_option(argv, "--give") and _has_option(argv, "--get"))
+        )
+    return False
+
+
+def forward(argv: list[str]) -> int | None:
+    """Run `argv` on a running daemon and return its exit code.
+
+    Returns None, so the caller runs the command itself, when the
+    invocation isn't forwardable, no daemon is listening, or the daemon
+    drops the connection or sends back something unreadable.
+    """
+    if not argv or argv[0] not in FORWARDED or "-" in argv or _may_prompt(argv):
+        return None
+    if "--json" not in argv and "--jsonl" not in argv:
+        return None
+    if any(os.environ.get(name, "") not in ("", "0") for name in LOCAL_ENV):
+        return None
+    if not os.path.exists(SOCKET_PATH):
+        return None
+
+    request = json.dumps({"argv": argv, "cwd": os.getcwd()}).encode() + b"\n"
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(SOCKET_PATH))
+            sock.sendall(request)
+            with sock.makefile("rb") as f:
+                line = f.readline()
+    except OSError:
+        return None
+    try:
+        reply = json.loads(line)
+        stdout, stderr, code = reply["stdout"], reply["stderr"], int(reply["code"])
+    except (ValueError, TypeError, KeyError):
+        # Empty or cut off mid-reply: as good as a dropped connection
+        return None
+    sys.stdout.write(stdout)
+    sys.stderr.write(stderr)
+    return code
+
+
+def stop() -> bool:
+    """Ask a running daemon to exit. Returns False if none is listening."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(SOCKET_PATH))
+            sock.sendall(b'{"op": "stop"}\n')
+            with sock.makefile("rb") as f:
+                f.readline()
+    except OSError:
+        return False
+    return True
+
+
+def run(argv: list[str], cwd: str | None = None) -> dict:
+    """Run one CLI invocation in this process, capturing its output."""
+    import io
+    import traceback
+    from contextlib import redirect_stderr, redirect_stdout
+
+    from .main import app
+
+    out, err = io.StringIO(), io.StringIO()
+    code = 0
+    previous_cwd = os.getcwd()
+    stdin = sys.stdin
+    try:
+        if cwd:
+            os.chdir(cwd)
+        # Prompts get EOF instead of blocking the daemon
+        sys.stdin = io.StringIO()
+        with redirect_stdout(out), redirect_stderr(err):
+            app(args=argv, prog_name="ffb")
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception:
+        err.write(traceback.format_exc())
+        code = 1
+    finally:
+        sys.stdin = stdin
+        os.chdir(previous_cwd)
+    return {"code": code, "stdout": out.getvalue(), "stderr": err.getvalue()}
+
+
+def serve() -> None:
+    """Listen on SOCKET_PATH until stopped. Requests are handled one at a time."""
+    import socketserver
+    import threading
+
+    from . import metrics
+    from .cache import store
+
+    # Keep decoded cache payloads between requests (keyed by write time)
+    store.enable_memo()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            line = self.rfile.readline()
+            if not line:
+                return
+            request = json.loads(line)
+            if request.get("op") == "stop":
+                self.wfile.write(b'{"code": 0}\n')
+                # shutdown() waits for serve_forever(), so call it from elsewhere
+                threading.Thread(target=self.server.shutdown).start()
+                return
+            reply = run(request["argv"], request.get("cwd"))
+            self.wfile.write(json.dumps(reply).encode() + b"\n")
+            metrics.flush()
+
+    SOCKET_PATH.parent.mkdir(parents=True, exist_ok=True)
+    old_umask = os.umask(0o177)  # socket is owner-only, like session.json
+    try:
+        server = socketserver.UnixStreamServer(str(SOCKET_PATH), Handler)
+    finally:
+        os.umask(old_umask)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if os.path.exists(SOCKET_PATH):
+            os.unlink(SOCKET_PATH)
+
+
+def is_running() -> bool:
+    """True if a live daemon owns SOCKET_PATH; removes the file if it's stale."""
+    if not os.path.exists(SOCKET_PATH):
+        return False
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(SOCKET_PATH))
+    except OSError:
+        os.unlink(SOCKET_PATH)
+        return False
+    return True
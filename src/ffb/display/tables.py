@@ -1,11 +1,73 @@
+import json
+import math
+import sys
+from collections.abc import Iterable
+from datetime import datetime
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+from ..tracing import traced
+
+try:
+    import orjson
+except ImportError:  # optional: pip install ffb-cli[fast]
+    orjson = None
+
 console = Console()
 
 
+def _finite(data):
+    """`data` with NaN and infinities as None, which orjson writes as null
+    and the json module would write as bare NaN (not valid JSON)."""
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {k: _finite(v) for k, v in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_finite(v) for v in data]
+    return data
+
+
+def _dumps(data: dict | list) -> str:
+    """Compact JSON, with orjson when it's installed. Either way a missing
+    number (NaN) comes out as null."""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(_finite(data), separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+
+
+@traced("display.json")
+def print_json(data: dict | list) -> None:
+    """The --json output of every command.
+
+    Pretty-printed and highlighted on a terminal; otherwise written to
+    stdout as one compact document, skipping Rich, which would re-parse it.
+    """
+    if console.is_terminal:
+        console.print_json(json.dumps(_finite(data), allow_nan=False))
+        return
+    sys.stdout.write(_dumps(data) + "\n")
+    sys.stdout.flush()
+
+
+@traced("display.jsonl")
+def print_jsonl(rows: Iterable[dict]) -> None:
+    """The --jsonl output: one compact object per line.
+
+    Each line is flushed as it's written, so rows from a generator (as
+    `trade --batch` passes) reach the consumer as they're produced; a list
+    goes out once it's complete.
+    """
+    out = sys.stdout
+    for row in rows:
+        out.write(_dumps(row) + "\n")
+        out.flush()
+
+
+@traced("display.player_search_table")
 def player_search_table(results: list[dict]) -> None:
     table = Table(title="Player Search Results")
     table.add_column("Name", style="bold")
@@ -23,6 +85,7 @@ def player_search_table(results: list[dict]) -> None:
     console.print(table)
 
 
+@traced("display.rankings_table")
 def rankings_table(players: list[dict], scoring: str) -> None:
     table = Table(title=f"Rankings ({scoring.upper()})")
     table.add_column("#", justify="right", style="dim")
@@ -32,6 +95,7 @@ def rankings_table(players: list[dict], scoring: str) -> None:
     table.add_column("Tier", justify="right")
     table.add_column("Pts", justify="right", style="yellow")
     table.add_column("Bye", justify="right", style="dim")
+    spread = _add_spread_columns(table, players)
 
     for p in players:
         table.add_row(
@@ -42,10 +106,45 @@ def rankings_table(players: list[dict], scoring: str) -> None:
             str(p.get("tier", "")),
             f"{p.get('points', 0):.1f}",
             str(p.get("bye_week", "")),
+            *(_spread_cells(p) if spread else ()),
         )
     console.print(table)
 
 
+def _add_spread_columns(table: Table, players: list[dict]) -> bool:
+    """Add analyst-spread columns when the rows carry them (--spread)."""
+    if not players or "points_sd" not in players[0]:
+        return False
+    table.add_column("SD", justify="right", style="magenta")
+    table.add_column("Range", justify="right", style="dim")
+    return True
+
+
+def _spread_cells(p: dict) -> tuple[str, str]:
+    return f"±{p['points_sd']:.1f}", f"{p['points_min']:.1f}-{p['points_max']:.1f}"
+
+
+@traced("display.rankings_compare_table")
+def rankings_compare_table(rows: list[dict], formats: list[str]) -> None:
+    table = Table(title=f"Rankings ({' vs '.join(f.upper() for f in formats)})")
+    table.add_column("Player", style="bold")
+    table.add_column("Pos", style="cyan")
+    table.add_column("Team", style="green")
+    for fmt in formats:
+        table.add_column(f"{fmt.upper()} #", justify="right", style="dim")
+        table.add_column("Tier", justify="right")
+        table.add_column("Pts", justify="right", style="yellow")
+
+    for r in rows:
+        cells = [r.get("player_name", ""), r.get("position", ""), r.get("team", "")]
+        for fmt in formats:
+            f = r.get(fmt, {})
+            cells += [str(f.get("rank", "")), str(f.get("tier", "")), f"{f.get('points', 0):.1f}"]
+        table.add_row(*cells)
+    console.print(table)
+
+
+@traced("display.projections_table")
 def projections_table(players: list[dict], scoring: str) -> None:
     table = Table(title=f"Projections ({scoring.upper()})")
     table.add_column("#", justify="right", style="dim")
@@ -60,6 +159,7 @@ def projections_table(players: list[dict], scoring: str) -> None:
     table.add_column("Rec", justify="right")
     table.add_column("Rec Yds", justify="right")
     table.add_column("Rec TD", justify="right")
+    spread = _add_spread_columns(table, players)
 
     for p in players:
         table.add_row(
@@ -75,10 +175,75 @@ def projections_table(players: list[dict], scoring: str) -> None:
             f"{p.get('receptions', 0):.1f}",
             f"{p.get('rec_yds', 0):.0f}",
             f"{p.get('rec_tds', 0):.1f}",
+            *(_spread_cells(p) if spread else ()),
+        )
+    console.print(table)
+
+
+@traced("display.draft_board_table")
+def draft_board_table(rows: list[dict]) -> None:
+    table = Table(title="Best Available")
+    table.add_column("Pos", style="cyan")
+    table.add_column("Tier", justify="right")
+    table.add_column("Left", justify="right", style="yellow")
+    table.add_column("Best available", style="bold")
+    table.add_column("Last rd", justify="right", style="dim")
+
+    for r in rows:
+        tier, left = r["tier"] or ("-", 0)
+        best = ", ".join(f"{p['player_name']} ({p['rank']})" for p in r["players"])
+        table.add_row(r["position"], str(tier), str(left), best or "[dim]none[/dim]", str(r["recent"]))
+    console.print(table)
+
+
+@traced("display.draft_picks_table")
+def draft_picks_table(picks: list[dict], title: str) -> None:
+    table = Table(title=title)
+    table.add_column("Pick", style="dim")
+    table.add_column("Team", justify="right")
+    table.add_column("Player", style="bold")
+    table.add_column("Pos", style="cyan")
+    table.add_column("NFL", style="green")
+    table.add_column("Rank", justify="right")
+    table.add_column("Tier", justify="right")
+
+    for p in picks:
+        table.add_row(
+            p["pick"], str(p["drafted_by"]), p.get("player_name", ""), p.get("position", ""),
+            p.get("team", ""), str(p.get("rank", "")), str(p.get("tier", "")),
+        )
+    console.print(table)
+
+
+@traced("display.lineup_table")
+def lineup_table(result: dict, scoring: str) -> None:
+    table = Table(title=f"{result['team']} ({scoring.upper()})")
+    table.add_column("Slot", style="dim")
+    table.add_column("Player", style="bold")
+    table.add_column("Pos", style="cyan")
+    table.add_column("NFL", style="green")
+    table.add_column("Pts", justify="right", style="yellow")
+
+    for p in result["lineup"]:
+        if p.get("player_name") is None:
+            table.add_row(p["slot"], "[dim]empty[/dim]", "", "", "")
+            continue
+        table.add_row(
+            p["slot"], p["player_name"], p.get("position", ""), p.get("team", ""), f"{p.get('points', 0):.1f}"
         )
+    table.add_section()
+    table.add_row("", "Total", "", "", f"[bold]{result['points']:.1f}[/bold]")
+    if result["bench"]:
+        table.add_section()
+        for p in result["bench"]:
+            table.add_row(
+                "BN", f"[dim]{p['player_name']}[/dim]", p.get("position", ""), p.get("team", ""),
+                f"[dim]{p.get('points', 0):.1f}[/dim]",
+            )
     console.print(table)
 
 
+@traced("display.trade_table")
 def trade_table(analysis: dict) -> None:
     table = Table(title="Trade Analysis")
     table.add_column("Side", style="bold")
@@ -100,6 +265,31 @@ def trade_table(analysis: dict) -> None:
     console.print(table)
 
 
+@traced("display.trade_find_table")
+def trade_find_table(analyses: list[dict]) -> None:
+    table = Table(title="Balanced Trades")
+    table.add_column("#", style="dim", justify="right")
+    table.add_column("Give", style="cyan")
+    table.add_column("Get", style="cyan")
+    table.add_column("Give Total", justify="right", style="yellow")
+    table.add_column("Get Total", justify="right", style="yellow")
+    table.add_column("Net", justify="right")
+
+    for i, a in enumerate(analyses, 1):
+        diff = a["difference"]
+        color = "green" if diff >= 0 else "red"
+        table.add_row(
+            str(i),
+            ", ".join(p["player_name"] for p in a["give_players"]),
+            ", ".join(p["player_name"] for p in a["get_players"]),
+            f"{a['give_total']:.1f}",
+            f"{a['get_total']:.1f}",
+            f"[{color}]{diff:+.1f}[/{color}]",
+        )
+    console.print(table)
+
+
+@traced("display.startsit_table")
 def startsit_table(result: dict) -> None:
     table = Table(title="Start/Sit Recommendation")
     table.add_column("Player", style="bold")
@@ -122,6 +312,7 @@ def startsit_table(result: dict) -> None:
     console.print(table)
 
 
+@traced("display.player_info_card")
 def player_info_card(player: dict, articles: list[dict]) -> None:
     name = player.get("name", "Unknown")
     pos = player.get("position", "")
@@ -146,6 +337,7 @@ def player_info_card(player: dict, articles: list[dict]) -> None:
         console.print(Panel("[dim]No recent articles found.[/dim]", title=str(header), border_style="blue"))
 
 
+@traced("display.news_table")
 def news_table(articles: list[dict]) -> None:
     table = Table(title="Fantasy Footballers News")
     table.add_column("Date", style="dim")
@@ -159,3 +351,100 @@ def news_table(articles: list[dict]) -> None:
             a.get("link", ""),
         )
     console.print(table)
+
+
+@traced("display.cache_table")
+def cache_table(rows: list[dict]) -> None:
+    table = Table(title="Cache")
+    table.add_column("Namespace", style="bold")
+    table.add_column("Entries", justify="right")
+    table.add_column("Size", justify="right", style="yellow")
+    table.add_column("Updated", style="dim")
+
+    for r in rows:
+        table.add_row(
+            r.get("namespace", ""),
+            str(r.get("entries", 0)),
+            f"{(r.get('bytes') or 0) / 1024:.1f} KB",
+            datetime.fromtimestamp(r["updated"]).strftime("%Y-%m-%d %H:%M") if r.get("updated") else "",
+        )
+    console.print(table)
+
+
+@traced("display.cache_warm_table")
+def cache_warm_table(rows: list[dict]) -> None:
+    table = Table(title="Cache Warm")
+    table.add_column("Dataset", style="bold")
+    table.add_column("Status")
+    table.add_column("Size", justify="right", style="yellow")
+    table.add_column("Time", justify="right")
+    table.add_column("Expires In", justify="right", style="dim")
+
+    styles = {"refreshed": "green", "fresh": "dim", "skipped": "dim", "error": "red"}
+    for r in rows:
+        status = r["status"]
+        if r.get("error"):
+            status += f": {r['error']}"
+        expires = r.get("expires_in")
+        table.add_row(
+            r["dataset"],
+            Text(status, style=styles.get(r["status"], "")),
+            f"{r['bytes'] / 1024:.1f} KB" if r.get("bytes") is not None else "",
+            f"{r['seconds']:.2f}s" if r.get("seconds") else "",
+            f"{expires / 60:.0f} min" if expires is not None else "",
+        )
+    console.print(table)
+
+
+def _pct(rate: float | None) -> str:
+    return f"{rate:.0%}" if rate is not None else ""
+
+
+@traced("display.stats_tables")
+def stats_tables(summary: dict) -> None:
+    if summary["cache"]:
+        table = Table(title="Cache")
+        table.add_column("Namespace", style="bold", no_wrap=True)
+        table.add_column("Hits", justify="right")
+        table.add_column("Stale", justify="right")
+        table.add_column("Revalidated (304)", justify="right")
+        table.add_column("Misses", justify="right")
+        table.add_column("Hit %", justify="right", style="green")
+        table.add_column("Read", justify="right", style="yellow", no_wrap=True)
+        table.add_column("Written", justify="right", style="yellow", no_wrap=True)
+        for r in summary["cache"]:
+            revalidated = str(r["revalidated"])
+            if r["revalidated"]:
+                revalidated += f" ({_pct(r['not_modified_rate'])})"
+            table.add_row(
+                r["namespace"],
+                str(r["hits"]),
+                str(r["stale"]),
+                revalidated,
+                str(r["misses"]),
+                _pct(r["hit_rate"]),
+                f"{r['read_bytes'] / 1024:.1f} KB",
+                f"{r['written_bytes'] / 1024:.1f} KB",
+            )
+        console.print(table)
+
+    if summary["http"]:
+        table = Table(title="HTTP")
+        table.add_column("Endpoint", style="bold", no_wrap=True)
+        table.add_column("Requests", justify="right")
+        table.add_column("Errors", justify="right", style="red")
+        table.add_column("401/403", justify="right", style="red")
+        table.add_column("Mean", justify="right")
+        table.add_column("p50 ≤", justify="right", style="dim")
+        table.add_column("p95 ≤", justify="right", style="dim")
+        for r in summary["http"]:
+            table.add_row(
+                r["endpoint"],
+                str(r["requests"]),
+                str(r["errors"]),
+                f"{r['auth_failures']} ({_pct(r['auth_failure_rate'])})",
+                f"{r['mean_seconds']:.3f}s" if r["mean_seconds"] is not None else "",
+                f"{r['p50_seconds']:g}s" if r["p50_seconds"] is not None else "",
+                f"{r['p95_seconds']:g}s" if r["p95_seconds"] is not None else "",
+            )
+        console.print(table)
@@ -0,0 +1,191 @@
+"""Live draft state over the rankings: best available, tiers left, runs.
+
+The board never re-filters or re-sorts the player list. Every position
+(and the board as a whole) keeps a heap of (rank, player) with lazy
+deletion: a pick marks the player taken and decrements its tier count,
+and a best-available lookup pops taken players off the top as they
+surface, so a pick or an undo is O(log n) amortized. Undo pushes the
+player back if its entry was already popped. The picks list is the whole
+state, so a snapshot is the drafted player ids in order and restoring one
+replays it.
+"""
+
+import heapq
+from collections import Counter
+
+from .search import NameIndex
+
+# Lowest fuzzy score accepted when a pick is entered by name (as in `trade`)
+MIN_PICK_SCORE = 60
+
+
+class Draft:
+    """A snake draft of `teams` x `rounds` picks over ranked players.
+
+    `players` are `rankings._fetch_projections` rows in rank order, each
+    with player_id, player_name, position and tier.
+    """
+
+    def __init__(self, players: list[dict], teams: int = 12, rounds: int = 16):
+        self.players = players
+        self.teams = teams
+        self.rounds = rounds
+        self.taken = [False] * len(players)
+        self.picks: list[int] = []
+        self._ids = {p["player_id"]: i for i, p in enumerate(players)}
+        self._names: NameIndex | None = None
+
+        # A list in rank order is already a heap; (rank, position in
+        # `players`) keeps entries unique and comparable
+        self._heaps: dict[str | None, list[tuple[int, int]]] = {None: []}
+        for i, p in enumerate(players):
+            entry = (p.get("rank", i + 1), i)
+            self._heaps[None].append(entry)
+            self._heaps.setdefault(p["position"], []).append(entry)
+        for heap in self._heaps.values():
+            heapq.heapify(heap)
+        # Whether each player still has an entry in its position / the overall heap
+        self._queued = {key: [True] * len(players) for key in (None, "position")}
+
+        self.tier_totals = Counter((p["position"], p.get("tier")) for p in players)
+        self.tiers_left = Counter(self.tier_totals)
+
+    @property
+    def positions(self) -> list[str]:
+        return [pos for pos in self._heaps if pos is not None]
+
+    @property
+    def done(self) -> bool:
+        return len(self.picks) >= self.teams * self.rounds
+
+    def slot(self, pick: int | None = None) -> tuple[int, int, int]:
+        """(round, pick in round, team) of 0-based overall pick `pick`
+        (default: the pick on the clock); even rounds run in reverse."""
+        pick = len(self.picks) if pick is None else pick
+        rnd, k = divmod(pick, self.teams)
+        team = k + 1 if rnd % 2 == 0 else self.teams - k
+        return rnd + 1, k + 1, team
+
+    def pick(self, i: int) -> None:
+        if self.taken[i]:
+            raise ValueError(f"{self.players[i]['player_name']} is already drafted")
+        if self.done:
+            raise ValueError("The draft is over")
+        self.taken[i] = True
+        self.picks.append(i)
+        p = self.players[i]
+        self.tiers_left[(p["position"], p.get("tier"))] -= 1
+
+    def undo(self) -> int | None:
+        """Take back the last pick; returns the player, or None before the first pick."""
+        if not self.picks:
+            return None
+        i = self.picks.pop()
+        self.taken[i] = False
+        p = self.players[i]
+        self.tiers_left[(p["position"], p.get("tier"))] += 1
+        entry = (p.get("rank", i + 1), i)
+        for key, heap_key in ((None, None), ("position", p["position"])):
+            if not self._queued[key][i]:
+                heapq.heappush(self._heaps[heap_key], entry)
+                self._queued[key][i] = True
+        return i
+
+    def best(self, position: str | None = None, n: int = 1) -> list[int]:
+        """The `n` best-ranked available players, overall or at `position`."""
+        heap = self._heaps.get(position, [])
+        queued = self._queued[None if position is None else "position"]
+        found, held = [], []
+        while heap and len(found) < n:
+            entry = heapq.heappop(heap)
+            if self.taken[entry[1]]:
+                # Lazy deletion: a drafted player leaves the heap when it surfaces
+                queued[entry[1]] = False
+                continue
+            found.append(entry[1])
+            held.append(entry)
+        for entry in held:
+            heapq.heappush(heap, entry)
+        return found
+
+    def tiers(self, position: str) -> list[tuple[int, int, int]]:
+        """(tier, left, total) for each of a position's tiers, best tier first."""
+        return sorted(
+            (tier, self.tiers_left[(pos, tier)], total)
+            for (pos, tier), total in self.tier_totals.items()
+            if pos == position
+        )
+
+    def current_tier(self, position: str) -> tuple[int, int] | None:
+        """The best tier at `position` with players left, and how many."""
+        for tier, left, _ in self.tiers(position):
+            if left:
+                return tier, left
+        return None
+
+    def run(self) -> tuple[str, int] | None:
+        """The position the latest picks share, and how many in a row."""
+        if not self.picks:
+            return None
+        position = self.players[self.picks[-1]]["position"]
+        length = 0
+        for i in reversed(self.picks):
+            if self.players[i]["position"] != position:
+                break
+            length += 1
+        return position, length
+
+    def recent(self, window: int | None = None) -> Counter:
+        """Positions taken over the last `window` picks (default: one round)."""
+        window = self.teams if window is None else window
+        return Counter(self.players[i]["position"] for i in self.picks[-window:])
+
+    def roster(self, team: int) -> list[tuple[int, int]]:
+        """(overall pick, player) for each of team `team`'s picks."""
+        return [(k, i) for k, i in enumerate(self.picks) if self.slot(k)[2] == team]
+
+    def match(self, query: str) -> list[int]:
+        """Available players best matching a typed name; more than one means it's ambiguous.
+
+        `#12` (or `12`) means overall rank 12.
+        """
+        text = query.strip().lstrip("#")
+        if text.isdigit():
+            i = int(text) - 1
+            return [i] if 0 <= i < len(self.players) and not self.taken[i] else []
+        if self._names is None:
+            # Built on the first typed name, so the board is up before it is
+            self._names = NameIndex([p["player_name"] for p in self.players])
+        best = None
+        found = []
+        for i, score in self._names.ranked(query, MIN_PICK_SCORE):
+            if self.taken[i]:
+                continue
+            if best is not None and score < best:
+                break
+            best = score
+            found.append(i)
+        # A full name settles a tie with the names containing it
+        exact = [i for i in found if self.players[i]["player_name"].lower() == text.lower()]
+        return exact if len(exact) == 1 else found
+
+    def snapshot(self) -> list:
+        """The drafted player ids, in pick order."""
+        return [self.players[i]["player_id"] for i in self.picks]
+
+    def restore(self, player_ids: list) -> list:
+        """Return to a snapshot: undo back to the picks it shares with this
+        draft and replay the rest. Returns ids no longer on the board."""
+        wanted = [self._ids.get(pid) for pid in player_ids]
+        common = 0
+        while common < min(len(wanted), len(self.picks)) and wanted[common] == self.picks[common]:
+            common += 1
+        while len(self.picks) > common:
+            self.undo()
+        missing = []
+        for pid, i in zip(player_ids[common:], wanted[common:]):
+            if i is None or self.taken[i] or self.done:
+                missing.append(pid)
+            else:
+                self.pick(i)
+        return missing
@@ -0,0 +1,162 @@
+"""Points-maximizing starting lineups for many rosters at once.
+
+Once it's known how many players start at each position, the best lineup
+starts that position's top scorers. So a lineup is a choice of how many
+extra players (beyond the dedicated slots) each position sends to the
+flex slots, and the solver scores every feasible choice and keeps the
+best: exact, not greedy, and with one flex and one superflex slot there
+are only a few dozen choices. Every roster is solved in the same NumPy
+pass: each position's points are sorted and prefix-summed across all
+rosters, and a choice's total is a sum of gathered prefix sums.
+"""
+
+from itertools import combinations, product
+
+import numpy as np
+
+from ..config import FLEX_SLOTS, VALID_POSITIONS
+
+
+# Slots that don't start anyone, accepted so a league's full slot list can be pasted in
+BENCH_SLOTS = ("BN", "BENCH", "IR")
+
+
+class SlotError(ValueError):
+    """Raised for a lineup slot rule that can't be parsed."""
+
+
+def parse_slots(text: str) -> dict[str, int]:
+    """'QB=1,RB=2,...,FLEX=1' -> {"QB": 1, "RB": 2, ..., "FLEX": 1}, in order."""
+    slots: dict[str, int] = {}
+    for part in text.split(","):
+        name, _, count = part.strip().partition("=")
+        name = name.strip().upper()
+        if not name or name in BENCH_SLOTS:
+            continue
+        if name not in VALID_POSITIONS and name not in FLEX_SLOTS:
+            raise SlotError(
+                f"Unknown slot {name!r}. Choose from {', '.join([*VALID_POSITIONS, *FLEX_SLOTS])}."
+            )
+        try:
+            n = int(count) if count.strip() else 1
+        except ValueError:
+            raise SlotError(f"Bad slot count in {part.strip()!r}") from None
+        if n < 0:
+            raise SlotError(f"Bad slot count in {part.strip()!r}")
+        slots[name] = slots.get(name, 0) + n
+    if not any(slots.values()):
+        raise SlotError("No lineup slots given")
+    return slots
+
+
+def _choices(positions: list[str], flex: dict[str, int]) -> np.ndarray:
+    """Every way to fill the flex slots: a (choices, positions) matrix of how
+    many extra players each position starts.
+
+    A choice is feasible when the slots can take its players (Hall's
+    condition): for every group of flex slot types, the extras that only
+    fit those types number no more than their slots.
+    """
+    total = sum(flex.values())
+    eligible = {pos: {name for name in flex if pos in FLEX_SLOTS[name]} for pos in positions}
+    groups = [set(g) for k in range(1, len(flex) + 1) for g in combinations(flex, k)]
+    rows = []
+    for extras in product(range(total + 1), repeat=len(positions)):
+        if sum(extras) != total:
+            continue
+        if all(
+            sum(e for pos, e in zip(positions, extras) if eligible[pos] <= group)
+            <= sum(flex[name] for name in group)
+            for group in groups
+        ):
+            rows.append(extras)
+    return np.array(rows, dtype=np.intp).reshape(len(rows), len(positions))
+
+
+def _assign_flex(extras: dict[str, list[int]], flex: dict[str, int]) -> dict[str, list[int | None]]:
+    """Hand the players in `extras` (by position) to the flex slots.
+
+    The narrowest slot type fills first, from the positions that fit the
+    fewest slot types, which is a complete matching when flex slot types
+    nest (as FLEX inside SUPERFLEX does).
+    """
+    left = {pos: list(players) for pos, players in extras.items()}
+
+    def reach(pos: str) -> int:
+        return sum(pos in FLEX_SLOTS[name] for name in flex)
+
+    filled: dict[str, list[int | None]] = {}
+    for name in sorted(flex, key=lambda n: len(FLEX_SLOTS[n])):
+        fits = sorted((pos for pos in left if pos in FLEX_SLOTS[name]), key=reach)
+        filled[name] = []
+        for _ in range(flex[name]):
+            pos = next((p for p in fits if left[p]), None)
+            filled[name].append(left[pos].pop(0) if pos else None)
+    return filled
+
+
+def best_lineups(
+    rosters: list[list[dict]], slots: dict[str, int]
+) -> list[tuple[list[tuple[str, int | None]], float]]:
+    """The points-maximizing lineup of each roster under `slots`.
+
+    `rosters` are lists of distinct players with position and points
+    (a player listed twice could start twice); `slots` maps
+    a position or a FLEX_SLOTS name to how many start there. Returns, per
+    roster, its lineup as (slot, index into the roster) pairs in `slots`
+    order (None for a slot the roster can't fill) and the lineup's points.
+    """
+    flex = {name: n for name, n in slots.items() if name in FLEX_SLOTS and n}
+    dedicated = {pos: n for pos, n in slots.items() if pos not in FLEX_SLOTS}
+    flex_positions = sorted({pos for name in flex for pos in FLEX_SLOTS[name]})
+    positions = list(dedicated) + [pos for pos in flex_positions if pos not in dedicated]
+    required = np.array([dedicated.get(pos, 0) for pos in positions], dtype=np.intp)
+
+    # Players each position starts under every feasible choice
+    choices = _choices(flex_positions, flex)
+    depth = np.tile(required, (len(choices), 1))
+    for k, pos in enumerate(flex_positions):
+        depth[:, positions.index(pos)] += choices[:, k]
+
+    # Players as a (rosters, players) matrix; the last column is always
+    # empty and stands in for players a roster doesn't have
+    width = max((len(r) for r in rosters), default=0)
+    points = np.full((len(rosters), width + 1), -np.inf)
+    codes = np.full((len(rosters), width + 1), -1, dtype=np.intp)
+    code_of = {pos: k for k, pos in enumerate(positions)}
+    for r, roster in enumerate(rosters):
+        for j, player in enumerate(roster):
+            codes[r, j] = code_of.get(player.get("position"), -1)
+            points[r, j] = player.get("points") or 0.0
+
+    totals = np.zeros((len(rosters), len(choices)))
+    tops = []
+    for k in range(len(positions)):
+        n = int(depth[:, k].max())
+        at_pos = np.where(codes == k, points, -np.inf)
+        # Each roster's players at this position, best first
+        order = np.argsort(-at_pos, axis=1, kind="stable")[:, :n]
+        if order.shape[1] < n:
+            order = np.pad(order, ((0, 0), (0, n - order.shape[1])), constant_values=width)
+        best = np.take_along_axis(at_pos, order, axis=1)
+        empty = ~np.isfinite(best)
+        # An unfilled slot scores nothing
+        prefix = np.concatenate(
+            [np.zeros((len(rosters), 1)), np.cumsum(np.where(empty, 0.0, best), axis=1)], axis=1
+        )
+        totals += prefix[:, depth[:, k]]
+        tops.append(np.where(empty, -1, order))
+
+    chosen = totals.argmax(axis=1)
+    results = []
+    for r in range(len(rosters)):
+        starters: dict[str, list[int | None]] = {}
+        extras: dict[str, list[int]] = {}
+        for k, pos in enumerate(positions):
+            picked = [int(j) if j >= 0 else None for j in tops[k][r, :depth[chosen[r], k]]]
+            starters[pos] = picked[:required[k]]
+            extras[pos] = [j for j in picked[required[k]:] if j is not None]
+        starters.update(_assign_flex(extras, flex))
+        lineup = [(name, j) for name, n in slots.items() for j in starters.get(name, [None] * n)[:n]]
+        results.append((lineup, float(totals[r, chosen[r]])))
+    return results
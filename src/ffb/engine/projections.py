@@ -0,0 +1,301 @@
+"""Columnar aggregation of per-analyst UDK projections.
+
+The raw `projections` array has one stat line per (player, analyst). It is
+parsed once into a float matrix with one row per stat line plus a row ->
+player index, so averaging is a grouped reduction and scoring is a product
+against a POINTS_CONFIG weight vector instead of per-player Python loops.
+"""
+
+import io
+import json
+
+import numpy as np
+
+STAT_FIELDS = [
+    "passing_yards", "passing_touchdowns", "interceptions_thrown",
+    "rushing_yards", "rushing_touchdowns",
+    "receptions", "receiving_yards", "receiving_touchdowns",
+    "fumbles_lost",
+]
+
+# Points per stat by scoring format
+POINTS_CONFIG = {
+    "HALF": {"pass_yd": 0.04, "pass_td": 4, "int": -2, "rush_yd": 0.1, "rush_td": 6, "rec": 0.5, "rec_yd": 0.1, "rec_td": 6, "fum": -2},
+    "PPR":  {"pass_yd": 0.04, "pass_td": 4, "int": -2, "rush_yd": 0.1, "rush_td": 6, "rec": 1.0, "rec_yd": 0.1, "rec_td": 6, "fum": -2},
+    "STD":  {"pass_yd": 0.04, "pass_td": 4, "int": -2, "rush_yd": 0.1, "rush_td": 6, "rec": 0.0, "rec_yd": 0.1, "rec_td": 6, "fum": -2},
+}
+
+# POINTS_CONFIG key for each column of STAT_FIELDS
+_WEIGHT_KEYS = ["pass_yd", "pass_td", "int", "rush_yd", "rush_td", "rec", "rec_yd", "rec_td", "fum"]
+
+
+def _num(val) -> float:
+    if val is None:
+        return 0.0
+    try:
+        return float(val)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def _column(values: np.ndarray) -> np.ndarray:
+    """Convert one object column to float64, treating missing/invalid as 0."""
+    try:
+        col = values.astype(np.float64)
+    except (ValueError, TypeError):
+        # Empty strings or junk somewhere in the column: convert one by one
+        return np.array([_num(v) for v in values.tolist()], dtype=np.float64)
+    nan = np.isnan(col)
+    if nan.any():
+        # None becomes NaN in the fast path; _num() maps it to 0
+        col[nan & np.equal(values, None)] = 0.0
+    return col
+
+
+def round1(values: np.ndarray) -> np.ndarray:
+    """Vectorized `round(x, 1)` that matches the builtin exactly.
+
+    np.round scales by 10 before rounding, which can land on the wrong side
+    of a tie; the rare values within reach of a tie are re-rounded with the
+    builtin so cached output never changes by 0.1.
+    """
+    scaled = values * 10
+    out = np.rint(scaled) / 10
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        out[near_tie] = [round(v, 1) for v in values[near_tie].tolist()]
+    return out
+
+
+def weight_vector(scoring_key: str) -> np.ndarray:
+    cfg = POINTS_CONFIG.get(scoring_key, POINTS_CONFIG["HALF"])
+    return np.array([cfg[k] for k in _WEIGHT_KEYS], dtype=np.float64)
+
+
+def score(stats: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Matrix-vector product `stats @ weights`, accumulated column by column.
+
+    Summing in STAT_FIELDS order keeps every result bit-identical to the
+    scalar left-to-right formula, which a BLAS dot product does not promise.
+    `weights` may also be a (fields, formats) matrix to score several
+    formats at once.
+    """
+    out = np.zeros((stats.shape[0],) + weights.shape[1:], dtype=np.float64)
+    for j in range(stats.shape[1]):
+        if weights.ndim == 1:
+            out += stats[:, j] * weights[j]
+        else:
+            out += stats[:, j, None] * weights[j]
+    return out
+
+
+CONSENSUS_METHODS = ["mean", "median", "trimmed", "weighted"]
+
+# Raw fields that may identify the analyst behind a stat line
+_ANALYST_KEYS = ("analyst", "analyst_id", "analyst_name")
+
+
+def _analyst(p: dict) -> str:
+    for key in _ANALYST_KEYS:
+        if p.get(key):
+            return str(p[key])
+    return ""
+
+
+class AnalystWeightError(ValueError):
+    """Raised for --weights that don't fit the analysts in the projections."""
+
+
+class ProjectionFrame:
+    """Per-analyst stat lines in columnar form.
+
+    `stats` is a (lines, len(STAT_FIELDS)) float matrix, `rows` maps each line
+    to its player's index in `meta` (ordered by first appearance) and
+    `analysts` to an index in `analyst_names`. Every consensus method works
+    on any (lines, k) matrix, so stats and per-line points can be reduced
+    together in one call.
+    """
+
+    def __init__(
+        self,
+        meta: list[dict],
+        rows: np.ndarray,
+        stats: np.ndarray,
+        analysts: np.ndarray | None = None,
+        analyst_names: list[str] | None = None,
+        tiers: dict | None = None,
+    ):
+        self.meta = meta
+        self.rows = rows
+        self.stats = stats
+        self.analysts = analysts if analysts is not None else np.zeros(len(rows), dtype=np.intp)
+        self.analyst_names = analyst_names or [""]
+        self.tiers = tiers or {}
+
+    @classmethod
+    def from_raw(cls, raw_projs: list[dict], tiers: dict | None = None) -> "ProjectionFrame":
+        pids = [p.get("player_id", "") for p in raw_projs]
+        index: dict[str, int] = {}
+        rows = np.fromiter(
+            (index.setdefault(pid, len(index)) for pid in pids), dtype=np.intp, count=len(pids)
+        )
+        # Player metadata comes from each player's first stat line
+        first = np.unique(rows, return_index=True)[1].tolist()
+        meta = [
+            {
+                "player_id": p.get("player_id", ""),
+                "player_name": p.get("name", ""),
+                "position": p.get("fantasy_position", ""),
+                "team": p.get("team", ""),
+                "bye_week": p.get("bye_week", ""),
+            }
+            for p in (raw_projs[r] for r in first)
+        ]
+
+        names: dict[str, int] = {}
+        analysts = np.fromiter(
+            (names.setdefault(_analyst(p), len(names)) for p in raw_projs),
+            dtype=np.intp, count=len(raw_projs),
+        )
+
+        cells = np.empty((len(raw_projs), len(STAT_FIELDS)), dtype=object)
+        cells[:] = [list(map(p.get, STAT_FIELDS)) for p in raw_projs]
+        stats = np.empty(cells.shape, dtype=np.float64)
+        for j in range(len(STAT_FIELDS)):
+            stats[:, j] = _column(cells[:, j])
+        return cls(meta, rows, stats, analysts, list(names), tiers)
+
+    def to_bytes(self) -> bytes:
+        """Serialize to an .npz blob; loading it skips JSON parsing entirely."""
+        buf = io.BytesIO()
+        np.savez(
+            buf,
+            rows=self.rows,
+            stats=self.stats,
+            analysts=self.analysts,
+            analyst_names=np.array(self.analyst_names, dtype=str),
+            meta=np.array(json.dumps(self.meta)),
+            tiers=np.array(json.dumps(self.tiers)),
+        )
+        return buf.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ProjectionFrame":
+        with np.load(io.BytesIO(data), allow_pickle=False) as z:
+            return cls(
+                json.loads(z["meta"].item()),
+                z["rows"],
+                z["stats"],
+                z["analysts"],
+                z["analyst_names"].tolist(),
+                json.loads(z["tiers"].item()),
+            )
+
+    def __len__(self) -> int:
+        return len(self.meta)
+
+    def line_weights(self, weights: dict[str, float]) -> np.ndarray:
+        """Per-line weights from analyst name -> weight (unlisted analysts get 1).
+
+        Raises AnalystWeightError for a name that isn't one of
+        `analyst_names` or weights that leave no analyst counting.
+        """
+        known = {n.lower() for n in self.analyst_names if n}
+        unknown = [name for name in weights if name.lower() not in known]
+        if unknown:
+            listed = ", ".join(sorted(n for n in self.analyst_names if n)) or "none found"
+            raise AnalystWeightError(
+                f"Unknown analyst(s): {', '.join(unknown)}. Analysts in the projections: {listed}."
+            )
+        lookup = {name.lower(): w for name, w in weights.items()}
+        per_analyst = np.array([lookup.get(n.lower(), 1.0) for n in self.analyst_names])
+        if per_analyst.sum() <= 0:
+            raise AnalystWeightError("Analyst weights must add up to more than 0.")
+        return per_analyst[self.analysts]
+
+    def mean(self, values: np.ndarray | None = None, weights: np.ndarray | None = None) -> np.ndarray:
+        """Per-player (optionally weighted) mean of each column of `values`.
+
+        Defaults to the stat matrix, giving shape (players, len(STAT_FIELDS)).
+        """
+        values = self.stats if values is None else values
+        n = len(self.meta)
+        counts = np.bincount(self.rows, weights=weights, minlength=n).astype(np.float64)
+        sums = np.empty((n, values.shape[1]), dtype=np.float64)
+        for j in range(values.shape[1]):
+            col = values[:, j] if weights is None else values[:, j] * weights
+            # bincount adds in input order, matching a sequential sum()
+            sums[:, j] = np.bincount(self.rows, weights=col, minlength=n)
+        return sums / counts[:, None]
+
+    def _grouped(self, values: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Sort each column within its player group.
+
+        Returns the sorted matrix (lines grouped by player, in player order)
+        plus each group's start offset and size.
+        """
+        counts = np.bincount(self.rows, minlength=len(self.meta))
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        ordered = np.empty_like(values)
+        for j in range(values.shape[1]):
+            ordered[:, j] = values[np.lexsort((values[:, j], self.rows)), j]
+        return ordered, starts, counts
+
+    def median(self, values: np.ndarray | None = None) -> np.ndarray:
+        values = self.stats if values is None else values
+        if not len(self.meta):
+            return np.empty((0, values.shape[1]))
+        ordered, starts, counts = self._grouped(values)
+        lo = ordered[starts + (counts - 1) // 2]
+        hi = ordered[starts + counts // 2]
+        return (lo + hi) / 2
+
+    def trimmed_mean(self, values: np.ndarray | None = None) -> np.ndarray:
+        """Mean after dropping each player's highest and lowest line.
+
+        Players with fewer than three lines keep the plain mean.
+        """
+        values = self.stats if values is None else values
+        if not len(self.meta):
+            return np.empty((0, values.shape[1]))
+        ordered, starts, counts = self._grouped(values)
+        sums = np.add.reduceat(ordered, starts, axis=0)
+        trim = counts >= 3
+        trimmed = sums - ordered[starts] - ordered[starts + counts - 1]
+        sums = np.where(trim[:, None], trimmed, sums)
+        return sums / np.where(trim, counts - 2, counts)[:, None]
+
+    def consensus(
+        self, method: str, values: np.ndarray | None = None, weights: dict[str, float] | None = None
+    ) -> np.ndarray:
+        if method == "mean":
+            return self.mean(values)
+        if method == "median":
+            return self.median(values)
+        if method == "trimmed":
+            return self.trimmed_mean(values)
+        if method == "weighted":
+            if not weights:
+                raise AnalystWeightError("--consensus weighted needs --weights (e.g. \"andy=2,mike=1\").")
+            line_weights = self.line_weights(weights)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                weighted = self.mean(values, line_weights)
+            # A player only zero-weighted analysts project gets the plain mean
+            unweighted = ~np.isfinite(weighted).all(axis=1)
+            if unweighted.any():
+                weighted[unweighted] = self.mean(values)[unweighted]
+            return weighted
+        raise ValueError(f"Unknown consensus method: {method}")
+
+    def spread(self, values: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Per-player population stddev, min and max of each column of `values`."""
+        if not len(self.meta):
+            empty = np.empty((0, values.shape[1]))
+            return empty, empty, empty
+        counts = np.bincount(self.rows, minlength=len(self.meta))
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        grouped = values[np.argsort(self.rows, kind="stable")]
+        mean = self.mean(values)
+        sq = self.mean(values * values)
+        sd = np.sqrt(np.maximum(sq - mean * mean, 0.0))
+        return sd, np.minimum.reduceat(grouped, starts), np.maximum.reduceat(grouped, starts)
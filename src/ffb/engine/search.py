@@ -0,0 +1,421 @@
+"""Trigram index over the player search dataset.
+
+`players search` used to JSON-decode every player and run both thefuzz
+scorers against each one. The index keeps the normalized names in NumPy
+columns with a trigram inverted index (CSR: sorted grams, offsets,
+postings), so a query usually scores only the players sharing a trigram
+with it, all in one batched rapidfuzz call. A misspelled name can share no
+trigram with a player it still rates well above the cut-off ("mwik"), so
+short queries, and any whose candidates come up with fewer than a page of
+matches, score every player instead. Scores match thefuzz exactly, and the
+results match the scan's.
+
+NameIndex applies the same scoring exhaustively to short lists such as
+the trade values, where every name can be scored. IncrementalSearch
+serves `players find`, where the query grows a keystroke at a time.
+"""
+
+import io
+import json
+
+import numpy as np
+from rapidfuzz import fuzz, process
+from thefuzz import utils
+
+# Same cut-off as the original linear scan
+MIN_SCORE = 55
+
+# Most candidates (by shared trigrams) that get scored for one query
+MAX_CANDIDATES = 2_000
+
+# Queries with this few trigrams (a short word) score every player: they
+# can rate 80+ against names they share no trigram with
+FULL_SCAN_GRAMS = 6
+
+
+def _normalize(name: str) -> str:
+    """The form thefuzz's token_sort_ratio compares: ASCII, lowercase, alphanumerics."""
+    return utils.full_process(name, force_ascii=True)
+
+
+def _grams(normalized: str) -> set[str]:
+    """Trigrams of each token padded with spaces, so " ma" doubles as a prefix."""
+    grams = set()
+    for token in normalized.split():
+        padded = f" {token} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def _codes(values: list) -> tuple[np.ndarray, list]:
+    """Dictionary-encode a column: per-row codes plus the distinct values."""
+    lookup: dict = {}
+    codes = [lookup.setdefault(v, len(lookup)) for v in values]
+    return np.array(codes, dtype=np.min_scalar_type(len(lookup))), list(lookup)
+
+
+def _pack(strings: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """UTF-8 encode and concatenate strings; string i is data[offsets[i]:offsets[i + 1]].
+
+    Far smaller than a fixed-width unicode array, which stores every name
+    at the longest name's length in UTF-32.
+    """
+    encoded = [s.encode() for s in strings]
+    ends = np.cumsum([len(e) for e in encoded], dtype=np.int64)
+    offsets = np.zeros(len(encoded) + 1, dtype=np.min_scalar_type(ends[-1] if len(ends) else 0))
+    offsets[1:] = ends
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+class _Strings:
+    """Read side of _pack: decodes only the rows asked for."""
+
+    def __init__(self, data: np.ndarray, offsets: np.ndarray):
+        self.data = data
+        self.offsets = offsets
+        self._buf = data.tobytes()
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def take(self, rows: np.ndarray) -> list[str]:
+        buf = self._buf
+        starts = self.offsets[rows].tolist()
+        ends = self.offsets[rows + 1].tolist()
+        return [buf[a:b].decode() for a, b in zip(starts, ends)]
+
+
+def _scores(query: str, normalized: list[str], lowered: list[str]) -> np.ndarray:
+    """max(token_sort_ratio, partial_ratio) of `query` against each name, as thefuzz computes it.
+
+    `normalized` and `lowered` are the names after _normalize() and
+    str.lower(); both scorers run as one batched call each.
+    """
+    token_sort = process.cdist(
+        [_normalize(query)], normalized, scorer=fuzz.token_sort_ratio, dtype=np.float64
+    )[0]
+    partial = process.cdist(
+        [query.lower()], lowered, scorer=fuzz.partial_ratio, dtype=np.float64
+    )[0]
+    # thefuzz rounds each score with round(), which np.rint matches
+    return np.maximum(np.rint(token_sort), np.rint(partial)).astype(np.int64)
+
+
+class NameIndex:
+    """Best-match lookup over a short list of names, memoised per query.
+
+    Unlike PlayerIndex every name is scored, so the match is exactly the
+    first name with the highest score, as a linear scan would pick it.
+    """
+
+    def __init__(self, names: list[str]):
+        self._normalized = [_normalize(n) for n in names]
+        self._lowered = [n.lower() for n in names]
+        self._memo: dict[str, tuple[int, int]] = {}
+
+    def best(self, query: str, min_score: int = MIN_SCORE) -> int | None:
+        """Position of the best-matching name, or None if it scores below `min_score`."""
+        # Both scorers only ever see the lowercased query
+        key = query.lower()
+        if key not in self._memo:
+            if not self._lowered:
+                self._memo[key] = (-1, 0)
+            else:
+                scores = _scores(key, self._normalized, self._lowered)
+                i = int(np.argmax(scores))
+                self._memo[key] = (i, int(scores[i]))
+        i, score = self._memo[key]
+        return i if score >= min_score and i >= 0 else None
+
+    def ranked(self, query: str, min_score: int = MIN_SCORE) -> list[tuple[int, int]]:
+        """(position, score) of every name scoring at least `min_score`,
+        best first, ties in list order."""
+        if not self._lowered:
+            return []
+        scores = _scores(query.lower(), self._normalized, self._lowered)
+        keep = np.flatnonzero(scores >= min_score)
+        order = keep[np.lexsort((keep, -scores[keep]))]
+        return [(int(i), int(scores[i])) for i in order]
+
+
+class PlayerIndex:
+    """Searchable, serializable view of `player_search_data`.
+
+    `names` holds display names and `normalized` their token_sort form,
+    both packed as UTF-8 so the serialized index stays small.
+    Position, team and status are dictionary-encoded (`*_codes` index into
+    `*_values`), so a -p/-t filter is one comparison over the candidates.
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        names: _Strings,
+        normalized: _Strings,
+        pos_codes: np.ndarray,
+        pos_values: list,
+        team_codes: np.ndarray,
+        team_values: list,
+        status_codes: np.ndarray,
+        status_values: list,
+        grams: np.ndarray,
+        offsets: np.ndarray,
+        postings: np.ndarray,
+    ):
+        self.ids = ids
+        self.names = names
+        self.normalized = normalized
+        self.pos_codes = pos_codes
+        self.pos_values = pos_values
+        self.team_codes = team_codes
+        self.team_values = team_values
+        self.status_codes = status_codes
+        self.status_values = status_values
+        self.grams = grams
+        self.offsets = offsets
+        self.postings = postings
+
+    @classmethod
+    def build(cls, players: list[dict]) -> "PlayerIndex":
+        players = [p for p in players if p.get("name")]
+        names = [p["name"] for p in players]
+        normalized = [_normalize(n) for n in names]
+
+        ids = [p.get("player_id") for p in players]
+        if all(isinstance(i, int) and not isinstance(i, bool) for i in ids):
+            id_col = np.array(ids, dtype=np.int64)
+        else:
+            id_col = np.array(["" if i is None else str(i) for i in ids], dtype=str)
+
+        pos_codes, pos_values = _codes([p.get("pos", "") or p.get("position", "") for p in players])
+        team_codes, team_values = _codes([p.get("team", "") for p in players])
+        status_codes, status_values = _codes([p.get("status") for p in players])
+
+        postings_by_gram: dict[str, list[int]] = {}
+        for i, name in enumerate(normalized):
+            for gram in _grams(name):
+                postings_by_gram.setdefault(gram, []).append(i)
+        grams = sorted(postings_by_gram)
+        lengths = [len(postings_by_gram[g]) for g in grams]
+        offsets = np.zeros(len(grams) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        postings = np.fromiter(
+            (i for g in grams for i in postings_by_gram[g]),
+            dtype=np.min_scalar_type(len(names)), count=int(offsets[-1]),
+        )
+
+        return cls(
+            id_col,
+            _Strings(*_pack(names)),
+            _Strings(*_pack(normalized)),
+            pos_codes, pos_values,
+            team_codes, team_values,
+            status_codes, status_values,
+            np.array(grams, dtype="<U3"),
+            offsets,
+            postings,
+        )
+
+    def to_bytes(self) -> bytes:
+        buf = io.BytesIO()
+        np.savez(
+            buf,
+            ids=self.ids,
+            names=self.names.data,
+            name_offsets=self.names.offsets,
+            normalized=self.normalized.data,
+            normalized_offsets=self.normalized.offsets,
+            pos_codes=self.pos_codes,
+            team_codes=self.team_codes,
+            status_codes=self.status_codes,
+            # Distinct values may be None, so they round-trip through JSON
+            values=np.array(json.dumps([self.pos_values, self.team_values, self.status_values])),
+            grams=self.grams,
+            offsets=self.offsets,
+            postings=self.postings,
+        )
+        return buf.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PlayerIndex":
+        with np.load(io.BytesIO(data), allow_pickle=False) as z:
+            pos_values, team_values, status_values = json.loads(z["values"].item())
+            return cls(
+                z["ids"],
+                _Strings(z["names"], z["name_offsets"]),
+                _Strings(z["normalized"], z["normalized_offsets"]),
+                z["pos_codes"], pos_values,
+                z["team_codes"], team_values,
+                z["status_codes"], status_values,
+                z["grams"],
+                z["offsets"],
+                z["postings"],
+            )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _overlap(self, normalized_query: str) -> np.ndarray | None:
+        """Number of the query's trigrams each player shares.
+
+        None means the query is shorter than a trigram; it can still score
+        high on partial_ratio against any name, so every player is a candidate.
+        """
+        if len(normalized_query) < 3:
+            return None
+        grams = np.array(sorted(_grams(normalized_query)), dtype="<U3")
+        at = np.searchsorted(self.grams, grams)
+        found = at < len(self.grams)
+        found[found] = self.grams[at[found]] == grams[found]
+        hits = [self.postings[self.offsets[g]:self.offsets[g + 1]] for g in at[found]]
+        if not hits:
+            return np.zeros(len(self), dtype=np.int64)
+        return np.bincount(np.concatenate(hits), minlength=len(self))
+
+    def _filter(self, candidates: np.ndarray, codes: np.ndarray, values: list, wanted: str) -> np.ndarray:
+        """Keep candidates whose value matches `wanted`, case-insensitively."""
+        match = [c for c, v in enumerate(values) if (v or "").upper() == wanted.upper()]
+        return candidates[np.isin(codes[candidates], match)]
+
+    def _prefixed(self, token: str, limit: int) -> np.ndarray:
+        """The first `limit` players with a name token starting with `token`
+        (one or two characters), in dataset order."""
+        lo = np.searchsorted(self.grams, " " + token)
+        hi = np.searchsorted(self.grams, " " + token + "\uffff") if len(token) == 1 else lo + 1
+        found = np.zeros(len(self), dtype=bool)
+        for g in range(lo, min(hi, len(self.grams))):
+            if self.grams[g].startswith(" " + token):
+                # Postings are in dataset order, so each gram's first `limit` suffice
+                found[self.postings[self.offsets[g]:min(self.offsets[g + 1], self.offsets[g] + limit)]] = True
+        return np.flatnonzero(found)[:limit]
+
+    def _candidates(
+        self, normalized_query: str, position: str | None, team: str | None, prefix: bool = False
+    ) -> np.ndarray:
+        """Players worth scoring for a query, in dataset order; at most
+        MAX_CANDIDATES when they come from the trigram or prefix postings.
+
+        A query shorter than a trigram makes every player a candidate,
+        unless `prefix` narrows it to the names with a token it starts.
+        """
+        overlap = self._overlap(normalized_query)
+        if overlap is not None:
+            candidates = np.flatnonzero(overlap)
+        elif prefix and normalized_query and not (position or team):
+            candidates = self._prefixed(normalized_query, MAX_CANDIDATES + 1)
+        elif prefix and normalized_query:
+            candidates = self._prefixed(normalized_query, len(self))
+        else:
+            candidates = np.arange(len(self))
+        if position:
+            candidates = self._filter(candidates, self.pos_codes, self.pos_values, position)
+        if team:
+            candidates = self._filter(candidates, self.team_codes, self.team_values, team)
+        if len(candidates) > MAX_CANDIDATES:
+            if overlap is not None:
+                # Score only the players sharing the most trigrams with the query;
+                # ties go to dataset order, like the scan's stable sort
+                rank = overlap[candidates] * len(self) - candidates
+                top = np.argpartition(-rank, MAX_CANDIDATES - 1)[:MAX_CANDIDATES]
+                candidates = np.sort(candidates[top])
+            elif prefix:
+                candidates = candidates[:MAX_CANDIDATES]
+        return candidates
+
+    def _score(self, query: str, candidates: np.ndarray) -> np.ndarray:
+        names = self.names.take(candidates)
+        return _scores(query, self.normalized.take(candidates), [n.lower() for n in names])
+
+    def _scored(
+        self, query: str, position: str | None, team: str | None, limit: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """The players scored for `query` and their scores: those sharing a
+        trigram with it, or every player passing the filters when that
+        could miss a match."""
+        normalized_query = _normalize(query)
+        candidates = self._candidates(normalized_query, position, team)
+        scores = self._score(query, candidates) if len(candidates) else np.zeros(0, dtype=np.int64)
+        if len(_grams(normalized_query)) <= FULL_SCAN_GRAMS or np.count_nonzero(scores >= MIN_SCORE) < limit:
+            everyone = self._candidates("", position, team)
+            if len(everyone) > len(candidates):
+                candidates, scores = everyone, self._score(query, everyone)
+        return candidates, scores
+
+    def _results(self, candidates: np.ndarray, scores: np.ndarray, limit: int) -> list[dict]:
+        """The best `limit` candidates scoring at least MIN_SCORE, as result dicts."""
+        # Positions into `candidates`: best score first, ties in dataset order
+        keep = np.flatnonzero(scores >= MIN_SCORE)
+        best = keep[np.lexsort((candidates[keep], -scores[keep]))][:limit]
+        rows = candidates[best]
+        names = self.names.take(rows)
+
+        results = []
+        for k, i in enumerate(rows.tolist()):
+            results.append({
+                "id": self.ids[i].item(),
+                "name": names[k],
+                "position": self.pos_values[self.pos_codes[i]],
+                "team": self.team_values[self.team_codes[i]],
+                "status": self.status_values[self.status_codes[i]],
+                "score": int(scores[best[k]]),
+            })
+        return results
+
+    def search(
+        self, query: str, position: str | None = None, team: str | None = None, limit: int = 10
+    ) -> list[dict]:
+        """Best fuzzy matches for `query`, scored like the original scan.
+
+        The score is max(token_sort_ratio, partial_ratio) on lowercased
+        names, rounded like thefuzz; results below MIN_SCORE are dropped and
+        ties keep dataset order.
+        """
+        candidates, scores = self._scored(query, position, team, limit)
+        if not len(candidates):
+            return []
+        return self._results(candidates, scores, limit)
+
+
+class IncrementalSearch:
+    """Search-as-you-type over a PlayerIndex.
+
+    Each keystroke's candidates and scores are kept on a stack, so
+    deleting characters pops back to a state already computed. A longer
+    query gathers and scores its candidates afresh, exactly as `search`
+    does: one more character can lift a player's token_sort_ratio past
+    players the shorter query ranked higher, so the previous keystroke's
+    scores say nothing about which players can be dropped. One- and
+    two-letter queries match name tokens by prefix, since a single letter
+    rates 100 on partial_ratio against nearly every name.
+    """
+
+    def __init__(self, index: PlayerIndex, position: str | None = None, team: str | None = None):
+        self.index = index
+        self.position = position
+        self.team = team
+        # (query, limit, candidates, scores), each query a prefix of the next
+        self._stack: list[tuple[str, int, np.ndarray, np.ndarray]] = []
+
+    def update(self, query: str, limit: int = 10) -> tuple[list[dict], int]:
+        """Results for `query` and how many players were scored to get them."""
+        query = query.lower()
+        while self._stack and not query.startswith(self._stack[-1][0]):
+            self._stack.pop()
+        if self._stack and self._stack[-1][0] == query and self._stack[-1][1] >= limit:
+            _, _, candidates, scores = self._stack[-1]
+            return self.index._results(candidates, scores, limit), 0
+        if self._stack and self._stack[-1][0] == query:
+            # Scored for fewer rows, which may not have needed every player
+            self._stack.pop()
+
+        normalized_query = _normalize(query)
+        if not normalized_query:
+            self._stack.append((query, limit, np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)))
+            return [], 0
+        if len(normalized_query) >= 3:
+            candidates, scores = self.index._scored(query, self.position, self.team, limit)
+        else:
+            candidates = self.index._candidates(normalized_query, self.position, self.team, prefix=True)
+            scores = self.index._score(query, candidates) if len(candidates) else np.zeros(0, dtype=np.int64)
+        self._stack.append((query, limit, candidates, scores))
+        return self.index._results(candidates, scores, limit), len(candidates)
@@ -0,0 +1,100 @@
+"""Search for value-balanced trade packages.
+
+Given the values a team offers and a counterparty roster, find the
+give/get combinations whose totals are closest, i.e. with the smallest
+|get_total - give_total|. Enumerating every N-for-M pair directly grows
+with C(roster, M) per give package; instead the roster is split in half
+(meet in the middle): each half's subset sums are enumerated once per
+size and one half is sorted, so for every subset of the other half the
+closest completions are found with a vectorized binary search.
+"""
+
+from itertools import combinations
+
+import numpy as np
+
+
+def _subsets(values: np.ndarray, offset: int, size: int) -> tuple[np.ndarray, np.ndarray]:
+    """All `size`-player subsets of `values`: (index matrix, sums)."""
+    if size == 0:
+        return np.empty((1, 0), dtype=np.intp), np.zeros(1)
+    idx = np.array(list(combinations(range(len(values)), size)), dtype=np.intp)
+    if not len(idx):
+        return np.empty((0, size), dtype=np.intp), np.empty(0)
+    return idx + offset, values[idx].sum(axis=1)
+
+
+def _closest(
+    a_sums: np.ndarray, b_sums: np.ndarray, target: float, tolerance: float | None, limit: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Pairs (i, j) with a_sums[i] + b_sums[j] nearest `target`, best `limit` first.
+
+    `b_sums` must be sorted. For each i only the `limit` entries either side
+    of the insertion point can be among the best `limit` overall, so that
+    window is all that gets scored.
+    """
+    if not len(a_sums) or not len(b_sums):
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty, np.empty(0)
+    at = np.searchsorted(b_sums, target - a_sums)
+    window = np.arange(-limit, limit)
+    j = at[:, None] + window
+    valid = (j >= 0) & (j < len(b_sums))
+    i = np.broadcast_to(np.arange(len(a_sums))[:, None], j.shape)[valid]
+    j = j[valid]
+    diff = a_sums[i] + b_sums[j] - target
+    if tolerance is not None:
+        ok = np.abs(diff) <= tolerance
+        i, j, diff = i[ok], j[ok], diff[ok]
+    if len(diff) > limit:
+        best = np.argpartition(np.abs(diff), limit - 1)[:limit]
+        i, j, diff = i[best], j[best], diff[best]
+    return i, j, diff
+
+
+def find_packages(
+    give_values: list[float],
+    roster_values: list[float],
+    max_give: int = 2,
+    max_get: int = 2,
+    tolerance: float | None = None,
+    limit: int = 10,
+) -> list[tuple[tuple[int, ...], tuple[int, ...], float]]:
+    """Best-balanced (give, get) packages, closest first.
+
+    Every non-empty subset of up to `max_give` of the offered players is
+    matched against every non-empty subset of up to `max_get` roster
+    players. Returns (give indexes, roster indexes, difference) tuples,
+    where difference is get_total - give_total; with `tolerance` only
+    packages within that many value points are kept.
+    """
+    roster = np.asarray(roster_values, dtype=np.float64)
+    half = len(roster) // 2
+    left, right = roster[:half], roster[half:]
+
+    # Subset sums by size for both halves, enumerated once for all targets
+    left_sets = [_subsets(left, 0, k) for k in range(max_get + 1)]
+    right_sets = []
+    for k in range(max_get + 1):
+        idx, sums = _subsets(right, half, k)
+        order = np.argsort(sums, kind="stable")
+        right_sets.append((idx[order], sums[order]))
+
+    found = []
+    offered = range(len(give_values))
+    for n_give in range(1, min(max_give, len(give_values)) + 1):
+        for give in combinations(offered, n_give):
+            target = sum(give_values[g] for g in give)
+            for n_left in range(max_get + 1):
+                for n_right in range(max_get + 1 - n_left):
+                    if n_left + n_right == 0:
+                        continue
+                    left_idx, left_sums = left_sets[n_left]
+                    right_idx, right_sums = right_sets[n_right]
+                    i, j, diff = _closest(left_sums, right_sums, target, tolerance, limit)
+                    for row_l, row_r, d in zip(left_idx[i].tolist(), right_idx[j].tolist(), diff.tolist()):
+                        found.append((give, tuple(row_l + row_r), d))
+
+    # Closest first; among equally close, the smaller package
+    found.sort(key=lambda f: (abs(f[2]), len(f[0]) + len(f[1])))
+    return found[:limit]
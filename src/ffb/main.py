@@ -1,11 +1,64 @@
+import importlib
+
 import typer
+from typer.core import TyperGroup
+
+from . import tracing
+
+# Subcommand name -> (module, attribute). A module is imported only when its
+# command is resolved, so `ffb news --json` never pays for Playwright,
+# thefuzz or simple_term_menu. Attributes are either a Typer sub-app or a
+# plain command function.
+COMMANDS: dict[str, tuple[str, str]] = {
+    "login": (".commands.login", "app"),
+    "players": (".commands.players", "app"),
+    "rankings": (".commands.rankings", "rankings_command"),
+    "projections": (".commands.projections", "projections_command"),
+    "trade": (".commands.trade", "app"),
+    "start-sit": (".commands.startsit", "startsit_command"),
+    "news": (".commands.news", "app"),
+    "cache": (".commands.cache", "app"),
+    "sync": (".commands.cache", "warm"),  # alias for `ffb cache warm`
+    "stats": (".commands.stats", "stats_command"),
+    "serve": (".commands.serve", "serve_command"),
+    "batch": (".commands.batch", "batch_command"),
+    "draft": (".commands.draft", "draft_command"),
+    "lineup": (".commands.lineup", "lineup_command"),
+}
+
+
+class LazyGroup(TyperGroup):
+    """Typer group that resolves subcommands from COMMANDS on first use."""
+
+    def list_commands(self, ctx) -> list[str]:
+        return list(COMMANDS)
+
+    def invoke(self, ctx):
+        # The subcommand is resolved (imported) before _root runs, so
+        # --trace has to switch tracing on here to cover it
+        if ctx.params.get("trace"):
+            tracing.enable()
+        return super().invoke(ctx)
+
+    def get_command(self, ctx, cmd_name: str):
+        if cmd_name in self.commands:
+            return self.commands[cmd_name]
+        target = COMMANDS.get(cmd_name)
+        if target is None:
+            return None
+        module_name, attr = target
+        with tracing.span("import", module=module_name):
+            obj = getattr(importlib.import_module(module_name, __package__), attr)
+        if isinstance(obj, typer.Typer):
+            cmd = typer.main.get_group(obj)
+        else:
+            single = typer.Typer(add_completion=False)
+            single.command(name=cmd_name)(obj)
+            cmd = typer.main.get_command(single)
+        cmd.name = cmd_name
+        self.commands[cmd_name] = cmd
+        return cmd
 
-from .commands import login, players
-from .commands.rankings import rankings_command
-from .commands.projections import projections_command
-from .commands.trade import trade_command
-from .commands.startsit import startsit_command
-from .commands.news import news_command
 
 app = typer.Typer(
     name="ffb",
@@ -21,31 +74,45 @@ and lasts ~24 hours. Public commands (players, news) work without login.
 
 \b
 COMMANDS REQUIRING LOGIN: rankings, projections, trade, start-sit
-COMMANDS WITHOUT LOGIN:   players, news
+COMMANDS WITHOUT LOGIN:   players, news, cache, sync, stats, serve, batch
 
 \b
 EXAMPLES:
   ffb login                                  # authenticate via browser
   ffb players search "justin jefferson"      # fuzzy player search (no login)
+  ffb players find                           # search as you type (no login)
   ffb rankings QB -s ppr -n 10               # top 10 QB rankings, PPR scoring
   ffb projections RB                         # RB stat projections
   ffb trade --give "Kelce, Lamb" --get "Chase"  # analyze a trade
   ffb start-sit "Ja'Marr Chase" "CeeDee Lamb"  # start/sit comparison
   ffb news -n 5                              # latest 5 articles (no login)
+  ffb cache clear --ns projections           # drop cached projections
+  ffb sync                                   # prefetch everything before a draft
+  ffb draft --slot 5                         # live draft board, you pick 5th
+  ffb lineup --draft                         # best starting lineup for every team
+  ffb stats                                  # cache hit rates, HTTP latency
+  ffb serve &                                # warm daemon for fast --json calls
+  ffb batch < requests.jsonl                 # many --json commands, one process
 
 \b
 All commands support --json for machine-readable output.
+`ffb --trace <command>` prints where the time went as JSON on stderr.
 """,
     no_args_is_help=True,
+    cls=LazyGroup,
 )
 
-app.add_typer(login.app, name="login")
-app.add_typer(players.app, name="players")
-app.command(name="rankings")(rankings_command)
-app.command(name="projections")(projections_command)
-app.command(name="trade")(trade_command)
-app.command(name="start-sit")(startsit_command)
-app.command(name="news")(news_command)
+
+@app.callback()
+def _root(
+    trace: bool = typer.Option(
+        False, "--trace", help="Print a JSON timing breakdown to stderr (also FFB_TRACE=1)"
+    ),
+) -> None:
+    # Commands are registered lazily through LazyGroup; the callback exists
+    # so Typer builds a group rather than a single command, and for the
+    # global options, which LazyGroup.invoke() acts on.
+    pass
 
 
 if __name__ == "__main__":
@@ -0,0 +1,211 @@
+"""Persistent counters for the cache and the HTTP client.
+
+Counts accumulate in memory and are added to the `metrics` table of the
+cache database when the process exits (or, for `ffb serve`, after every
+request), so recording one costs a dict update. Names and labels follow
+Prometheus conventions; `ffb stats` summarises them and `ffb stats --prom`
+writes them in the text exposition format for node_exporter's textfile
+collector. Set FFB_METRICS=0 to stop recording.
+"""
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+
+from .config import METRICS_ENABLED, METRICS_TEXTFILE
+
+# Upper bounds (seconds) of the HTTP latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Name -> (type, help) for the exposition format
+METRICS = {
+    "ffb_cache_hits_total": ("counter", "Cache lookups answered by a fresh entry."),
+    "ffb_cache_misses_total": ("counter", "Cache lookups with no usable entry."),
+    "ffb_cache_stale_total": ("counter", "Expired entries served while revalidating in the background."),
+    "ffb_cache_revalidations_total": ("counter", "Conditional requests for expired entries, by result."),
+    "ffb_cache_read_bytes_total": ("counter", "Payload bytes read from the cache."),
+    "ffb_cache_written_bytes_total": ("counter", "Payload bytes written to the cache."),
+    "ffb_http_requests_total": ("counter", "HTTP requests by endpoint, method and status."),
+    "ffb_http_request_duration_seconds": ("histogram", "HTTP request latency by endpoint."),
+}
+
+_counts: dict[tuple[str, str], float] = {}
+_lock = threading.Lock()
+_registered = False
+
+
+def _labels(labels: dict) -> str:
+    return json.dumps(labels, sort_keys=True, separators=(",", ":"))
+
+
+def inc(name: str, value: float = 1, **labels) -> None:
+    """Add `value` to the counter `name` with these labels."""
+    global _registered
+    if not METRICS_ENABLED:
+        return
+    key = (name, _labels(labels))
+    with _lock:
+        _counts[key] = _counts.get(key, 0) + value
+        if not _registered:
+            _registered = True
+            atexit.register(flush)
+
+
+def observe(name: str, seconds: float, **labels) -> None:
+    """Record one sample in the histogram `name` (cumulative buckets, sum, count)."""
+    for le in LATENCY_BUCKETS:
+        # Every bucket gets a sample, so empty ones still appear in the export
+        inc(f"{name}_bucket", 1 if seconds <= le else 0, le=str(le), **labels)
+    inc(f"{name}_bucket", le="+Inf", **labels)
+    inc(f"{name}_sum", seconds, **labels)
+    inc(f"{name}_count", **labels)
+
+
+def flush() -> None:
+    """Add the in-memory counts to the database. Best effort: a locked or
+    read-only cache must not fail the command that was being measured."""
+    from .cache.store import add_metrics
+
+    with _lock:
+        rows = [(name, labels, value) for (name, labels), value in _counts.items()]
+        _counts.clear()
+    if not rows:
+        return
+    try:
+        add_metrics(rows)
+        if METRICS_TEXTFILE:
+            write_textfile(METRICS_TEXTFILE)
+    except (sqlite3.Error, OSError):
+        pass
+
+
+def load() -> list[tuple[str, dict, float]]:
+    """Every stored sample as (name, labels, value), including this process's."""
+    flush()
+    return _stored()
+
+
+def _stored() -> list[tuple[str, dict, float]]:
+    from .cache.store import read_metrics
+
+    return [(name, json.loads(labels), value) for name, labels, value in read_metrics()]
+
+
+def _family(name: str) -> str:
+    for suffix in ("_bucket", "_sum", "_count"):
+        if name.endswith(suffix) and name[: -len(suffix)] in METRICS:
+            return name[: -len(suffix)]
+    return name
+
+
+def _sort_key(sample: tuple[str, dict, float]) -> tuple:
+    # Buckets in increasing `le`, as the format expects
+    name, labels, _ = sample
+    rest = sorted((k, v) for k, v in labels.items() if k != "le")
+    return name, rest, float(labels.get("le", 0))
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def exposition(samples: list[tuple[str, dict, float]]) -> str:
+    """Samples in the Prometheus text format, grouped by metric family."""
+    families: dict[str, list[str]] = {}
+    for name, labels, value in sorted(samples, key=_sort_key):
+        label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in sorted(labels.items()))
+        line = f"{name}{{{label_text}}} {_number(value)}" if label_text else f"{name} {_number(value)}"
+        families.setdefault(_family(name), []).append(line)
+
+    out = []
+    for family, lines in families.items():
+        kind, help_text = METRICS.get(family, ("untyped", ""))
+        out += [f"# HELP {family} {help_text}", f"# TYPE {family} {kind}", *lines]
+    return "\n".join(out) + "\n"
+
+
+def write_textfile(path: str) -> None:
+    """Write the exposition atomically, as the textfile collector expects."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(exposition(_stored()))
+    os.replace(tmp, path)
+
+
+def _quantile(buckets: list[tuple[float, float]], q: float) -> float | None:
+    """Upper bound of the bucket holding the q-quantile, from cumulative (le, count) pairs."""
+    total = buckets[-1][1] if buckets else 0
+    for le, count in buckets:
+        if count >= q * total and total:
+            return le
+    return None
+
+
+def summarize(samples: list[tuple[str, dict, float]]) -> dict:
+    """Per-namespace cache and per-endpoint HTTP figures for `ffb stats`."""
+    cache: dict[str, dict] = {}
+    http: dict[str, dict] = {}
+    buckets: dict[str, list[tuple[float, float]]] = {}
+
+    for name, labels, value in samples:
+        if name.startswith("ffb_cache_"):
+            row = cache.setdefault(labels.get("ns", ""), {
+                "namespace": labels.get("ns", ""), "hits": 0, "stale": 0, "misses": 0,
+                "revalidated": 0, "not_modified": 0, "read_bytes": 0, "written_bytes": 0,
+            })
+            field = {
+                "ffb_cache_hits_total": "hits",
+                "ffb_cache_stale_total": "stale",
+                "ffb_cache_misses_total": "misses",
+                "ffb_cache_revalidations_total": "revalidated",
+                "ffb_cache_read_bytes_total": "read_bytes",
+                "ffb_cache_written_bytes_total": "written_bytes",
+            }.get(name)
+            if field:
+                row[field] += int(value)
+            if labels.get("result") == "not_modified":
+                row["not_modified"] += int(value)
+        elif name.startswith("ffb_http_"):
+            endpoint = labels.get("endpoint", "")
+            row = http.setdefault(endpoint, {
+                "endpoint": endpoint, "requests": 0, "errors": 0, "auth_failures": 0, "seconds": 0.0,
+            })
+            if name == "ffb_http_requests_total":
+                status = labels.get("status", "")
+                row["requests"] += int(value)
+                if not status.isdigit() or int(status) >= 400:
+                    row["errors"] += int(value)
+                if status in ("401", "403"):
+                    row["auth_failures"] += int(value)
+            elif name == "ffb_http_request_duration_seconds_sum":
+                row["seconds"] += value
+            elif name == "ffb_http_request_duration_seconds_bucket":
+                buckets.setdefault(endpoint, []).append((float(labels["le"]), value))
+
+    for row in cache.values():
+        lookups = row["hits"] + row["stale"] + row["misses"] + row["revalidated"]
+        row["hit_rate"] = round(row["hits"] / lookups, 3) if lookups else None
+        row["not_modified_rate"] = (
+            round(row["not_modified"] / row["revalidated"], 3) if row["revalidated"] else None
+        )
+    for endpoint, row in http.items():
+        n = row.pop("requests")
+        seconds = row.pop("seconds")
+        ordered = sorted(buckets.get(endpoint, []))
+        row.update(
+            requests=n,
+            auth_failure_rate=round(row["auth_failures"] / n, 3) if n else None,
+            mean_seconds=round(seconds / n, 3) if n else None,
+            p50_seconds=_quantile(ordered, 0.5),
+            p95_seconds=_quantile(ordered, 0.95),
+        )
+    return {
+        "cache": sorted(cache.values(), key=lambda r: r["namespace"]),
+        "http": sorted(http.values(), key=lambda r: -r["requests"]),
+    }
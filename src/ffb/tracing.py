@@ -0,0 +1,140 @@
+"""Per-invocation timing spans, printed as JSON with `--trace` or FFB_TRACE=1.
+
+Instrumented code wraps each phase in a span and attaches what it knows:
+
+    with span("http.get", endpoint=endpoint) as s:
+        resp = ...
+        s.set(status=resp.status_code, bytes=len(resp.content))
+
+When tracing is on, one JSON object goes to stderr as the process exits:
+every span (start offset, duration, nesting depth and attributes), time per
+phase name, and totals for HTTP bytes and cache hits/misses. When it's off,
+span() hands back a shared no-op, so instrumented code costs a function call.
+"""
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+
+_enabled = False
+_t0 = 0.0
+_spans: list[dict] = []
+_lock = threading.Lock()
+_local = threading.local()
+
+
+class _Span:
+    __slots__ = ("name", "attrs", "depth", "start")
+
+    def __init__(self, name: str, attrs: dict):
+        self.name = name
+        self.attrs = attrs
+
+    def set(self, **attrs) -> None:
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> "_Span":
+        self.depth = getattr(_local, "depth", 0)
+        _local.depth = self.depth + 1
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        end = time.perf_counter()
+        _local.depth = self.depth
+        record = {
+            "name": self.name,
+            "start_ms": round((self.start - _t0) * 1000, 3),
+            "ms": round((end - self.start) * 1000, 3),
+            "depth": self.depth,
+            **self.attrs,
+        }
+        if exc_type is not None:
+            record["error"] = exc_type.__name__
+        with _lock:
+            _spans.append(record)
+        return False
+
+
+class _NullSpan:
+    def set(self, **attrs) -> None:
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NULL = _NullSpan()
+
+
+def span(name: str, **attrs) -> _Span | _NullSpan:
+    """Context manager timing one phase; a no-op unless tracing is enabled."""
+    return _Span(name, attrs) if _enabled else _NULL
+
+
+def traced(name: str):
+    """Decorator form of span() for whole functions."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def enable() -> None:
+    """Start recording; the report is written to stderr at exit."""
+    global _enabled, _t0
+    if _enabled:
+        return
+    _enabled = True
+    _t0 = time.perf_counter()
+    atexit.register(_report)
+
+
+def report() -> dict:
+    """Everything recorded so far: spans in start order, per-phase and overall totals."""
+    with _lock:
+        spans = sorted(_spans, key=lambda s: s["start_ms"])
+
+    phases: dict[str, dict] = {}
+    for s in spans:
+        phase = phases.setdefault(s["name"], {"count": 0, "ms": 0.0})
+        phase["count"] += 1
+        phase["ms"] = round(phase["ms"] + s["ms"], 3)
+
+    http = [s for s in spans if s["name"] in ("http.get", "http.post")]
+    lookups = [s for s in spans if "hit" in s]
+    return {
+        "argv": sys.argv[1:],
+        "wall_ms": round((time.perf_counter() - _t0) * 1000, 3),
+        "totals": {
+            "http_requests": len(http),
+            "http_bytes": sum(s.get("bytes", 0) for s in http),
+            "cache_hits": sum(1 for s in lookups if s["hit"]),
+            "cache_misses": sum(1 for s in lookups if not s["hit"]),
+        },
+        "phases": phases,
+        "spans": spans,
+    }
+
+
+def _report() -> None:
+    sys.stderr.write(json.dumps(report()) + "\n")
+    sys.stderr.flush()
+
+
+if os.environ.get("FFB_TRACE", "") not in ("", "0"):
+    enable()
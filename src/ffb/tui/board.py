@@ -0,0 +1,279 @@
+"""`ffb rankings --tui`: the whole board in a scrollable, sortable view."""
+
+import time
+
+import numpy as np
+
+from ..config import VALID_POSITIONS
+from .screen import BOLD, CYAN, DIM, GREEN, REVERSE, YELLOW, Screen, fit, style
+
+# (header, key, width, format, sorts descending first); the columns of
+# projections_table plus position rank, tier and bye week
+COLUMNS = [
+    ("#", "rank", 4, "d", False),
+    ("Player", "player_name", 24, "s", False),
+    ("Pos", "position", 3, "s", False),
+    ("PosRk", "pos_rank", 5, "d", False),
+    ("Team", "team", 4, "s", False),
+    ("Tier", "tier", 4, "d", False),
+    ("Pts", "points", 6, ".1f", True),
+    ("Pass Yds", "pass_yds", 8, ".0f", True),
+    ("Pass TD", "pass_tds", 7, ".1f", True),
+    ("Rush Yds", "rush_yds", 8, ".0f", True),
+    ("Rush TD", "rush_tds", 7, ".1f", True),
+    ("Rec", "receptions", 5, ".1f", True),
+    ("Rec Yds", "rec_yds", 7, ".0f", True),
+    ("Rec TD", "rec_tds", 6, ".1f", True),
+    ("Bye", "bye_week", 3, "d", False),
+]
+SPREAD_COLUMNS = [
+    ("SD", "points_sd", 5, ".1f", True),
+    ("Min", "points_min", 6, ".1f", True),
+    ("Max", "points_max", 6, ".1f", True),
+]
+_COLOURS = {"player_name": (BOLD,), "position": (CYAN,), "team": (GREEN,), "points": (YELLOW,), "rank": (DIM,)}
+
+_HELP = "↑/↓ PgUp/PgDn move · ←/→ sort column · r reverse · p position · t/1-9/0 tier · / find · n next · q quit"
+
+
+def _number(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class Board:
+    """Ranked players as columns, with every sort order computed up front.
+
+    Sorting, position and tier filters only pick an order and mask it, so
+    each is a NumPy pass over the board; rows are formatted when they
+    first scroll into view and kept.
+    """
+
+    def __init__(self, players: list[dict], spread: bool = False):
+        self.players = players
+        self.columns = COLUMNS + (SPREAD_COLUMNS if spread else [])
+        self.positions = np.array([p.get("position", "") for p in players], dtype=str)
+        self.tiers = np.array([p.get("tier") or 0 for p in players], dtype=np.int64)
+        self.names = [p.get("player_name", "").lower() for p in players]
+
+        # Players arrive in overall rank order
+        seen: dict[str, int] = {}
+        self.pos_ranks = []
+        for pos in self.positions.tolist():
+            seen[pos] = seen.get(pos, 0) + 1
+            self.pos_ranks.append(seen[pos])
+
+        # Both directions of every column; ties keep rank order
+        order = np.arange(len(players))
+        self.orders: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        for _, key, _, fmt, _ in self.columns:
+            values = self._values(key)
+            if fmt == "s":
+                sort_key = np.unique(np.array(values, dtype=str), return_inverse=True)[1].astype(float)
+            else:
+                sort_key = np.array([_number(v) for v in values])
+            # Missing values sort last either way
+            missing = np.isnan(sort_key)
+            self.orders[key] = (
+                np.lexsort((order, np.where(missing, np.inf, sort_key))),
+                np.lexsort((order, np.where(missing, np.inf, -sort_key))),
+            )
+        self.position_masks = {pos: self.positions == pos for pos in VALID_POSITIONS}
+        self._cells: dict[int, list[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def _values(self, key: str) -> list:
+        if key == "pos_rank":
+            return self.pos_ranks
+        return [p.get(key) for p in self.players]
+
+    def view(self, sort_key: str, descending: bool, position: str | None, tier: int | None) -> np.ndarray:
+        """Player positions in display order for a sort and filters."""
+        order = self.orders[sort_key][descending]
+        if position is None and tier is None:
+            return order
+        mask = self.position_masks[position] if position else np.ones(len(self), dtype=bool)
+        if tier is not None:
+            mask = mask & (self.tiers == tier)
+        return order[mask[order]]
+
+    def cells(self, i: int) -> list[str]:
+        """Player i's cells, padded to their column widths."""
+        if i not in self._cells:
+            player = self.players[i]
+            cells = []
+            for _, key, width, fmt, _ in self.columns:
+                value = self.pos_ranks[i] if key == "pos_rank" else player.get(key)
+                if fmt == "s":
+                    cells.append(fit(str(value or ""), width))
+                    continue
+                number = _number(value)
+                text = "" if np.isnan(number) else format(int(number) if fmt == "d" else number, fmt)
+                cells.append(text.rjust(width)[-width:])
+            self._cells[i] = cells
+        return self._cells[i]
+
+    def find(self, view: np.ndarray, text: str, start: int = 0) -> int | None:
+        """Position in `view` of the first player from `start` on (wrapping)
+        whose name contains `text`."""
+        text = text.lower()
+        n = len(view)
+        rows = view.tolist()
+        for k in range(n):
+            at = (start + k) % n
+            if text in self.names[rows[at]]:
+                return at
+        return None
+
+
+def _line(cells: list[str], styles: list[tuple], width: int, selected: bool = False) -> str:
+    """Cells separated by a space, stopping at the last column that fits."""
+    shown, used = [], 0
+    for cell, codes in zip(cells, styles):
+        if used + len(cell) > width:
+            break
+        shown.append((cell, codes))
+        used += len(cell) + 1
+    if selected:
+        # Reverse video over the whole row; per-cell colours would reset it
+        return style(fit(" ".join(c for c, _ in shown), width), REVERSE)
+    return " ".join(style(c, *codes) for c, codes in shown)
+
+
+def browse_rankings(
+    players: list[dict],
+    scoring: str,
+    position: str | None = None,
+    tier: int | None = None,
+    spread: bool = False,
+) -> dict:
+    """Run the board until it's quit; returns figures for the trace (frames
+    drawn and the slowest key-to-frame time in milliseconds)."""
+    board = Board(players, spread)
+    keys = [key for _, key, _, _, _ in board.columns]
+    colours = [_COLOURS.get(key, ()) for key in keys]
+    header = [fit(name, w) if fmt == "s" else name.rjust(w) for name, _, w, fmt, _ in board.columns]
+    positions = [None, *VALID_POSITIONS]
+    sort, descending = 0, False
+    cursor = top = 0
+    # The "/" prompt's text, where it started (position, tier, player) and
+    # the last text confirmed with Enter, for "n"
+    prompt: str | None = None
+    before_find: tuple = (None, None, None)
+    last_find = ""
+    miss = False
+    stats = {"frames": 0, "slowest_ms": 0.0}
+    view = board.view(keys[sort], descending, position, tier)
+
+    def refilter(selected_player: int | None) -> None:
+        """Recompute the view, keeping the selected player if it's still in it."""
+        nonlocal view, cursor
+        view = board.view(keys[sort], descending, position, tier)
+        at = np.flatnonzero(view == selected_player) if selected_player is not None else []
+        cursor = int(at[0]) if len(at) else 0
+
+    with Screen() as screen:
+        t0 = time.perf_counter()
+        while True:
+            width, height = screen.size
+            rows = max(height - 3, 1)
+            cursor = min(max(cursor, 0), max(len(view) - 1, 0))
+            # Scroll just enough to keep the cursor in the viewport
+            top = min(max(top, cursor - rows + 1), cursor)
+            top = max(min(top, len(view) - rows), 0)
+
+            sort_name = board.columns[sort][0]
+            title = (
+                f"Rankings ({scoring.upper()}) · {position or 'All'} · tier {tier or 'all'}"
+                f" · by {sort_name} {'desc' if descending else 'asc'} · {len(view)} players"
+            )
+            if prompt is not None:
+                footer = style("Find: ", BOLD) + prompt + (style("  no match", DIM) if miss else "")
+            else:
+                footer = style(fit(_HELP, width), DIM)
+            header_styles = [(BOLD, REVERSE) if k == sort else (DIM,) for k in range(len(keys))]
+            frame = [style(fit(title, width), BOLD), _line(header, header_styles, width)]
+            frame += [
+                _line(board.cells(i), colours, width, top + k == cursor)
+                for k, i in enumerate(view[top:top + rows].tolist())
+            ]
+            frame += [""] * (rows - (len(frame) - 2))
+            frame.append(footer)
+            screen.draw(frame, cursor=(height - 1, 6 + len(prompt)) if prompt is not None else None)
+            stats["frames"] += 1
+            stats["slowest_ms"] = round(max(stats["slowest_ms"], (time.perf_counter() - t0) * 1000), 3)
+
+            pressed = screen.keys()
+            t0 = time.perf_counter()
+            for key in pressed:
+                selected = int(view[cursor]) if len(view) else None
+                if prompt is not None:
+                    if key == "enter":
+                        prompt, last_find = None, prompt
+                        continue
+                    if key in ("esc", "ctrl-c"):
+                        prompt = None
+                        position, tier = before_find[:2]
+                        refilter(before_find[2])
+                        continue
+                    if key == "backspace":
+                        prompt = prompt[:-1]
+                    elif len(key) == 1 and key.isprintable():
+                        prompt += key
+                    else:
+                        continue
+                    found = board.find(view, prompt) if prompt else None
+                    if found is None and prompt and (position or tier is not None):
+                        # Not on the filtered board: look through all of it
+                        everyone = board.view(keys[sort], descending, None, None)
+                        found = board.find(everyone, prompt)
+                        if found is not None:
+                            position = tier = None
+                            view = everyone
+                    if found is not None:
+                        cursor = found
+                    miss = bool(prompt) and found is None
+                    continue
+
+                if key in ("q", "esc", "ctrl-c"):
+                    return stats
+                if key in ("up", "k"):
+                    cursor -= 1
+                elif key in ("down", "j"):
+                    cursor += 1
+                elif key == "pgup":
+                    cursor -= rows
+                elif key == "pgdn":
+                    cursor += rows
+                elif key in ("home", "g"):
+                    cursor = 0
+                elif key in ("end", "G"):
+                    cursor = len(view) - 1
+                elif key in ("left", "right"):
+                    sort = (sort + (1 if key == "right" else -1)) % len(board.columns)
+                    descending = board.columns[sort][4]
+                    refilter(selected)
+                elif key == "r":
+                    descending = not descending
+                    refilter(selected)
+                elif key == "p":
+                    position = positions[(positions.index(position) + 1) % len(positions)]
+                    tier = None
+                    refilter(selected)
+                elif key == "t":
+                    pool = board.tiers if position is None else board.tiers[board.position_masks[position]]
+                    available = sorted(set(pool.tolist()))
+                    tier = available[0] if tier is None else next((t for t in available if t > tier), None)
+                    refilter(selected)
+                elif key.isdigit() and len(key) == 1:
+                    tier = int(key) or None
+                    refilter(selected)
+                elif key == "/":
+                    prompt, before_find, miss = "", (position, tier, selected), False
+                elif key == "n" and last_find and len(view):
+                    found = board.find(view, last_find, cursor + 1)
+                    cursor = found if found is not None else cursor
@@ -0,0 +1,94 @@
+"""`ffb players find`: search-as-you-type over the player index."""
+
+import time
+
+from ..engine.search import IncrementalSearch, PlayerIndex
+from .screen import BOLD, CYAN, DIM, GREEN, REVERSE, Screen, fit, style
+
+# Rows taken by the prompt, status line, column header and key help
+_CHROME = 4
+_HELP = "type to search · ↑/↓ select · Enter info card · Esc quit"
+
+
+def _row(player: dict, width: int, selected: bool) -> str:
+    cells = [
+        fit(player["name"], max(width - 22, 10)),
+        fit(player["position"] or "", 4),
+        fit(player["team"] or "?", 4),
+        f"{player['score']:>4}%",
+    ]
+    if selected:
+        # Reverse video over the whole row; per-cell colours would reset it
+        return style(fit("> " + "  ".join(cells), width), REVERSE)
+    name, pos, team, score = cells
+    return "  " + "  ".join([style(name, BOLD), style(pos, CYAN), style(team, GREEN), score])
+
+
+def _frame(prompt: str, query: str, results: list[dict], selected: int, status: str, width: int) -> list[str]:
+    rows = [
+        style(prompt, BOLD) + query[: max(width - len(prompt) - 1, 0)],
+        style(fit(status, width), DIM),
+        style(fit("  " + "  ".join([fit("Name", max(width - 22, 10)), "Pos ", "Team", "Match"]), width), DIM),
+    ]
+    rows += [_row(p, width, i == selected) for i, p in enumerate(results)]
+    rows.append(style(fit(_HELP, width), DIM))
+    return rows
+
+
+def find_player(index: PlayerIndex, position: str | None = None, team: str | None = None) -> tuple[dict | None, dict]:
+    """Run the finder until a player is picked or it's quit.
+
+    Returns the picked player (None when quit) and figures for the trace:
+    searches run and the slowest one in milliseconds.
+    """
+    search = IncrementalSearch(index, position, team)
+    filters = " ".join(f for f in (position and f"-p {position}", team and f"-t {team}") if f)
+    prompt = f"Find player{f' ({filters})' if filters else ''}: "
+    query, shown_query, visible = "", None, 0
+    results: list[dict] = []
+    selected = 0
+    status = f"{len(index):,} players"
+    stats = {"searches": 0, "slowest_ms": 0.0}
+
+    with Screen() as screen:
+        while True:
+            width, height = screen.size
+            rows = max(height - _CHROME, 1)
+            if query != shown_query or rows != visible:
+                t0 = time.perf_counter()
+                results, scored = search.update(query, rows)
+                ms = (time.perf_counter() - t0) * 1000
+                if query != shown_query:
+                    selected = 0
+                    stats["searches"] += 1
+                    stats["slowest_ms"] = round(max(stats["slowest_ms"], ms), 3)
+                shown_query, visible = query, rows
+                if query.strip():
+                    status = f"{len(results)} shown · {scored:,} scored · {ms:.1f} ms"
+                else:
+                    status = f"{len(index):,} players"
+            selected = min(selected, max(len(results) - 1, 0))
+            screen.draw(
+                _frame(prompt, query, results, selected, status, width),
+                cursor=(0, min(len(prompt) + len(query), width - 1)),
+            )
+
+            for key in screen.keys():
+                if key in ("esc", "ctrl-c"):
+                    return None, stats
+                if key == "enter":
+                    if results:
+                        return results[selected], stats
+                elif key == "up":
+                    selected = max(selected - 1, 0)
+                elif key == "down":
+                    selected = min(selected + 1, max(len(results) - 1, 0))
+                elif key == "backspace":
+                    query = query[:-1]
+                elif key == "ctrl-u":
+                    query = ""
+                elif key == "ctrl-w":
+                    query = query.rstrip()
+                    query = query[: query.rfind(" ") + 1]
+                elif len(key) == 1 and key.isprintable():
+                    query += key
@@ -0,0 +1,132 @@
+"""Full-screen terminal drawing for the interactive commands.
+
+Screen puts the terminal in raw mode on the alternate screen and takes a
+frame as a list of rows (strings that may carry SGR colour codes). Each
+draw compares the frame with the one already shown and rewrites only the
+rows that differ, in a single write, so a keystroke that changes two rows
+costs two rows of output rather than a repaint. A resize repaints once.
+"""
+
+import codecs
+import os
+import select
+import shutil
+import sys
+import termios
+import tty
+
+# SGR attributes for style()
+BOLD = "1"
+DIM = "2"
+REVERSE = "7"
+CYAN = "36"
+GREEN = "32"
+YELLOW = "33"
+
+_SEQUENCES = {
+    "\x1b[A": "up", "\x1b[B": "down", "\x1bOA": "up", "\x1bOB": "down",
+    "\x1b[C": "right", "\x1b[D": "left", "\x1bOC": "right", "\x1bOD": "left",
+    "\x1b[5~": "pgup", "\x1b[6~": "pgdn",
+    "\x1b[H": "home", "\x1b[F": "end", "\x1b[1~": "home", "\x1b[4~": "end",
+}
+_CONTROLS = {
+    "\r": "enter", "\n": "enter", "\x7f": "backspace", "\x08": "backspace",
+    "\x1b": "esc", "\x03": "ctrl-c", "\x15": "ctrl-u", "\x17": "ctrl-w",
+}
+
+
+def style(text: str, *codes: str) -> str:
+    return f"\x1b[{';'.join(codes)}m{text}\x1b[0m" if codes else text
+
+
+def fit(text: str, width: int) -> str:
+    """`text` cut or padded to exactly `width` columns."""
+    return text[:width].ljust(width)
+
+
+def parse_keys(text: str) -> list[str]:
+    """Keys in a chunk of input: named keys ("up", "enter", ...) and typed characters."""
+    keys = []
+    i = 0
+    while i < len(text):
+        if text.startswith(("\x1b[", "\x1bO"), i):
+            j = i + 2
+            while j < len(text) and not "@" <= text[j] <= "~":
+                j += 1
+            # Unknown sequences (function keys and the like) are dropped
+            if text[i:j + 1] in _SEQUENCES:
+                keys.append(_SEQUENCES[text[i:j + 1]])
+            i = j + 1
+        else:
+            keys.append(_CONTROLS.get(text[i], text[i]))
+            i += 1
+    return keys
+
+
+class Screen:
+    """Raw-mode terminal session; use as a context manager."""
+
+    def __init__(self):
+        self._fd = sys.stdin.fileno()
+        self._out = sys.stdout
+        self._decoder = codecs.getincrementaldecoder("utf-8")("ignore")
+        self._shown: list[str] = []
+        self._size = (0, 0)
+        self._saved = None
+
+    def __enter__(self) -> "Screen":
+        self._saved = termios.tcgetattr(self._fd)
+        tty.setraw(self._fd)
+        # Alternate screen, so the shell's scrollback is left as it was
+        self._out.write("\x1b[?1049h\x1b[2J")
+        self._out.flush()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        self._out.write("\x1b[0m\x1b[?25h\x1b[?1049l")
+        self._out.flush()
+        termios.tcsetattr(self._fd, termios.TCSADRAIN, self._saved)
+        return False
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """(columns, rows)."""
+        return tuple(shutil.get_terminal_size())
+
+    def keys(self) -> list[str]:
+        """Block until input arrives, then return every key read in one go,
+        so a paste or a key held down is handled as a single update."""
+        select.select([self._fd], [], [])
+        data = os.read(self._fd, 4096)
+        if data.endswith(b"\x1b") and select.select([self._fd], [], [], 0.02)[0]:
+            # The rest of an escape sequence split across reads
+            data += os.read(self._fd, 4096)
+        return parse_keys(self._decoder.decode(data))
+
+    def draw(self, rows: list[str], cursor: tuple[int, int] | None = None) -> int:
+        """Show `rows`, rewriting only those that changed; returns how many were written.
+
+        `cursor` is the (row, column) to leave the visible cursor at;
+        without it the cursor is hidden.
+        """
+        size = self.size
+        parts = []
+        if size != self._size:
+            self._size = size
+            self._shown = []
+            parts.append("\x1b[2J")
+        changed = 0
+        for i in range(max(len(rows), len(self._shown))):
+            row = rows[i] if i < len(rows) else ""
+            if i < len(self._shown) and self._shown[i] == row:
+                continue
+            parts.append(f"\x1b[{i + 1};1H{row}\x1b[0m\x1b[K")
+            changed += 1
+        self._shown = list(rows)
+        if cursor is None:
+            parts.append("\x1b[?25l")
+        else:
+            parts.append(f"\x1b[{cursor[0] + 1};{cursor[1] + 1}H\x1b[?25h")
+        self._out.write("".join(parts))
+        self._out.flush()
+        return changed
@@ -0,0 +1,81 @@
+"""PlayerIndex.search against the linear thefuzz scan it replaced."""
+
+import random
+
+import pytest
+import synthetic
+from search import scan_search
+
+from ffb.engine.search import IncrementalSearch, PlayerIndex
+
+PLAYERS = synthetic.search_players(1)
+
+
+def _typo(r: random.Random, text: str) -> str:
+    """`text` lowercased with up to two characters dropped, added or changed."""
+    chars = list(text.lower())
+    for _ in range(r.randint(0, 2)):
+        k = r.randrange(len(chars))
+        edit = r.choice("dis")
+        if edit == "d" and len(chars) > 1:
+            del chars[k]
+        elif edit == "i":
+            chars.insert(k, r.choice("abcdefghijklmnopqrstuvwxyz"))
+        else:
+            chars[k] = r.choice("abcdefghijklmnopqrstuvwxyz")
+    return "".join(chars)
+
+
+def _queries(n: int, seed: int = 0) -> list[str]:
+    """Misspelled full names, single names and name prefixes."""
+    r = random.Random(seed)
+    queries = []
+    for _ in range(n):
+        name = r.choice(PLAYERS)["name"]
+        token = r.choice(name.split())
+        kind = r.random()
+        if kind < 0.4:
+            text = token[:r.randint(2, len(token))]
+        elif kind < 0.6:
+            text = name
+        else:
+            text = token
+        queries.append(_typo(r, text))
+    return queries
+
+
+@pytest.fixture(scope="module")
+def index() -> PlayerIndex:
+    return PlayerIndex.from_bytes(PlayerIndex.build(PLAYERS).to_bytes())
+
+
+@pytest.mark.parametrize("query", ["mwik", "hje", "bjrov", "17a"])
+def test_short_misspellings(index, query):
+    assert index.search(query) == scan_search(query, PLAYERS, None, None, 10)
+
+
+def test_matches_scan(index):
+    differ = [q for q in _queries(300) if index.search(q) != scan_search(q, PLAYERS, None, None, 10)]
+    assert differ == []
+
+
+def test_matches_scan_filtered(index):
+    r = random.Random(1)
+    for query in _queries(50, seed=1):
+        position = r.choice([None, "QB", "WR"])
+        team = r.choice([None, "KC"]) if position is None else None
+        assert index.search(query, position, team, 5) == scan_search(query, PLAYERS, position, team, 5), query
+
+
+def test_incremental_matches_search(index):
+    for typed in _queries(200, seed=2):
+        search = IncrementalSearch(index)
+        # Typed a keystroke at a time, with a slip fixed halfway through
+        half = len(typed) // 2
+        steps = [typed[:n] for n in range(1, len(typed) + 1)]
+        steps[half:half] = [typed[:half] + "x", typed[:half]]
+        for prefix in steps:
+            results, _ = search.update(prefix)
+            if len(prefix.strip()) >= 3:
+                # Shorter queries match name prefixes instead
+                assert results == index.search(prefix), prefix